@@ -0,0 +1,91 @@
+r"""
+Contention benchmark for reading the pending execution of `Job`\ s from many threads.
+
+Reader threads repeatedly query `Job.datetime` and order the jobs with
+`Job.__lt__`, while a writer thread keeps rescheduling them.
+
+Usage::
+
+    python benchmarks/bench_contention.py [--n-jobs N] [--n-readers N] [--seconds S]
+"""
+
+import argparse
+import datetime as dt
+import threading
+import time
+
+from scheduler.base.definition import JobType
+from scheduler.threading.job import Job
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+def create_jobs(n_jobs: int) -> list[Job]:
+    """Create cyclic and daily jobs with two timings each."""
+    jobs = []
+    for idx in range(n_jobs):
+        if idx % 2:
+            jobs.append(Job(JobType.CYCLIC, [dt.timedelta(seconds=idx + 1)], handle))
+        else:
+            timing = [dt.time(hour=idx % 12), dt.time(hour=idx % 12 + 12)]
+            jobs.append(Job(JobType.DAILY, timing, handle))
+    return jobs
+
+
+def run(n_jobs: int, n_readers: int, seconds: float) -> tuple[float, float]:
+    """
+    Measure the reads and reschedules per second under contention.
+
+    Returns
+    -------
+    tuple[float, float]
+        Reads per second of all reader threads and reschedules per second.
+    """
+    jobs = create_jobs(n_jobs)
+    stop = threading.Event()
+    reads = [0] * n_readers
+    writes = [0]
+
+    def reader(idx: int) -> None:
+        count = 0
+        while not stop.is_set():
+            for job in jobs:
+                _ = job.datetime
+            sorted(jobs)
+            count += 2 * len(jobs)
+        reads[idx] = count
+
+    def writer() -> None:
+        count = 0
+        while not stop.is_set():
+            ref_dt = dt.datetime.now()
+            for job in jobs:
+                job._calc_next_exec(ref_dt)  # pylint: disable=protected-access
+            count += len(jobs)
+        writes[0] = count
+
+    threads = [threading.Thread(target=reader, args=(idx,)) for idx in range(n_readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads) / seconds, writes[0] / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=1_000)
+    parser.add_argument("--n-readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    reads, writes = run(args.n_jobs, args.n_readers, args.seconds)
+    print(f"readers: {args.n_readers}, reads/s: {reads:12.0f}, reschedules/s: {writes:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
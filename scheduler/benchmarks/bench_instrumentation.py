@@ -0,0 +1,71 @@
+r"""
+Benchmark of the overhead of the execution instrumentation.
+
+`n_jobs` due |Job|\ s with an empty callback function are executed repeatedly by
+a |Scheduler| with and without `instrument`. Reported is the fastest round of
+each per execution and the difference, which is the cost of measuring and
+recording the lag and duration of an execution.
+
+Usage::
+
+    python benchmarks/bench_instrumentation.py [--n-jobs N] [--rounds R]
+"""
+
+import argparse
+import datetime as dt
+import time
+
+from scheduler import Scheduler
+from scheduler.base.definition import JobType
+from scheduler.base.stats import ExecutionStats
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+def create(n_jobs: int, instrument: bool) -> Scheduler:
+    r"""Create a |Scheduler| with `n_jobs` overdue |Job|\ s."""
+    scheduler = Scheduler(instrument=instrument, validate=False)
+    start = dt.datetime.now() - dt.timedelta(days=1)
+    spec = {"job_type": JobType.CYCLIC, "timing": dt.timedelta(seconds=1), "start": start}
+    scheduler.schedule_many({**spec, "handle": handle} for _ in range(n_jobs))
+    return scheduler
+
+
+def run(scheduler: Scheduler, n_jobs: int) -> float:
+    """Measure the seconds per execution of a call of `exec_jobs`."""
+    begin = time.perf_counter()
+    scheduler.exec_jobs(force_exec_all=True)
+    return (time.perf_counter() - begin) / n_jobs
+
+
+def record_cost(n_records: int) -> float:
+    """Measure the seconds per `ExecutionStats.record` call."""
+    stats = ExecutionStats()
+    begin = time.perf_counter()
+    for value in range(n_records):
+        stats.record(value, value, True)
+    return (time.perf_counter() - begin) / n_records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    plain_scheduler = create(args.n_jobs, False)
+    instrumented_scheduler = create(args.n_jobs, True)
+    # interleave the rounds and keep the fastest, the noise only ever adds time
+    plain = instrumented = float("inf")
+    for _ in range(args.rounds):
+        plain = min(plain, run(plain_scheduler, args.n_jobs))
+        instrumented = min(instrumented, run(instrumented_scheduler, args.n_jobs))
+    print(f"       plain: {plain * 1e6:8.3f} µs/execution")
+    print(f"instrumented: {instrumented * 1e6:8.3f} µs/execution")
+    print(f"    overhead: {(instrumented - plain) * 1e6:8.3f} µs/execution")
+    print(f"      record: {record_cost(args.n_jobs * args.rounds) * 1e6:8.3f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+r"""
+Micro-benchmark reporting the number of `Job`\ s created per second.
+
+Every run schedules a short-lived `Job` and deletes it again, as done for
+oneshot timeouts.
+
+Usage::
+
+    python benchmarks/bench_job_creation.py [--n-jobs N] [--no-validate]
+"""
+
+import argparse
+import datetime as dt
+import time
+import zoneinfo
+from typing import Callable
+
+from scheduler import Scheduler
+from scheduler.trigger import Monday, Thursday
+
+UTC = dt.timezone.utc
+BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+SCHEDULE_FUNCTIONS: dict[str, tuple[Callable[[Scheduler], object], dict[str, object]]] = {
+    "once": (lambda schedule: schedule.once(dt.timedelta(seconds=30), handle), {}),
+    "cyclic": (lambda schedule: schedule.cyclic(dt.timedelta(seconds=30), handle), {}),
+    "daily_x2": (
+        lambda schedule: schedule.daily([dt.time(hour=6), dt.time(hour=18)], handle),
+        {},
+    ),
+    "weekly_x2_tz": (
+        lambda schedule: schedule.weekly(
+            [Monday(dt.time(hour=6, tzinfo=BERLIN)), Thursday(dt.time(hour=6, tzinfo=UTC))],
+            handle,
+        ),
+        {"tzinfo": UTC},
+    ),
+}
+
+
+def jobs_per_second(kind: str, n_jobs: int, validate: bool) -> float:
+    r"""Measure how many `Job`\ s of `kind` are scheduled and deleted per second."""
+    schedule_function, scheduler_kwargs = SCHEDULE_FUNCTIONS[kind]
+    schedule = Scheduler(validate=validate, **scheduler_kwargs)  # type: ignore
+    start = time.perf_counter()
+    for _ in range(n_jobs):
+        schedule.delete_job(schedule_function(schedule))  # type: ignore
+    return n_jobs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=20_000)
+    parser.add_argument("--no-validate", action="store_true")
+    args = parser.parse_args()
+    for kind in SCHEDULE_FUNCTIONS:
+        rate = jobs_per_second(kind, args.n_jobs, not args.no_validate)
+        print(f"{kind:>12}: {rate:10.0f} jobs/s")
+
+
+if __name__ == "__main__":
+    main()
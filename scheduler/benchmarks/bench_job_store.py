@@ -0,0 +1,65 @@
+r"""
+Benchmark of the `SQLiteJobStore` write throughput and warm start.
+
+`n_jobs` daily `Job`\ s spread over a day are written to a fresh database,
+afterwards a new `Scheduler` is started on it. Only the `Job`\ s due within the
+horizon are deserialized during the warm start.
+
+Usage::
+
+    python benchmarks/bench_job_store.py [--n-jobs N] [--horizon-minutes M]
+"""
+
+import argparse
+import datetime as dt
+import os
+import tempfile
+import time
+
+from scheduler import Scheduler
+from scheduler.base.definition import JobType
+from scheduler.threading import SQLiteJobStore
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=100_000)
+    parser.add_argument("--horizon-minutes", type=float, default=15)
+    args = parser.parse_args()
+    horizon = dt.timedelta(minutes=args.horizon_minutes)
+    now = dt.datetime.now()
+    specs = [
+        {
+            "job_type": JobType.DAILY,
+            "timing": (now + dt.timedelta(days=idx / args.n_jobs)).time(),
+            "handle": handle,
+        }
+        for idx in range(args.n_jobs)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "jobs.sqlite")
+        store: SQLiteJobStore = SQLiteJobStore(path)
+        begin = time.perf_counter()
+        schedule = Scheduler(job_store=store, validate=False)
+        schedule.schedule_many(specs)
+        store.close()
+        written = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        store = SQLiteJobStore(path)
+        schedule = Scheduler(job_store=store, store_horizon=horizon)
+        started = time.perf_counter() - begin
+        n_loaded = len(schedule.jobs)
+        store.close()
+
+    print(f"write: {args.n_jobs / written:10.0f} jobs/s")
+    print(f"warm start: {started * 1000:8.1f} ms, loaded {n_loaded} of {args.n_jobs} jobs")
+
+
+if __name__ == "__main__":
+    main()
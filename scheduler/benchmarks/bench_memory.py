@@ -0,0 +1,60 @@
+"""
+Memory benchmark reporting the bytes allocated per scheduled `Job`.
+
+Usage::
+
+    python benchmarks/bench_memory.py [--n-jobs N]
+"""
+
+import argparse
+import datetime as dt
+import gc
+import tracemalloc
+from typing import Callable
+
+from scheduler import Scheduler
+from scheduler.trigger import Monday, Thursday
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+SCHEDULE_FUNCTIONS: dict[str, Callable[[Scheduler, int], object]] = {
+    "cyclic": lambda schedule, idx: schedule.cyclic(dt.timedelta(seconds=idx % 3600 + 1), handle),
+    "daily": lambda schedule, idx: schedule.daily(dt.time(hour=idx % 24), handle),
+    "daily_x2": lambda schedule, idx: schedule.daily(
+        [dt.time(hour=idx % 12), dt.time(hour=idx % 12 + 12)], handle
+    ),
+    "weekly_x2": lambda schedule, idx: schedule.weekly(
+        [Monday(dt.time(hour=idx % 24)), Thursday(dt.time(hour=idx % 24))], handle
+    ),
+    "once": lambda schedule, idx: schedule.once(dt.timedelta(seconds=idx + 1), handle),
+}
+
+
+def bytes_per_job(kind: str, n_jobs: int) -> float:
+    """Measure the traced memory of a |Scheduler| filled with `n_jobs` jobs of `kind`."""
+    schedule_function = SCHEDULE_FUNCTIONS[kind]
+    gc.collect()
+    tracemalloc.start()
+    schedule = Scheduler()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for idx in range(n_jobs):
+        schedule_function(schedule, idx)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return used / n_jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=100_000)
+    args = parser.parse_args()
+    for kind in SCHEDULE_FUNCTIONS:
+        print(f"{kind:>10}: {bytes_per_job(kind, args.n_jobs):8.1f} bytes/job")
+
+
+if __name__ == "__main__":
+    main()
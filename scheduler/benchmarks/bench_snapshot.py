@@ -0,0 +1,82 @@
+r"""
+Benchmark of restoring a `Scheduler` from a snapshot against rebuilding it.
+
+`n_jobs` daily and cyclic `Job`\ s with tags and aliases are scheduled and
+written to a snapshot. Reported are the durations of the snapshot, of the
+restore and of scheduling the same `Job`\ s again with validation.
+
+Usage::
+
+    python benchmarks/bench_snapshot.py [--n-jobs N]
+"""
+
+import argparse
+import datetime as dt
+import os
+import tempfile
+import time
+from typing import Any
+
+from scheduler import Scheduler
+from scheduler.base.definition import JobType
+
+UTC = dt.timezone.utc
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+def create_specs(n_jobs: int) -> list[dict[str, Any]]:
+    """Create the keyword arguments of half daily and half cyclic jobs."""
+    specs: list[dict[str, Any]] = []
+    for idx in range(n_jobs):
+        if idx % 2:
+            timing: Any = dt.time(hour=idx % 24, minute=idx % 60, tzinfo=UTC)
+            job_type = JobType.DAILY
+        else:
+            timing = dt.timedelta(seconds=1 + idx % 3600)
+            job_type = JobType.CYCLIC
+        specs.append(
+            {
+                "job_type": job_type,
+                "timing": timing,
+                "handle": handle,
+                "tags": {f"group-{idx % 100}"},
+                "alias": f"job-{idx}",
+            }
+        )
+    return specs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=1_000_000)
+    args = parser.parse_args()
+    specs = create_specs(args.n_jobs)
+
+    begin = time.perf_counter()
+    schedule = Scheduler(tzinfo=UTC)
+    schedule.schedule_many(specs)
+    rebuilt = time.perf_counter() - begin
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "jobs.snapshot")
+        begin = time.perf_counter()
+        schedule.snapshot(path)
+        written = time.perf_counter() - begin
+        size = os.path.getsize(path)
+        del schedule
+
+        begin = time.perf_counter()
+        restored = Scheduler.restore(path, tzinfo=UTC)
+        loaded = time.perf_counter() - begin
+
+    print(f"jobs:     {len(restored.jobs)}, {size / args.n_jobs:.1f} bytes/job")
+    print(f"rebuild:  {rebuilt:8.3f} s")
+    print(f"snapshot: {written:8.3f} s")
+    print(f"restore:  {loaded:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
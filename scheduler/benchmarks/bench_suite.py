@@ -0,0 +1,285 @@
+r"""
+Reproducible benchmark suite writing its results to JSON.
+
+Every case runs at every size of `--sizes` with the garbage collector paused
+and fixed seeds, timings are the fastest of `--repeat` runs. The cases are
+
+* ``construction``: `Job` construction per |JobType| in ns/job,
+* ``calc_next_exec``: `JobTimer.calc_next_exec` per |JobType| in ns/call, with a
+  ZoneInfo timezone for the ``@tz`` variants,
+* ``pending_timer``: `get_pending_timer` of `Job`\ s with 2, 4 and 8 timings in ns/call,
+* ``tag_query``: a query of one tag out of 100 through `select_jobs_by_tag`
+  and through the tag index of the `Scheduler` in µs/query,
+* ``memory``: traced memory of scheduled `Job`\ s per |JobType| in bytes/job.
+
+With `--baseline` the results are compared to a previous JSON file and the
+suite fails if any result got slower or bigger than `--tolerance`.
+
+Usage::
+
+    python benchmarks/bench_suite.py [--sizes 1000 100000 1000000] [--cases CASE ...]
+        [--repeat R] [--output results.json] [--baseline old.json] [--tolerance 0.1]
+"""
+
+import argparse
+import datetime as dt
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import zoneinfo
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from scheduler import Scheduler
+from scheduler.base.definition import JobType
+from scheduler.base.job_timer import JobTimer
+from scheduler.base.job_util import get_pending_timer
+from scheduler.base.scheduler import select_jobs_by_tag
+from scheduler.threading.job import Job
+from scheduler.trigger import BusinessDay, Cron, Monthly, weekday
+
+START = dt.datetime(2024, 1, 1)
+TZINFO = zoneinfo.ZoneInfo("Europe/Berlin")
+N_TAGS = 100
+TZ_JOB_TYPES = (JobType.DAILY, JobType.WEEKLY, JobType.BUSINESS_DAY)
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+def timing_element(job_type: JobType, idx: int, tzinfo: Optional[dt.tzinfo] = None) -> Any:
+    """Get a deterministic timing element of a |JobType|."""
+    if job_type is JobType.CYCLIC:
+        return dt.timedelta(seconds=idx % 3600 + 1)
+    if job_type is JobType.CRON:
+        return Cron(f"{idx % 60} */{idx % 6 + 1} * * {idx % 7}")
+    moment = dt.time(hour=idx % 24, minute=idx * 7 % 60, second=idx * 13 % 60, tzinfo=tzinfo)
+    if job_type is JobType.WEEKLY:
+        return weekday(idx % 7, moment)
+    if job_type is JobType.MONTHLY:
+        return Monthly(idx % 28 + 1, moment)
+    if job_type is JobType.BUSINESS_DAY:
+        return BusinessDay(moment)
+    return moment
+
+
+def timings(
+    job_type: JobType, n_jobs: int, n_timings: int = 1, tzinfo: Optional[dt.tzinfo] = None
+) -> list[list[Any]]:
+    """Get the timings of `n_jobs` `Job`\\ s, CYCLIC ones have a single timing."""
+    if job_type is JobType.CYCLIC:
+        n_timings = 1
+    rng = random.Random(n_jobs)
+    return [
+        [timing_element(job_type, rng.randrange(10_000), tzinfo) for _ in range(n_timings)]
+        for _ in range(n_jobs)
+    ]
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """Collect garbage and keep the garbage collector disabled in the block."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def fastest(run: Callable[[], float], repeat: int) -> float:
+    """Get the fastest of `repeat` runs."""
+    results = []
+    for _ in range(repeat):
+        with paused_gc():
+            results.append(run())
+    return min(results)
+
+
+def bench_construction(n_jobs: int, repeat: int) -> Iterator[tuple[str, float, str]]:
+    for job_type in JobType:
+        job_timings = timings(job_type, n_jobs)
+
+        def run() -> float:
+            begin = time.perf_counter_ns()
+            for timing in job_timings:
+                Job(job_type, timing, handle, start=START)
+            return (time.perf_counter_ns() - begin) / n_jobs
+
+        yield job_type.name, fastest(run, repeat), "ns/job"
+
+
+def bench_calc_next_exec(n_jobs: int, repeat: int) -> Iterator[tuple[str, float, str]]:
+    variants = [(job_type, job_type.name, None) for job_type in JobType]
+    variants += [(job_type, f"{job_type.name}@tz", TZINFO) for job_type in TZ_JOB_TYPES]
+    for job_type, variant, tzinfo in variants:
+        elements = [timing[0] for timing in timings(job_type, n_jobs, tzinfo=tzinfo)]
+        start = START.replace(tzinfo=tzinfo)
+
+        def run() -> float:
+            timers = [JobTimer(job_type, elem, start) for elem in elements]
+            begin = time.perf_counter_ns()
+            for timer in timers:
+                timer.calc_next_exec()
+            return (time.perf_counter_ns() - begin) / n_jobs
+
+        yield variant, fastest(run, repeat), "ns/call"
+
+
+def bench_pending_timer(n_jobs: int, repeat: int) -> Iterator[tuple[str, float, str]]:
+    for n_timings in (2, 4, 8):
+        timer_lists = [
+            [JobTimer(JobType.DAILY, elem, START) for elem in timing]
+            for timing in timings(JobType.DAILY, n_jobs, n_timings)
+        ]
+
+        def run() -> float:
+            begin = time.perf_counter_ns()
+            for timers in timer_lists:
+                get_pending_timer(timers)
+            return (time.perf_counter_ns() - begin) / n_jobs
+
+        yield f"x{n_timings}", fastest(run, repeat), "ns/call"
+
+
+def bench_tag_query(n_jobs: int, repeat: int) -> Iterator[tuple[str, float, str]]:
+    rng = random.Random(n_jobs)
+    specs = [
+        {
+            "job_type": JobType.CYCLIC,
+            "timing": dt.timedelta(seconds=idx % 3600 + 1),
+            "handle": handle,
+            "tags": {f"tag-{rng.randrange(N_TAGS)}", f"shard-{idx % 7}"},
+            "start": START,
+        }
+        for idx in range(n_jobs)
+    ]
+    scheduler = Scheduler(validate=False)
+    with paused_gc():
+        scheduler.schedule_many(specs)
+    jobs = scheduler.jobs
+    queries = [{f"tag-{idx}"} for idx in range(10)]
+
+    def run_scan() -> float:
+        begin = time.perf_counter_ns()
+        for tags in queries:
+            select_jobs_by_tag(jobs, tags, any_tag=False)
+        return (time.perf_counter_ns() - begin) / len(queries) / 1000
+
+    def run_index() -> float:
+        begin = time.perf_counter_ns()
+        for tags in queries:
+            scheduler.get_jobs(tags)
+        return (time.perf_counter_ns() - begin) / len(queries) / 1000
+
+    yield "select_jobs_by_tag", fastest(run_scan, repeat), "µs/query"
+    yield "get_jobs", fastest(run_index, repeat), "µs/query"
+
+
+def bench_memory(n_jobs: int, repeat: int) -> Iterator[tuple[str, float, str]]:
+    del repeat  # memory is deterministic
+    for job_type in JobType:
+        job_timings = timings(job_type, n_jobs)
+        with paused_gc():
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            scheduler = Scheduler()
+            scheduler.add_jobs(Job(job_type, timing, handle, start=START) for timing in job_timings)
+            used = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+        del scheduler
+        yield job_type.name, used / n_jobs, "bytes/job"
+
+
+CASES: dict[str, Callable[[int, int], Iterator[tuple[str, float, str]]]] = {
+    "construction": bench_construction,
+    "calc_next_exec": bench_calc_next_exec,
+    "pending_timer": bench_pending_timer,
+    "tag_query": bench_tag_query,
+    "memory": bench_memory,
+}
+
+
+def git_revision() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+def compare(results: list[dict[str, Any]], path: str, tolerance: float) -> list[str]:
+    """Get a message for every result exceeding its baseline by more than `tolerance`."""
+    with open(path, encoding="utf-8") as file:
+        baseline = {
+            (res["case"], res["variant"], res["n_jobs"]): res["value"]
+            for res in json.load(file)["results"]
+        }
+    regressions = []
+    for res in results:
+        old = baseline.get((res["case"], res["variant"], res["n_jobs"]))
+        if old and res["value"] > old * (1 + tolerance):
+            regressions.append(
+                f"{res['case']}/{res['variant']}@{res['n_jobs']}: "
+                f"{old:.1f} -> {res['value']:.1f} {res['unit']} ({res['value'] / old - 1:+.0%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = []
+    for n_jobs in args.sizes:
+        for case in args.cases:
+            for variant, value, unit in CASES[case](n_jobs, args.repeat):
+                results.append(
+                    {
+                        "case": case,
+                        "variant": variant,
+                        "n_jobs": n_jobs,
+                        "value": value,
+                        "unit": unit,
+                    }
+                )
+                print(f"{case:>14} {variant:>18} {n_jobs:>9}: {value:12.1f} {unit}", flush=True)
+
+    meta = {
+        "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"meta": meta, "results": results}, file, indent=2, ensure_ascii=False)
+    print(f"wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for msg in regressions:
+            print(f"regression {msg}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
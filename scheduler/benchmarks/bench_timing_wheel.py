@@ -0,0 +1,97 @@
+r"""
+Benchmark of the |JobQueue| heap against the |TimingWheel| for short timeouts.
+
+A steady state of `n_jobs` pending oneshot timeouts of up to a minute is
+simulated, most of them are cancelled before they fire. Reported are the
+insertions, cancellations and due queries per second.
+
+Usage::
+
+    python benchmarks/bench_timing_wheel.py [--n-jobs N] [--cancel-ratio R]
+"""
+
+import argparse
+import datetime as dt
+import random
+import time
+from typing import Callable
+
+from scheduler.base.definition import JobType
+from scheduler.base.job_queue import BaseJobQueue, JobQueue
+from scheduler.base.timing_wheel import TimingWheel
+from scheduler.threading.job import Job
+
+
+def handle() -> None:
+    """Callback function shared by all jobs."""
+
+
+QUEUES: dict[str, Callable[[], BaseJobQueue[Job]]] = {
+    "heap": JobQueue,
+    "wheel": TimingWheel,
+}
+
+
+def create_jobs(n_jobs: int, start: dt.datetime) -> list[Job]:
+    """Create oneshot timeouts between 10 milliseconds and a minute."""
+    rng = random.Random(0)
+    return [
+        Job(
+            JobType.CYCLIC,
+            [dt.timedelta(seconds=rng.uniform(0.01, 60))],
+            handle,
+            max_attempts=1,
+            start=start,
+            validate=False,
+        )
+        for _ in range(n_jobs)
+    ]
+
+
+def run(kind: str, jobs: list[Job], cancel_ratio: float, start: dt.datetime) -> dict[str, float]:
+    """Measure the operations per second of a queue."""
+    queue = QUEUES[kind]()
+    rng = random.Random(1)
+    cancelled = rng.sample(jobs, int(len(jobs) * cancel_ratio))
+
+    begin = time.perf_counter()
+    for job in jobs:
+        queue.push(job)
+    pushed = time.perf_counter()
+    for job in cancelled:
+        queue.remove(job)
+    removed = time.perf_counter()
+    n_due = 0
+    n_queries = 6000
+    for step in range(n_queries):
+        ref_dt = start + dt.timedelta(milliseconds=10 * step)
+        for job in queue.due(ref_dt):
+            queue.remove(job)
+            n_due += 1
+    queried = time.perf_counter()
+    return {
+        "push/s": len(jobs) / (pushed - begin),
+        "cancel/s": len(cancelled) / (removed - pushed),
+        "due/s": n_queries / (queried - removed),
+        "fired": n_due,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=200_000)
+    parser.add_argument("--cancel-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+    # the timing wheel is anchored to the wall clock, start after the job creation
+    start = dt.datetime.now() + dt.timedelta(minutes=10)
+    jobs = create_jobs(args.n_jobs, start)
+    for kind in QUEUES:
+        result = run(kind, jobs, args.cancel_ratio, start)
+        print(
+            f"{kind:>6}: {result['push/s']:10.0f} push/s, {result['cancel/s']:10.0f} cancel/s, "
+            f"{result['due/s']:8.0f} due/s, fired {result['fired']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+A simple in-process python scheduler library with asyncio, threading and timezone support.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from scheduler.error import SchedulerError
+from scheduler.threading.scheduler import Scheduler
+
+__all__ = ["SchedulerError", "Scheduler"]
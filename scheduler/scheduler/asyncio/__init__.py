@@ -6,6 +6,20 @@ Author: Jendrik A. Potyka, Fabian A. Preiss
 """
 
 from scheduler.asyncio.scheduler import Scheduler
+from scheduler.base.definition import Priority
+from scheduler.base.openmetrics import MetricsServer, render_openmetrics
+from scheduler.base.sqlite_store import SQLiteJobStore
+from scheduler.base.stats import ExecutionStats
+from scheduler.base.timing_wheel import TimingWheel
 from scheduler.error import SchedulerError
 
-__all__ = ["Scheduler", "SchedulerError"]
+__all__ = [
+    "ExecutionStats",
+    "MetricsServer",
+    "Priority",
+    "render_openmetrics",
+    "Scheduler",
+    "SchedulerError",
+    "SQLiteJobStore",
+    "TimingWheel",
+]
@@ -0,0 +1,89 @@
+"""
+Implementation of job for the `asyncio` scheduler.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from __future__ import annotations
+
+from collections.abc import Coroutine
+from logging import Logger
+from typing import Any, Callable
+
+from scheduler.base.job import BaseJob
+
+
+class Job(BaseJob[Callable[..., Coroutine[Any, Any, None]]]):
+    r"""
+    |AioJob| class bundling time and callback function methods.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Indicator which defines which calculations has to be used.
+    timing : TimingJobUnion
+        Desired execution time(s).
+    handle : Callable[..., Coroutine[Any, Any, None]]
+        Handle to a callback function.
+    args : tuple[Any]
+        Positional argument payload for the function handle within a |AioJob|.
+    kwargs : Optional[dict[str, Any]]
+        Keyword arguments payload for the function handle within a |AioJob|.
+    max_attempts : Optional[int]
+        Number of times the |AioJob| will be executed where ``0 <=> inf``.
+        A |AioJob| with no free attempt will be deleted.
+    tags : Optional[set[str]]
+        The tags of the |AioJob|.
+    delay : Optional[bool]
+        If ``True`` wait with the execution for the next scheduled time.
+    start : Optional[datetime.datetime]
+        Set the reference `datetime.datetime` stamp the
+        |AioJob| will be scheduled against. Default value is
+        `datetime.datetime.now()`.
+    stop : Optional[datetime.datetime]
+        Define a point in time after which a |AioJob| will be stopped
+        and deleted.
+    skip_missing : Optional[bool]
+        If ``True`` a |AioJob| will only schedule it's newest planned
+        execution and drop older ones.
+    alias : Optional[str]
+        Overwrites the function handle name in the string representation.
+        Identifies the |AioJob| within its |AioScheduler|, has to be unique.
+    tzinfo : Optional[datetime.tzinfo]
+        Set the timezone of the |AioScheduler| the |AioJob|
+        is scheduled in.
+    misfire : Optional[Misfire]
+        Catch up policy for executions missed beyond the grace window,
+        ``None`` uses the policy of the |AioScheduler|.
+    misfire_grace : Optional[datetime.timedelta]
+        Delay after which an execution counts as missed,
+        ``None`` uses the grace window of the |AioScheduler|.
+    weight : float
+        Weight of the |AioJob| in the priority of due executions, see `Priority`.
+    jitter : Optional[datetime.timedelta]
+        Shift all executions by the same offset within the window, the offset
+        is derived from the alias or else from the callback function and its
+        arguments. ``None`` disables the shift, the scheduling methods of a
+        |AioScheduler| default to its `spread`.
+    validate : bool
+        If ``False`` the `timing` is trusted and not validated.
+    """
+
+    __slots__ = ()
+
+    async def _exec(self, logger: Logger) -> bool:
+        """Execute the callback coroutine, return ``False`` if it raised an exception."""
+        coroutine = self._BaseJob__handle(*self._BaseJob__args, **self._BaseJob__kwargs)  # type: ignore
+        success = True
+        try:
+            await coroutine
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unhandled exception in `%r`!", self)
+            self._BaseJob__failed_attempts += 1  # type: ignore
+            success = False
+        self._BaseJob__attempts += 1  # type: ignore
+        self._BaseJob__publish()  # type: ignore
+        return success
+
+    def __repr__(self) -> str:
+        return "scheduler.asyncio.job.Job({})".format(", ".join(self._repr()))
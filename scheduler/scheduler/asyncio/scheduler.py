@@ -0,0 +1,1100 @@
+"""
+Implementation of a `asyncio` compatible in-process scheduler.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import itertools
+import os
+import time
+from collections.abc import Coroutine, Iterable
+from logging import Logger
+from typing import Any, Callable, Optional, Union, cast
+
+from scheduler.asyncio.job import Job
+from scheduler.base.definition import JOB_TYPE_MAPPING, JobType, Misfire, Priority
+from scheduler.base.job_queue import BaseJobQueue, JobQueue
+from scheduler.base.job_store import BaseJobStore
+from scheduler.base.job_util import sane_once_timing_type
+from scheduler.base.misfire import CatchUpLimiter, calc_next_exec, is_misfired, resolve_misfire
+from scheduler.base.priority import PriorityFunction, priority_function, rank_jobs
+from scheduler.base.scheduler import BaseScheduler, create_job_instance
+from scheduler.base.snapshot import paused_gc, read_snapshot, write_snapshot
+from scheduler.base.stats import ExecutionHook, ExecutionStats, merged_stats, timedelta_ns
+from scheduler.base.tag_index import TagIndex
+from scheduler.base.timingtype import (
+    TimingBusinessDayUnion,
+    TimingCronUnion,
+    TimingCyclic,
+    TimingDailyUnion,
+    TimingJobUnion,
+    TimingMonthlyUnion,
+    TimingOnceUnion,
+    TimingUnion,
+    TimingWeeklyUnion,
+)
+from scheduler.error import SchedulerError
+from scheduler.message import (
+    ALIAS_DUPLICATE_ERROR_MSG,
+    ALIAS_UNKNOWN_ERROR_MSG,
+    DELETE_ERROR_MSG,
+    NO_EVENT_LOOP_ERROR_MSG,
+    TZ_ERROR_MSG,
+)
+
+
+class Scheduler(BaseScheduler[Job, Callable[..., Coroutine[Any, Any, None]]]):
+    r"""
+    Implementation of an asyncio scheduler.
+
+    A single supervising task sleeps until the pending execution of the earliest
+    |AioJob| and is woken up early if a |AioJob| with an earlier execution is
+    scheduled. An idle |AioScheduler| therefore consumes no CPU time, regardless
+    of the number of scheduled |AioJob|\ s.
+
+    Parameters
+    ----------
+    loop : Optional[asyncio.selector_events.BaseSelectorEventLoop]
+        Set a AsyncIO event loop, default is the global event loop
+    tzinfo : Optional[datetime.tzinfo]
+        Set the timezone of the |AioScheduler|.
+    priority : Optional[Union[Priority, PriorityFunction]]
+        Order in which the due |AioJob|\ s are started by a function of their
+        lateness in seconds and their weight, highest first. ``None`` keeps the
+        order by datetime.
+    spread : Optional[datetime.timedelta]
+        Default `jitter` of the scheduled |AioJob|\ s with a time of day or |Weekday|
+        timing. Their executions on the same boundary are staggered deterministically
+        across the window while every |AioJob| keeps its period.
+    misfire : Misfire
+        Default catch up policy for executions missed beyond the grace window.
+    misfire_grace : Optional[datetime.timedelta]
+        Default delay after which an execution counts as missed, ``None``
+        disables the catch up handling.
+    catch_up_rate : float
+        Maximum number of missed executions run per second, ``0`` <=> inf.
+        Further missed executions stay due.
+    catch_up_burst : int
+        Maximum number of missed executions run at once, ``0`` defaults to
+        one second worth of `catch_up_rate`.
+    validate : bool
+        If ``False`` the timings of new |AioJob|\ s are trusted and not validated.
+    job_queue : Optional[BaseJobQueue]
+        Empty container for the pending |AioJob|\ s, defaults to a |JobQueue|.
+        A `TimingWheel` inserts and deletes in O(1) for many short timeouts.
+    job_store : Optional[BaseJobStore]
+        Persistent storage every change of an |AioJob| is written to, e.g. a
+        `SQLiteJobStore`. The stored |AioJob|\ s are restored after a restart.
+    store_horizon : datetime.timedelta
+        Stored |AioJob|\ s are only loaded once they are due within the horizon.
+    instrument : bool
+        If ``True`` the scheduling lag, duration and outcome of every execution
+        are recorded, see `stats` and `AioJob.stats`.
+    execution_hook : Optional[ExecutionHook]
+        Called as ``execution_hook(job, lag, duration, success)`` after every
+        execution with lag and duration in nanoseconds, implies `instrument`.
+    logger : Optional[logging.Logger]
+        A custom Logger instance.
+
+    Notes
+    -----
+    With a `job_store` the |AioJob|\ s not loaded yet are neither returned by
+    `get_jobs` nor deleted by `delete_jobs` with tags.
+    """
+
+    def __init__(
+        self,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        tzinfo: Optional[dt.tzinfo] = None,
+        priority: Optional[Union[Priority, PriorityFunction]] = None,
+        spread: Optional[dt.timedelta] = None,
+        misfire: Misfire = Misfire.ALL,
+        misfire_grace: Optional[dt.timedelta] = None,
+        catch_up_rate: float = 0,
+        catch_up_burst: int = 0,
+        validate: bool = True,
+        job_queue: Optional[BaseJobQueue[Job]] = None,
+        job_store: Optional[BaseJobStore[Job]] = None,
+        store_horizon: dt.timedelta = dt.timedelta(minutes=1),
+        instrument: bool = False,
+        execution_hook: Optional[ExecutionHook] = None,
+        logger: Optional[Logger] = None,
+    ):
+        super().__init__(logger=logger)
+        try:
+            self.__loop = loop if loop else asyncio.get_running_loop()
+        except RuntimeError:
+            raise SchedulerError(NO_EVENT_LOOP_ERROR_MSG) from None
+        self.__tzinfo = tzinfo
+        self.__instrumented = instrument or execution_hook is not None
+        self.__execution_hook = execution_hook
+        self.__retired = ExecutionStats()
+        self.__priority = None if priority is None else priority_function(priority)
+        self.__spread = spread
+        self.__misfire = misfire
+        self.__misfire_grace = misfire_grace
+        self.__catch_up = CatchUpLimiter(catch_up_rate, catch_up_burst)
+        self.__validate = validate
+        self.__jobs: BaseJobQueue[Job] = JobQueue() if job_queue is None else job_queue
+        self.__tags: TagIndex[Job] = TagIndex()
+        self.__aliases: dict[str, Job] = {}
+        self.__rescheduled: set[Job] = set()
+        self.__running: dict[Job, asyncio.Task[None]] = {}
+        self.__store = job_store
+        self.__store_horizon = store_horizon
+        self.__next_load: Optional[dt.datetime] = None
+        self.__load_stored(dt.datetime.now(self.__tzinfo))
+        self.__wakeup = asyncio.Event()
+        self.__supervisor = self.__loop.create_task(self.__supervise())
+
+    def __repr__(self) -> str:
+        return "scheduler.asyncio.scheduler.Scheduler({0}, jobs={{{1}}})".format(
+            f"tzinfo={self.__tzinfo!r}",
+            ", ".join([repr(job) for job in sorted(self.jobs)]),
+        )
+
+    async def __supervise(self) -> None:
+        r"""Sleep until the earliest |AioJob| is due and start all due |AioJob|\ s."""
+        while True:
+            self.__wakeup.clear()
+            ref_dt = dt.datetime.now(self.__tzinfo)
+            self.__load_stored(ref_dt)
+            if self.__store is not None:
+                self.__store.flush(force=False)
+            job = self.__jobs.peek()
+            if job is None:
+                if self.__next_load is None:
+                    await self.__wakeup.wait()
+                else:
+                    await self.__sleep((self.__next_load - ref_dt).total_seconds())
+                continue
+
+            delay = job.timedelta(ref_dt).total_seconds()
+            if self.__next_load is not None:
+                delay = min(delay, (self.__next_load - ref_dt).total_seconds())
+            if delay > 0:
+                await self.__sleep(delay)
+                continue
+
+            deferred = False
+            for due_job in rank_jobs(self.__jobs.due(ref_dt), ref_dt, self.__priority):
+                _, misfire_grace = resolve_misfire(due_job, self.__misfire, self.__misfire_grace)
+                misfired = is_misfired(due_job, ref_dt, misfire_grace)
+                if misfired and not self.__catch_up.acquire():
+                    deferred = True
+                    continue
+                self.__jobs.remove(due_job)
+                self.__running[due_job] = self.__loop.create_task(
+                    self.__run_job(due_job, ref_dt, misfired)
+                )
+            if deferred:
+                await self.__sleep(self.__catch_up.wait_time())
+
+    async def __sleep(self, delay: float) -> None:
+        """Sleep for `delay` seconds or until woken up by an earlier |AioJob|."""
+        timer = self.__loop.call_later(delay, self.__wakeup.set)
+        await self.__wakeup.wait()
+        timer.cancel()
+
+    async def __run_job(self, job: Job, ref_dt: dt.datetime, misfired: bool) -> None:
+        if self.__instrumented:
+            planned = job.datetime
+            start = dt.datetime.now(self.__tzinfo)
+            begin = time.perf_counter_ns()
+            success = await job._exec(logger=self._logger)  # pylint: disable=protected-access
+            duration = time.perf_counter_ns() - begin
+            self.__record(job, timedelta_ns(start - planned), duration, success)
+        else:
+            await job._exec(logger=self._logger)  # pylint: disable=protected-access
+        if self.__running.pop(job, None) is None:
+            # deleted during its execution, `delete_job` already unregistered it
+            return
+        if job in self.__rescheduled:
+            self.__rescheduled.discard(job)
+        else:
+            misfire, _ = resolve_misfire(job, self.__misfire, self.__misfire_grace)
+            calc_next_exec(job, ref_dt, misfire, misfired)
+        if job.has_attempts_remaining:
+            self.__push(job)
+            if self.__store is not None:
+                self.__store.update(job)
+        else:
+            self.__unregister(job)
+
+    def __record(self, job: Job, lag: int, duration: int, success: bool) -> None:
+        """Count an execution of the |AioJob| and pass it to the execution hook."""
+        job._record(lag, duration, success)  # pylint: disable=protected-access
+        if self.__execution_hook is not None:
+            try:
+                self.__execution_hook(job, lag, duration, success)
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("Unhandled exception in the execution hook of `%r`!", job)
+
+    def __push(self, job: Job) -> None:
+        self.__jobs.push(job)
+        if self.__jobs.peek() is job:
+            self.__wakeup.set()
+
+    def __check_aliases(self, jobs: list[Job]) -> None:
+        r"""Raise if an alias of the |AioJob|\ s is already in use."""
+        seen: set[str] = set()
+        for job in jobs:
+            if job.alias is None:
+                continue
+            if job.alias in seen or self.__aliases.get(job.alias, job) is not job:
+                raise SchedulerError(ALIAS_DUPLICATE_ERROR_MSG.format(job.alias))
+            seen.add(job.alias)
+
+    def __register(self, job: Job) -> None:
+        """Add the |AioJob| to the tag and alias indices."""
+        self.__tags.add(job)
+        if job.alias is not None:
+            self.__aliases[job.alias] = job
+
+    def __unregister(self, job: Job) -> None:
+        """Remove the |AioJob| from the tag and alias indices."""
+        self.__tags.discard(job)
+        if job.stats is not None:
+            self.__retired.merge(job.stats)
+        if job.alias is not None and self.__aliases.get(job.alias) is job:
+            del self.__aliases[job.alias]
+        self.__rescheduled.discard(job)
+        if self.__store is not None:
+            self.__store.remove(job)
+
+    def __load_stored(self, ref_dt: dt.datetime) -> None:
+        r"""Move the stored |AioJob|\ s due within the horizon to the |JobQueue|."""
+        if self.__store is None or (self.__next_load is not None and ref_dt < self.__next_load):
+            return
+        self.__next_load = ref_dt + self.__store_horizon / 2
+        jobs = []
+        for job in self.__store.load(ref_dt + self.__store_horizon, Job):
+            if job._tzinfo != self.__tzinfo:
+                raise SchedulerError(TZ_ERROR_MSG)
+            if job.alias is not None and job.alias in self.__aliases:
+                self._logger.warning("Dropped stored `%r`, its alias is in use.", job)
+                self.__store.remove(job)
+            elif not job.has_attempts_remaining:
+                self.__store.remove(job)
+            else:
+                jobs.append(job)
+        self.__jobs.extend(jobs)
+        for job in jobs:
+            self.__register(job)
+
+    async def shutdown(self, wait: bool = True) -> None:
+        r"""
+        Stop the supervising task of the |AioScheduler|.
+
+        No further |AioJob|\ s are started. The buffered writes of the job store
+        are persisted afterwards.
+
+        Parameters
+        ----------
+        wait : bool
+            Await the running |AioJob|\ s, otherwise they are cancelled.
+        """
+        self.__supervisor.cancel()
+        tasks = list(self.__running.values())
+        if not wait:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(self.__supervisor, *tasks, return_exceptions=True)
+        if self.__store is not None:
+            self.__store.flush()
+
+    def get_jobs(
+        self,
+        tags: Optional[set[str]] = None,
+        any_tag: bool = False,
+    ) -> set[Job]:
+        r"""
+        Get a set of |AioJob|\ s from the |AioScheduler| by tags.
+
+        If no tags or an empty set of tags are given defaults to returning
+        all |AioJob|\ s.
+
+        Parameters
+        ----------
+        tags : set[str]
+            Tags to filter scheduled |AioJob|\ s.
+            If no tags are given all |AioJob|\ s are returned.
+        any_tag : bool
+            False: To match a |AioJob| all tags have to match.
+            True: To match a |AioJob| at least one tag has to match.
+
+        Returns
+        -------
+        set[Job]
+            Currently scheduled |AioJob|\ s.
+        """
+        if not tags:
+            return self.jobs
+        return self.__tags.select(tags, any_tag)
+
+    def delete_job(self, job: Job) -> None:
+        """
+        Delete a |AioJob| from the |AioScheduler|.
+
+        A currently running |AioJob| is cancelled.
+
+        Parameters
+        ----------
+        job : Job
+            |AioJob| instance to delete.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if the |AioJob| of the argument is not scheduled.
+        """
+        if job in self.__running:
+            self.__running.pop(job).cancel()
+        else:
+            try:
+                self.__jobs.remove(job)
+            except KeyError:
+                raise SchedulerError(DELETE_ERROR_MSG) from None
+        self.__unregister(job)
+
+    def delete_jobs(
+        self,
+        tags: Optional[set[str]] = None,
+        any_tag: bool = False,
+    ) -> int:
+        r"""
+        Delete a set of |AioJob|\ s from the |AioScheduler| by tags.
+
+        If no tags or an empty set of tags are given defaults to the deletion
+        of all |AioJob|\ s.
+
+        Parameters
+        ----------
+        tags : Optional[set[str]]
+            Set of tags to identify target |AioJob|\ s.
+        any_tag : bool
+            False: To delete a |AioJob| all tags have to match.
+            True: To delete a |AioJob| at least one tag has to match.
+
+        Returns
+        -------
+        int
+            Number of deleted |AioJob|\ s.
+        """
+        to_delete = self.get_jobs(tags, any_tag)
+        for job in to_delete:
+            self.delete_job(job)
+        if not tags and self.__store is not None:
+            self.__store.clear()
+        return len(to_delete)
+
+    def stats(self, tags: Optional[set[str]] = None, any_tag: bool = False) -> ExecutionStats:
+        r"""
+        Get the statistics of the instrumented executions.
+
+        Without tags all executions since the creation of the |AioScheduler| are
+        included, also the ones of deleted |AioJob|\ s. The statistics are merged
+        from the |AioJob|\ s on demand, which keeps the recording of an execution
+        cheap, a |AioJob| deleted and added again is counted twice.
+
+        Parameters
+        ----------
+        tags : Optional[set[str]]
+            Only include the scheduled |AioJob|\ s matching the tags.
+        any_tag : bool
+            False: To match a |AioJob| all tags have to match.
+            True: To match a |AioJob| at least one tag has to match.
+
+        Returns
+        -------
+        ExecutionStats
+            Independent copy of the scheduling lag, duration and outcome counts.
+        """
+        if not tags:
+            return merged_stats(itertools.chain([self.__retired], (job.stats for job in self.jobs)))
+        return merged_stats(job.stats for job in self.__tags.select(tags, any_tag))
+
+    def get_job(self, alias: str) -> Optional[Job]:
+        """
+        Get an |AioJob| by its alias.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |AioJob|.
+
+        Returns
+        -------
+        Optional[Job]
+            The scheduled |AioJob| with the alias or ``None``.
+        """
+        return self.__aliases.get(alias)
+
+    def delete_job_by_alias(self, alias: str) -> Job:
+        """
+        Delete an |AioJob| from the |AioScheduler| by its alias.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |AioJob|.
+
+        Returns
+        -------
+        Job
+            The deleted |AioJob|.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if no |AioJob| with the alias is scheduled.
+        """
+        job = self.__aliases.get(alias)
+        if job is None:
+            raise SchedulerError(ALIAS_UNKNOWN_ERROR_MSG.format(alias))
+        self.delete_job(job)
+        return job
+
+    def reschedule(
+        self,
+        alias: str,
+        timing: TimingUnion,
+        *,
+        start: Optional[dt.datetime] = None,
+    ) -> Job:
+        """
+        Replace the timing of a scheduled |AioJob| in place.
+
+        The |AioJob| keeps its identity, attempts and settings, only its position
+        in the |JobQueue| is updated. An |AioJob| rescheduled during its execution
+        continues with the new timing afterwards.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |AioJob|.
+        timing : TimingUnion
+            New execution time(s) matching the |JobType| of the |AioJob|.
+        start : Optional[datetime.datetime]
+            Reference `datetime.datetime` of the new timing, defaults to now.
+
+        Returns
+        -------
+        Job
+            The rescheduled |AioJob|.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if no |AioJob| with the alias is scheduled or the timing is invalid.
+        """
+        if not isinstance(timing, list):
+            timing = [timing]
+        job = self.__aliases.get(alias)
+        if job is None:
+            raise SchedulerError(ALIAS_UNKNOWN_ERROR_MSG.format(alias))
+        job._reschedule(cast(TimingJobUnion, timing), start)  # pylint: disable=protected-access
+        if self.__store is not None:
+            self.__store.add(job)
+        if job in self.__running:
+            # keep the new pending execution once the running one finished
+            self.__rescheduled.add(job)
+        elif job.has_attempts_remaining:
+            self.__push(job)
+        else:
+            self.__jobs.remove(job)
+            self.__unregister(job)
+        return job
+
+    def cyclic(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingCyclic,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a cyclic |AioJob|.
+
+        Use a `datetime.timedelta` object as the `timing` argument
+        to define the cycle duration.
+        """
+        return self.__schedule(
+            job_type=JobType.CYCLIC,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def minutely(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a minutely |AioJob|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument, only the seconds are taken into account.
+        """
+        return self.__schedule(
+            job_type=JobType.MINUTELY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def hourly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule an hourly |AioJob|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument, only the minutes and seconds are taken
+        into account.
+        """
+        return self.__schedule(
+            job_type=JobType.HOURLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def daily(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a daily |AioJob|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.DAILY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def weekly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingWeeklyUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a weekly |AioJob|.
+
+        Use a |Weekday| object or a `list` of |Weekday| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.WEEKLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def cron(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingCronUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a |AioJob| by cron expressions.
+
+        Use a |Cron| object or a `list` of |Cron| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.CRON,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def monthly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingMonthlyUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a monthly |AioJob|.
+
+        Use a |Monthly| object or a `list` of |Monthly| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.MONTHLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def business_day(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingBusinessDayUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a |AioJob| on business days.
+
+        Use a |BusinessDay| object or a `list` of |BusinessDay| objects
+        as the `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.BUSINESS_DAY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def once(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingOnceUnion,
+        handle: Callable[..., Coroutine[Any, Any, None]],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        weight: float = 1.0,
+    ) -> Job:
+        r"""
+        Schedule a oneshot |AioJob|.
+
+        Use a `datetime.datetime` object for an absolute point in time,
+        a `datetime.timedelta` object relative to now or a `datetime.time`,
+        |Weekday|, |Cron|, |Monthly| or |BusinessDay| object for the next
+        matching occurrence.
+        """
+        sane_once_timing_type(timing)
+
+        if isinstance(timing, dt.datetime):
+            return self.__schedule(
+                job_type=JobType.CYCLIC,
+                timing=dt.timedelta(),
+                handle=handle,
+                args=args,
+                kwargs=kwargs,
+                max_attempts=1,
+                tags=tags,
+                alias=alias,
+                delay=False,
+                start=timing,
+                weight=weight,
+                jitter=dt.timedelta(),
+            )
+        return self.__schedule(
+            job_type=JOB_TYPE_MAPPING[type(timing)],
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=1,
+            tags=tags,
+            alias=alias,
+            weight=weight,
+            jitter=dt.timedelta(),
+        )
+
+    def add_jobs(self, jobs: Iterable[Job]) -> None:
+        r"""
+        Add already created |AioJob|\ s to the |AioScheduler|.
+
+        All |AioJob|\ s are checked before the first one is added, the |JobQueue|
+        is rebuilt once instead of inserting every |AioJob| separately.
+
+        Parameters
+        ----------
+        jobs : Iterable[Job]
+            |AioJob|\ s with the timezone of the |AioScheduler|.
+
+        Raises
+        ------
+        SchedulerError
+            If the timezone of an |AioJob| differs from the |AioScheduler|, its
+            alias is already in use or it can't be stored. No |AioJob| is added then.
+        """
+        jobs = list(jobs)
+        for job in jobs:
+            if job._tzinfo != self.__tzinfo:
+                raise SchedulerError(TZ_ERROR_MSG)
+        jobs = [job for job in jobs if job.has_attempts_remaining]
+        self.__check_aliases(jobs)
+        if self.__store is not None:
+            self.__store.add_many(jobs)
+        earliest = self.__jobs.peek()
+        self.__jobs.extend(jobs)
+        for job in jobs:
+            self.__register(job)
+        if self.__jobs.peek() is not earliest:
+            self.__wakeup.set()
+
+    def schedule_many(self, specs: Iterable[dict[str, Any]]) -> list[Job]:
+        r"""
+        Schedule many |AioJob|\ s at once.
+
+        Parameters
+        ----------
+        specs : Iterable[dict[str, Any]]
+            Keyword arguments of an |AioJob| for every |AioJob| to schedule, e.g.
+            ``{"job_type": JobType.DAILY, "timing": dt.time(hour=6), "handle": foo}``.
+            A single `timing` is wrapped in a list, the timezone of the
+            |AioScheduler| is added. Without a `start` all timers are calculated
+            against the same reference time.
+
+        Returns
+        -------
+        list[Job]
+            The created |AioJob|\ s in the order of `specs`.
+        """
+        start = dt.datetime.now(self.__tzinfo)
+        jobs = [self.__create_job(**{"start": start, **spec}) for spec in specs]
+        self.add_jobs(jobs)
+        return jobs
+
+    def __create_job(self, *, tags: Optional[Iterable[str]] = None, **kwargs: Any) -> Job:
+        """Encapsulate the |AioJob| and add the |AioScheduler|'s timezone and spread."""
+        if kwargs.get("jitter") is None and kwargs["job_type"] != JobType.CYCLIC:
+            kwargs["jitter"] = self.__spread
+        return create_job_instance(
+            Job,
+            tzinfo=self.__tzinfo,
+            tags=set(tags) if tags else None,
+            validate=self.__validate,
+            **kwargs,
+        )
+
+    def __schedule(self, **kwargs: Any) -> Job:
+        """Create an |AioJob| and add it to the |JobQueue|."""
+        job = self.__create_job(**kwargs)
+        if job.has_attempts_remaining:
+            self.__check_aliases([job])
+            if self.__store is not None:
+                self.__store.add(job)
+            self.__push(job)
+            self.__register(job)
+        return job
+
+    def snapshot(self, path: Union[str, os.PathLike[str]]) -> int:
+        r"""
+        Write all |AioJob|\ s to a compact binary snapshot file.
+
+        Timing elements, tags and aliases are interned, handles are stored by
+        their import path. Use `restore` to create a |AioScheduler| from the file.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of the snapshot file, an existing file is replaced.
+
+        Returns
+        -------
+        int
+            Number of written |AioJob|\ s.
+
+        Raises
+        ------
+        SchedulerError
+            If a handle is not importable by its qualified name, the args or
+            kwargs are not picklable or a timezone is not supported.
+        """
+        jobs = self.jobs
+        return write_snapshot(path, jobs)
+
+    @classmethod
+    def restore(cls, path: Union[str, os.PathLike[str]], **kwargs: Any) -> Scheduler:
+        r"""
+        Create a |AioScheduler| with the |AioJob|\ s of a snapshot file.
+
+        The file is memory mapped, the |AioJob|\ s continue with their
+        persisted attempts and pending executions without being validated
+        and calculated again.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of a file written by `snapshot`.
+        **kwargs
+            Keyword arguments of the |AioScheduler|, the timezone has to match
+            the snapshot.
+
+        Returns
+        -------
+        Scheduler
+            The restored |AioScheduler|.
+
+        Raises
+        ------
+        SchedulerError
+            If the file is not a compatible snapshot, a handle can't be imported
+            or the timezones differ.
+        """
+        scheduler = cls(**kwargs)
+        with paused_gc():
+            scheduler.add_jobs(read_snapshot(path, Job))
+        return scheduler
+
+    @property
+    def jobs(self) -> set[Job]:
+        r"""
+        Get the set of all |AioJob|\ s.
+
+        Returns
+        -------
+        set[Job]
+            Currently scheduled |AioJob|\ s.
+        """
+        return self.__jobs.jobs | set(self.__running)
+
+    @property
+    def due_jobs(self) -> list[Job]:
+        r"""
+        Get the |AioJob|\ s which are due but not running yet.
+
+        Returns
+        -------
+        list[Job]
+            Overdue |AioJob|\ s ordered by their pending execution.
+        """
+        return self.__jobs.due(dt.datetime.now(self.__tzinfo))
+
+    @property
+    def executing_jobs(self) -> set[Job]:
+        r"""
+        Get the |AioJob|\ s which are currently running.
+
+        Returns
+        -------
+        set[Job]
+            Running |AioJob|\ s.
+        """
+        return set(self.__running)
+
+    @property
+    def max_in_flight(self) -> int:
+        r"""
+        Get the maximum number of concurrently running |AioJob|\ s.
+
+        Returns
+        -------
+        int
+            Always ``0``, the |AioJob|\ s are not limited.
+        """
+        return 0
@@ -8,20 +8,29 @@ import datetime as dt
 from enum import Enum, auto
 
 from scheduler.base.timingtype import (
+    _TimingBusinessDayList,
+    _TimingCronList,
     _TimingCyclicList,
     _TimingDailyList,
+    _TimingMonthlyList,
     _TimingWeeklyList,
 )
 from scheduler.message import (
+    BUSINESS_DAY_TYPE_ERROR_MSG,
+    CRON_TYPE_ERROR_MSG,
     CYCLIC_TYPE_ERROR_MSG,
     DAILY_TYPE_ERROR_MSG,
     HOURLY_TYPE_ERROR_MSG,
     MINUTELY_TYPE_ERROR_MSG,
+    MONTHLY_TYPE_ERROR_MSG,
     WEEKLY_TYPE_ERROR_MSG,
 )
 from scheduler.trigger import (
+    BusinessDay,
+    Cron,
     Friday,
     Monday,
+    Monthly,
     Saturday,
     Sunday,
     Thursday,
@@ -38,6 +47,62 @@ class JobType(Enum):
     HOURLY = auto()
     DAILY = auto()
     WEEKLY = auto()
+    CRON = auto()
+    MONTHLY = auto()
+    BUSINESS_DAY = auto()
+
+
+class Backpressure(Enum):
+    r"""
+    Indicate how a |Scheduler| handles due |Job|\ s if no worker is available.
+
+    QUEUE
+        Keep the |Job| due, every missed execution is run once a worker is free.
+    SKIP
+        Drop the execution and schedule the |Job| for its next execution in future.
+    COALESCE
+        Keep the |Job| due, but merge all of its missed executions into a single one.
+    """
+
+    QUEUE = auto()
+    SKIP = auto()
+    COALESCE = auto()
+
+
+class Misfire(Enum):
+    """
+    Indicate how a |BaseJob| catches up with executions missed beyond its grace window.
+
+    ALL
+        Run every missed execution.
+    ONCE
+        Run a single execution for all missed ones and restart from the current time.
+    LATEST
+        Run only the latest missed execution and keep the original phase.
+    """
+
+    ALL = auto()
+    ONCE = auto()
+    LATEST = auto()
+
+
+class Priority(Enum):
+    r"""
+    Indicate how a scheduler ranks due |BaseJob|\ s by their weight and lateness.
+
+    The lateness is measured in minutes since the pending execution.
+
+    LINEAR
+        ``weight * (1 + lateness)``, late |BaseJob|\ s catch up steadily.
+    EXPONENTIAL
+        ``weight * 2 ** lateness``, lateness outweighs the weight quickly.
+    CONSTANT
+        ``weight``, the lateness only breaks ties.
+    """
+
+    LINEAR = auto()
+    EXPONENTIAL = auto()
+    CONSTANT = auto()
 
 
 JOB_TYPE_MAPPING = {
@@ -50,6 +115,9 @@ JOB_TYPE_MAPPING = {
     Friday: JobType.WEEKLY,
     Saturday: JobType.WEEKLY,
     Sunday: JobType.WEEKLY,
+    Cron: JobType.CRON,
+    Monthly: JobType.MONTHLY,
+    BusinessDay: JobType.BUSINESS_DAY,
 }
 
 JOB_TIMING_TYPE_MAPPING = {
@@ -73,4 +141,16 @@ JOB_TIMING_TYPE_MAPPING = {
         "type": _TimingWeeklyList,
         "err": WEEKLY_TYPE_ERROR_MSG,
     },
+    JobType.CRON: {
+        "type": _TimingCronList,
+        "err": CRON_TYPE_ERROR_MSG,
+    },
+    JobType.MONTHLY: {
+        "type": _TimingMonthlyList,
+        "err": MONTHLY_TYPE_ERROR_MSG,
+    },
+    JobType.BUSINESS_DAY: {
+        "type": _TimingBusinessDayList,
+        "err": BUSINESS_DAY_TYPE_ERROR_MSG,
+    },
 }
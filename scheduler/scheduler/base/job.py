@@ -3,50 +3,94 @@
 from __future__ import annotations
 
 import datetime as dt
+import heapq
+import itertools
 import warnings
 from abc import ABC, abstractmethod
-from logging import Logger
+from collections.abc import Iterator
 from typing import Any, Callable, Generic, Optional, TypeVar, cast
 
-from scheduler.base.definition import JobType
+from scheduler.base.definition import JobType, Misfire
 from scheduler.base.job_timer import JobTimer
 from scheduler.base.job_util import (
-    check_duplicate_effective_timings,
-    check_timing_tzinfo,
     get_pending_timer,
+    jitter_offset,
+    jitter_seed,
     prettify_timedelta,
-    sane_timing_types,
     set_start_check_stop_tzinfo,
     standardize_timing_format,
+    validate_timing,
 )
+from scheduler.base.stats import ExecutionStats
 from scheduler.base.timingtype import TimingJobUnion
 
 T = TypeVar("T", bound=Callable[[], Any])
+_BaseJobT = TypeVar("_BaseJobT", bound="BaseJob[Any]")
+
+# attempts, failed attempts, skipped executions and the pending datetime of every timer
+JobState = tuple[int, int, int, tuple[dt.datetime, ...]]
+
+# shared by all jobs without tags
+_EMPTY_TAGS: frozenset[str] = frozenset()
 
 
 class BaseJob(ABC, Generic[T]):
     """Abstract definition basic interface for a job class."""
 
+    __slots__ = (
+        "__type",
+        "__timing",
+        "__handle",
+        "__args",
+        "__kwargs",
+        "__max_attempts",
+        "__tags",
+        "__delay",
+        "__start",
+        "__stop",
+        "__skip_missing",
+        "__alias",
+        "__tzinfo",
+        "__misfire",
+        "__misfire_grace",
+        "__weight",
+        "__jitter",
+        "__mark_delete",
+        "__attempts",
+        "__failed_attempts",
+        "__skipped_executions",
+        "__pending_timer",
+        "__timers",
+        "__next_exec",
+        "__stats",
+    )
+
     __type: JobType
     __timing: TimingJobUnion
     __handle: T
     __args: tuple[Any, ...]
     __kwargs: dict[str, Any]
     __max_attempts: int
-    __tags: set[str]
+    __tags: frozenset[str]
     __delay: bool
     __start: Optional[dt.datetime]
     __stop: Optional[dt.datetime]
     __skip_missing: bool
     __alias: Optional[str]
     __tzinfo: Optional[dt.tzinfo]
-    __logger: Logger
+    __misfire: Optional[Misfire]
+    __misfire_grace: Optional[dt.timedelta]
+    __weight: float
+    __jitter: Optional[dt.timedelta]
 
     __mark_delete: bool
     __attempts: int
     __failed_attempts: int
+    __skipped_executions: int
     __pending_timer: JobTimer
     __timers: list[JobTimer]
+    __next_exec: dt.datetime
+    __stats: Optional[ExecutionStats]
 
     def __init__(
         self,
@@ -64,12 +108,16 @@ class BaseJob(ABC, Generic[T]):
         skip_missing: bool = False,
         alias: Optional[str] = None,
         tzinfo: Optional[dt.tzinfo] = None,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+        validate: bool = True,
     ):
         timing = standardize_timing_format(job_type, timing)
 
-        sane_timing_types(job_type, timing)
-        check_timing_tzinfo(job_type, timing, tzinfo)
-        check_duplicate_effective_timings(job_type, timing, tzinfo)
+        if validate:
+            validate_timing(job_type, timing, tzinfo)
 
         self.__start = set_start_check_stop_tzinfo(start, stop, tzinfo)
 
@@ -80,41 +128,309 @@ class BaseJob(ABC, Generic[T]):
         self.__args = () if args is None else args
         self.__kwargs = {} if kwargs is None else kwargs.copy()
         self.__max_attempts = max_attempts
-        self.__tags = set() if tags is None else tags.copy()
+        self.__tags = _EMPTY_TAGS if not tags else frozenset(tags)
         self.__delay = delay
         self.__stop = stop
         self.__skip_missing = skip_missing
         self.__alias = alias
         self.__tzinfo = tzinfo
+        self.__misfire = misfire
+        self.__misfire_grace = misfire_grace
+        self.__weight = weight
+        self.__jitter = jitter
 
         # self.__mark_delete will be set to True if the new Timer would be in future
         # relativ to the self.__stop variable
         self.__mark_delete = False
         self.__attempts = 0
         self.__failed_attempts = 0
+        self.__skipped_executions = 0
+        self.__stats = None
 
         # create JobTimers
-        self.__timers = [JobTimer(job_type, tim, self.__start, skip_missing) for tim in timing]
+        offset = self.__offset()
+        self.__timers = [
+            JobTimer(job_type, tim, self.__start, skip_missing, offset) for tim in timing
+        ]
         self.__pending_timer = get_pending_timer(self.__timers)
 
         if self.__stop is not None:
             if self.__pending_timer.datetime > self.__stop:
                 self.__mark_delete = True
+        self.__publish()
 
     def __lt__(self, other: BaseJob[T]) -> bool:
-        return self.datetime < other.datetime
+        return self.__next_exec < other.__next_exec
 
-    def _calc_next_exec(self, ref_dt: dt.datetime) -> None:
+    def __offset(self) -> dt.timedelta:
+        r"""Get the deterministic shift of the |JobTimer|\ s within the jitter."""
+        if not self.__jitter:
+            return dt.timedelta()
+        seed = jitter_seed(self.__handle, self.__args, self.__kwargs, self.__alias)
+        return jitter_offset(self.__type, self.__timing, self.__jitter, seed)
 
-        if self.__skip_missing:
+    def __publish(self) -> None:
+        """
+        Publish the pending execution `datetime.datetime` with a single assignment.
+
+        Readers of `datetime` and `timedelta` never take a lock, they see either
+        the previous or the new immutable value, but never an intermediate state.
+        Every change of the pending |JobTimer| or of the attempts has to be
+        followed by a call.
+        """
+        if not self.__delay and self.__attempts == 0:
+            self.__next_exec = cast(dt.datetime, self.__start)
+        else:
+            self.__next_exec = self.__pending_timer.datetime
+
+    def _calc_next_exec(
+        self, ref_dt: dt.datetime, skip_missing: Optional[bool] = None, executed: bool = True
+    ) -> int:
+        """
+        Calculate the next estimated execution `datetime.datetime` of the `BaseJob`.
+
+        Parameters
+        ----------
+        ref_dt : datetime.datetime
+            Reference time stamp to which the |BaseJob| calculates
+            it's next execution.
+        skip_missing : Optional[bool]
+            Overwrite the `skip_missing` setting of the |BaseJob| for this call.
+        executed : bool
+            If ``False`` the pending execution was dropped instead of executed,
+            it is counted as skipped as well.
+
+        Returns
+        -------
+        int
+            Number of executions skipped by this call.
+        """
+        if skip_missing is None:
+            skip_missing = self.__skip_missing
+        skipped = 0 if executed else 1
+        if skip_missing:
             for timer in self.__timers:
-                if (timer.datetime - ref_dt).total_seconds() <= 0:
-                    timer.calc_next_exec(ref_dt)
+                if timer.datetime <= ref_dt:
+                    skipped += timer.calc_next_exec(ref_dt, skip=True)
+                    # the pending execution of every other overdue timer is dropped as well
+                    if timer is not self.__pending_timer:
+                        skipped += 1
         else:
             self.__pending_timer.calc_next_exec(ref_dt)
+        self.__skipped_executions += skipped
         self.__pending_timer = get_pending_timer(self.__timers)
         if self.__stop is not None and self.__pending_timer.datetime > self.__stop:
             self.__mark_delete = True
+        self.__publish()
+        return skipped
+
+    def _skip_to(self, ref_dt: dt.datetime) -> int:
+        """
+        Drop all executions earlier than `ref_dt` while keeping the phase of the timers.
+
+        Returns
+        -------
+        int
+            Number of skipped executions.
+        """
+        skipped = 0
+        for timer in self.__timers:
+            if timer.datetime < ref_dt:
+                skipped += timer.skip_to(ref_dt)
+        self.__skipped_executions += skipped
+        self.__pending_timer = get_pending_timer(self.__timers)
+        if self.__stop is not None and self.__pending_timer.datetime > self.__stop:
+            self.__mark_delete = True
+        self.__publish()
+        return skipped
+
+    def _reschedule(self, timing: TimingJobUnion, start: Optional[dt.datetime] = None) -> None:
+        r"""
+        Replace the timing of the |BaseJob| in place.
+
+        The |JobTimer|\ s are recreated against `start`, the |JobType|, the
+        attempts and all other settings are kept.
+
+        Parameters
+        ----------
+        timing : TimingJobUnion
+            Desired execution time(s) matching the |JobType|.
+        start : Optional[datetime.datetime]
+            Reference `datetime.datetime` of the new timers, defaults to now.
+        """
+        timing = standardize_timing_format(self.__type, timing)
+        validate_timing(self.__type, timing, self.__tzinfo)
+        self.__start = set_start_check_stop_tzinfo(start, self.__stop, self.__tzinfo)
+        self.__timing = timing
+        offset = self.__offset()
+        self.__timers = [
+            JobTimer(self.__type, tim, self.__start, self.__skip_missing, offset) for tim in timing
+        ]
+        self.__pending_timer = get_pending_timer(self.__timers)
+        self.__mark_delete = (
+            self.__stop is not None and self.__pending_timer.datetime > self.__stop
+        )
+        self.__publish()
+
+    def _definition(self) -> dict[str, Any]:
+        """
+        Get the keyword arguments recreating the |BaseJob| in its initial state.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments of the constructor.
+        """
+        return {
+            "job_type": self.__type,
+            "timing": list(self.__timing),
+            "handle": self.__handle,
+            "args": self.__args,
+            "kwargs": self.__kwargs,
+            "max_attempts": self.__max_attempts,
+            "tags": set(self.__tags) or None,
+            "delay": self.__delay,
+            "start": self.__start,
+            "stop": self.__stop,
+            "skip_missing": self.__skip_missing,
+            "alias": self.__alias,
+            "tzinfo": self.__tzinfo,
+            "misfire": self.__misfire,
+            "misfire_grace": self.__misfire_grace,
+            "weight": self.__weight,
+            "jitter": self.__jitter,
+        }
+
+    def _state(self) -> JobState:
+        """
+        Get the execution state of the |BaseJob|.
+
+        Returns
+        -------
+        JobState
+            Attempts, failed attempts, skipped executions and the pending
+            `datetime.datetime` of every |JobTimer|.
+        """
+        datetimes = tuple(timer.datetime for timer in self.__timers)
+        return self.__attempts, self.__failed_attempts, self.__skipped_executions, datetimes
+
+    @classmethod
+    def _restored(cls: type[_BaseJobT], definition: dict[str, Any], state: JobState) -> _BaseJobT:
+        r"""
+        Recreate a |BaseJob| from `_definition` and `_state` of a persisted |BaseJob|.
+
+        The constructor is bypassed, the definition is trusted and the
+        |JobTimer|\ s continue from their persisted pending executions
+        instead of being calculated again.
+
+        Parameters
+        ----------
+        definition : dict[str, Any]
+            Keyword arguments of the constructor as returned by `_definition`.
+        state : JobState
+            State as returned by `_state`.
+
+        Returns
+        -------
+        BaseJob
+            The recreated |BaseJob|.
+        """
+        job = cls.__new__(cls)
+        job_type = job.__type = definition["job_type"]
+        timing = job.__timing = definition["timing"]
+        job.__handle = definition["handle"]
+        job.__args = definition["args"]
+        job.__kwargs = definition["kwargs"]
+        job.__max_attempts = definition["max_attempts"]
+        tags = definition["tags"]
+        job.__tags = _EMPTY_TAGS if not tags else frozenset(tags)
+        job.__delay = definition["delay"]
+        job.__start = definition["start"]
+        stop = job.__stop = definition["stop"]
+        skip_missing = job.__skip_missing = definition["skip_missing"]
+        job.__alias = definition["alias"]
+        job.__tzinfo = definition["tzinfo"]
+        job.__misfire = definition["misfire"]
+        job.__misfire_grace = definition["misfire_grace"]
+        job.__weight = definition.get("weight", 1.0)
+        job.__jitter = definition.get("jitter")
+        job.__attempts, job.__failed_attempts, job.__skipped_executions, datetimes = state
+        offset = job.__offset()
+        timers = job.__timers = [
+            JobTimer.restored(job_type, tim, next_exec, skip_missing, offset)
+            for tim, next_exec in zip(timing, datetimes)
+        ]
+        pending_timer = job.__pending_timer = get_pending_timer(timers)
+        job.__mark_delete = stop is not None and pending_timer.datetime > stop
+        job.__stats = None
+        job.__publish()
+        return job
+
+    def _record(self, lag: int, duration: int, success: bool) -> None:
+        """
+        Count an execution in the |ExecutionStats| of the |BaseJob|.
+
+        Parameters
+        ----------
+        lag : int
+            Actual start minus planned `datetime.datetime` in nanoseconds.
+        duration : int
+            Run time of the callback function in nanoseconds.
+        success : bool
+            ``False`` if the callback function raised an exception.
+        """
+        stats = self.__stats
+        if stats is None:
+            stats = self.__stats = ExecutionStats()
+        stats.record(lag, duration, success)
+
+    def occurrences(self, start: dt.datetime, end: dt.datetime) -> Iterator[dt.datetime]:
+        r"""
+        Lazily generate the planned executions of the |BaseJob| within `[start, end)`.
+
+        The executions of every |JobTimer| are calculated in closed form and merged
+        in chronological order. The `stop` and `max_attempts` limits of the |BaseJob|
+        are respected, the |BaseJob| itself is not modified.
+
+        Parameters
+        ----------
+        start : datetime.datetime
+            Inclusive lower bound.
+        end : datetime.datetime
+            Exclusive upper bound.
+
+        Returns
+        -------
+        Iterator[datetime.datetime]
+            Ascending planned executions.
+        """
+        if not self.has_attempts_remaining:
+            return iter(())
+
+        initial = self._initial
+        remaining = self.__max_attempts - self.__attempts if self.__max_attempts else 0
+        # with limited attempts every execution from now on has to be counted
+        lower = min(start, self.datetime) if remaining else start
+
+        streams = []
+        for timer in self.__timers:
+            timer_start = lower
+            if initial and timer is self.__pending_timer:
+                # the first execution at `start` replaces the pending one of the timer
+                timer_start = max(lower, timer.datetime + dt.timedelta(microseconds=1))
+            streams.append(timer.occurrences(timer_start, end))
+        merged: Iterator[dt.datetime] = heapq.merge(*streams)
+        if initial and lower <= cast(dt.datetime, self.__start) < end:
+            merged = itertools.chain((cast(dt.datetime, self.__start),), merged)
+
+        if self.__stop is not None:
+            stop = self.__stop
+            merged = itertools.takewhile(lambda exec_dt: exec_dt <= stop, merged)
+        if remaining:
+            merged = itertools.islice(merged, remaining)
+        if lower < start:
+            merged = (exec_dt for exec_dt in merged if exec_dt >= start)
+        return merged
 
     def _repr(self) -> tuple[str, ...]:
         return tuple(
@@ -168,16 +484,12 @@ class BaseJob(ABC, Generic[T]):
 
         if dt_stamp is None:
             dt_stamp = dt.datetime.now(self.__tzinfo)
-        if not self.__delay and self.__attempts == 0:
-            return cast(dt.datetime, self.__start) - dt_stamp
-        return self.__pending_timer.timedelta(dt_stamp)
+        return self.__next_exec - dt_stamp
 
     @property
     def datetime(self) -> dt.datetime:
 
-        if not self.__delay and self.__attempts == 0:
-            return cast(dt.datetime, self.__start)
-        return self.__pending_timer.datetime
+        return self.__next_exec
 
     @property
     def type(self) -> JobType:
@@ -214,7 +526,7 @@ class BaseJob(ABC, Generic[T]):
     @property
     def tags(self) -> set[str]:
 
-        return self.__tags.copy()
+        return set(self.__tags)
 
     @property
     def delay(self) -> bool:
@@ -249,6 +561,54 @@ class BaseJob(ABC, Generic[T]):
 
         return self.__alias
 
+    @property
+    def misfire(self) -> Optional[Misfire]:
+        """
+        Get the catch up policy for missed executions.
+
+        Returns
+        -------
+        Optional[Misfire]
+            Policy of the |BaseJob|, ``None`` defers to the scheduler.
+        """
+        return self.__misfire
+
+    @property
+    def misfire_grace(self) -> Optional[dt.timedelta]:
+        """
+        Get the delay after which an execution counts as missed.
+
+        Returns
+        -------
+        Optional[datetime.timedelta]
+            Grace window of the |BaseJob|, ``None`` defers to the scheduler.
+        """
+        return self.__misfire_grace
+
+    @property
+    def weight(self) -> float:
+        """
+        Get the weight of the |BaseJob| in the priority of due executions.
+
+        Returns
+        -------
+        float
+            Weight of the |BaseJob|, ``1.0`` by default.
+        """
+        return self.__weight
+
+    @property
+    def jitter(self) -> Optional[dt.timedelta]:
+        """
+        Get the window of the deterministic shift of the executions.
+
+        Returns
+        -------
+        Optional[datetime.timedelta]
+            Jitter of the |BaseJob|, ``None`` if the executions are not shifted.
+        """
+        return self.__jitter
+
     @property
     def tzinfo(self) -> Optional[dt.tzinfo]:
 
@@ -259,6 +619,21 @@ class BaseJob(ABC, Generic[T]):
 
         return self.__tzinfo
 
+    @property
+    def _tags(self) -> frozenset[str]:
+
+        return self.__tags
+
+    @property
+    def _timers(self) -> list[JobTimer]:
+
+        return self.__timers.copy()
+
+    @property
+    def _initial(self) -> bool:
+        """Whether the first execution happens at `start` instead of the pending timer."""
+        return not self.__delay and self.__attempts == 0
+
     @property
     def attempts(self) -> int:
 
@@ -269,6 +644,31 @@ class BaseJob(ABC, Generic[T]):
 
         return self.__failed_attempts
 
+    @property
+    def skipped_executions(self) -> int:
+        """
+        Get the number of executions dropped because they were missed.
+
+        Returns
+        -------
+        int
+            Number of skipped executions.
+        """
+        return self.__skipped_executions
+
+    @property
+    def stats(self) -> Optional[ExecutionStats]:
+        """
+        Get the statistics of the instrumented executions.
+
+        Returns
+        -------
+        Optional[ExecutionStats]
+            Lag, duration and outcome of the executions, ``None`` if the
+            scheduler is not instrumented or the |BaseJob| was not executed yet.
+        """
+        return self.__stats
+
     @property
     def has_attempts_remaining(self) -> bool:
 
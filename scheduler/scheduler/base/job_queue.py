@@ -0,0 +1,244 @@
+r"""
+Priority queue of `BaseJob`\ s ordered by their pending execution datetime.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, Optional
+
+from scheduler.base.job import BaseJobType
+
+# position of the job reference in a heap entry `[datetime, counter, job]`
+_JOB = 2
+
+
+class BaseJobQueue(ABC, Generic[BaseJobType]):
+    r"""
+    Abstract definition of the container of the pending |BaseJob|\ s of a scheduler.
+
+    Notes
+    -----
+    The datetime of a |BaseJob| is read once when it is (re)inserted. After
+    `BaseJob._calc_next_exec` the |BaseJob| has to be passed to `update`.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError()  # pragma: no cover
+
+    @abstractmethod
+    def __contains__(self, job: object) -> bool:
+        raise NotImplementedError()  # pragma: no cover
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[BaseJobType]:
+        raise NotImplementedError()  # pragma: no cover
+
+    @abstractmethod
+    def push(self, job: BaseJobType) -> None:
+        """Insert a |BaseJob|, an already queued |BaseJob| is repositioned."""
+
+    @abstractmethod
+    def extend(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""Insert many |BaseJob|\ s."""
+
+    def update(self, job: BaseJobType) -> None:
+        """
+        Reposition a queued |BaseJob| after its datetime changed.
+
+        Raises
+        ------
+        KeyError
+            If the |BaseJob| is not queued.
+        """
+        if job not in self:
+            raise KeyError(job)
+        self.push(job)
+
+    @abstractmethod
+    def remove(self, job: BaseJobType) -> None:
+        """
+        Remove a queued |BaseJob|.
+
+        Raises
+        ------
+        KeyError
+            If the |BaseJob| is not queued.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s."""
+
+    @abstractmethod
+    def peek(self) -> Optional[BaseJobType]:
+        """Return the |BaseJob| with the earliest datetime without removing it."""
+
+    @abstractmethod
+    def due(self, ref_dt: dt.datetime) -> list[BaseJobType]:
+        r"""Get all |BaseJob|\ s with a datetime not later than `ref_dt` ordered by datetime."""
+
+    @property
+    def jobs(self) -> set[BaseJobType]:
+        r"""Get the set of all queued |BaseJob|\ s."""
+        return set(self)
+
+
+class JobQueue(BaseJobQueue[BaseJobType]):
+    r"""
+    Binary heap of |BaseJob|\ s keyed on the pending |JobTimer| datetime.
+
+    Reschedules and deletions invalidate the outdated heap entry lazily instead of
+    searching it in the heap, so both cost O(log n). The stale entries are
+    discarded as soon as they reach the top of the heap, such that the next due
+    |BaseJob| is available in O(1).
+
+    Notes
+    -----
+    The datetime of a |BaseJob| is read once when it is (re)inserted. After
+    `BaseJob._calc_next_exec` the |BaseJob| has to be passed to `update`.
+    """
+
+    __heap: list[list[Any]]
+    __entries: dict[BaseJobType, list[Any]]
+    __counter: Iterator[int]
+    __n_stale: int
+
+    def __init__(self) -> None:
+        self.__heap = []
+        self.__entries = {}
+        self.__counter = itertools.count()
+        self.__n_stale = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, job: object) -> bool:
+        return job in self.__entries
+
+    def __iter__(self) -> Iterator[BaseJobType]:
+        return iter(list(self.__entries))
+
+    def push(self, job: BaseJobType) -> None:
+        """Insert a |BaseJob|, an already queued |BaseJob| is repositioned."""
+        if job in self.__entries:
+            self.__invalidate(job)
+        entry = [job.datetime, next(self.__counter), job]
+        self.__entries[job] = entry
+        heapq.heappush(self.__heap, entry)
+        self.__prune()
+
+    def extend(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""
+        Insert many |BaseJob|\ s with a single heap rebuild.
+
+        Already queued |BaseJob|\ s are repositioned. The heap is rebuilt in
+        O(n) once instead of inserting every |BaseJob| in O(log n), unless only
+        a few |BaseJob|\ s are added to a large queue.
+        """
+        entries = []
+        for job in jobs:
+            if job in self.__entries:
+                self.__invalidate(job)
+            entry = [job.datetime, next(self.__counter), job]
+            self.__entries[job] = entry
+            entries.append(entry)
+        if len(entries) * max(len(self.__heap), 1).bit_length() < len(self.__heap):
+            for entry in entries:
+                heapq.heappush(self.__heap, entry)
+        else:
+            self.__heap.extend(entries)
+            heapq.heapify(self.__heap)
+        self.__prune()
+
+    def update(self, job: BaseJobType) -> None:
+        """
+        Reposition a queued |BaseJob| after its datetime changed.
+
+        Raises
+        ------
+        KeyError
+            If the |BaseJob| is not queued.
+        """
+        self.__invalidate(job)
+        self.push(job)
+
+    def remove(self, job: BaseJobType) -> None:
+        """
+        Remove a queued |BaseJob|.
+
+        Raises
+        ------
+        KeyError
+            If the |BaseJob| is not queued.
+        """
+        self.__invalidate(job)
+        self.__prune()
+
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s."""
+        self.__heap.clear()
+        self.__entries.clear()
+        self.__n_stale = 0
+
+    def peek(self) -> Optional[BaseJobType]:
+        """Return the |BaseJob| with the earliest datetime without removing it."""
+        if not self.__heap:
+            return None
+        return self.__heap[0][_JOB]
+
+    def due(self, ref_dt: dt.datetime) -> list[BaseJobType]:
+        r"""
+        Get all |BaseJob|\ s with a datetime not later than `ref_dt`.
+
+        Only the subtrees of the heap that contain due entries are visited, the
+        cost is therefore independent of the number of pending |BaseJob|\ s.
+
+        Returns
+        -------
+        list[BaseJob]
+            Due |BaseJob|\ s ordered by their datetime.
+        """
+        heap = self.__heap
+        size = len(heap)
+        found: list[list[Any]] = []
+        stack = [0] if heap else []
+        while stack:
+            idx = stack.pop()
+            entry = heap[idx]
+            if entry[0] > ref_dt:
+                continue
+            if entry[_JOB] is not None:
+                found.append(entry)
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < size:
+                    stack.append(child)
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [entry[_JOB] for entry in found]
+
+    @property
+    def jobs(self) -> set[BaseJobType]:
+        r"""Get the set of all queued |BaseJob|\ s."""
+        return set(self.__entries)
+
+    def __invalidate(self, job: BaseJobType) -> None:
+        entry = self.__entries.pop(job)
+        entry[_JOB] = None
+        self.__n_stale += 1
+
+    def __prune(self) -> None:
+        heap = self.__heap
+        while heap and heap[0][_JOB] is None:
+            heapq.heappop(heap)
+            self.__n_stale -= 1
+        # rebuild once the stale entries outnumber the live ones to bound memory
+        if self.__n_stale > len(self.__entries) and self.__n_stale > 64:
+            self.__heap = [entry for entry in heap if entry[_JOB] is not None]
+            heapq.heapify(self.__heap)
+            self.__n_stale = 0
@@ -0,0 +1,105 @@
+r"""
+Persistent storage of the `BaseJob`\ s of a scheduler.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Generic
+
+from scheduler.base.job import BaseJobType
+
+
+class BaseJobStore(ABC, Generic[BaseJobType]):
+    r"""
+    Abstract definition of a persistent storage of |BaseJob|\ s.
+
+    A scheduler writes every added, executed and deleted |BaseJob| through to
+    the store. After a restart the stored |BaseJob|\ s are loaded lazily, only
+    once their pending execution comes near.
+
+    Notes
+    -----
+    Writes may be buffered, they are only guaranteed to be persistent after
+    `flush` or `close`.
+    """
+
+    @abstractmethod
+    def add(self, job: BaseJobType) -> None:
+        """
+        Store the definition and the state of a |BaseJob|.
+
+        An already stored |BaseJob| is replaced, e.g. after its timing changed.
+
+        Raises
+        ------
+        SchedulerError
+            If the |BaseJob| can't be serialized.
+        """
+
+    def add_many(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""
+        Store the definitions and the states of many |BaseJob|\ s.
+
+        The default implementation calls `add` for every |BaseJob|, a store
+        should override it to serialize all |BaseJob|\ s before the first write.
+
+        Raises
+        ------
+        SchedulerError
+            If a |BaseJob| can't be serialized.
+        """
+        for job in jobs:
+            self.add(job)
+
+    @abstractmethod
+    def update(self, job: BaseJobType) -> None:
+        """Store the state of a |BaseJob| after an execution, unknown ones are ignored."""
+
+    @abstractmethod
+    def remove(self, job: BaseJobType) -> None:
+        """Remove a |BaseJob| from the store, unknown ones are ignored."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s including the ones not loaded yet."""
+
+    @abstractmethod
+    def load(self, until: dt.datetime, job_class: type[BaseJobType]) -> list[BaseJobType]:
+        r"""
+        Load the stored |BaseJob|\ s due not later than `until`.
+
+        Every stored |BaseJob| is loaded only once, |BaseJob|\ s added in this
+        session are never loaded.
+
+        Parameters
+        ----------
+        until : datetime.datetime
+            Upper bound of the pending executions to load.
+        job_class : type[BaseJob]
+            Class the stored |BaseJob|\ s are recreated as.
+
+        Returns
+        -------
+        list[BaseJob]
+            Newly loaded |BaseJob|\ s ordered by their pending execution.
+        """
+
+    @abstractmethod
+    def flush(self, force: bool = True) -> None:
+        """
+        Persist the buffered writes.
+
+        Parameters
+        ----------
+        force : bool
+            If ``False`` the writes are only persisted if the buffer is full
+            or its oldest write exceeds the flush interval.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush the buffered writes and release the storage."""
@@ -7,17 +7,46 @@ Implementation of the essential timer for a `BaseJob`.
 from __future__ import annotations
 
 import datetime as dt
-import threading
+from collections.abc import Iterator
 from typing import Optional, cast
 
 from scheduler.base.definition import JobType
 from scheduler.base.timingtype import TimingJobTimerUnion
-from scheduler.trigger.core import Weekday
-from scheduler.util import JOB_NEXT_DAYLIKE_MAPPING, next_weekday_time_occurrence
+from scheduler.trigger.calendar import CalendarTrigger
+from scheduler.trigger.cron import Cron
+from scheduler.util import (
+    CALENDAR_JOB_TYPES,
+    JOB_PERIOD_MAPPING,
+    count_calendar_occurrences,
+    first_occurrence,
+    next_timing_occurrence,
+    skipped_occurrences,
+    timer_occurrences,
+)
 
 
 class JobTimer:
+    """
+    The class provides the core functionality of a |BaseJob|'s timing.
 
+    Notes
+    -----
+    A |JobTimer| holds no lock of its own, updates are serialized by the
+    |BaseJob| owning it. The pending execution is replaced by a single
+    assignment of an immutable `datetime.datetime`, so it can be read
+    without a lock.
+
+    A positive `offset` shifts every execution of the `timing` by the same
+    amount, the period of the |JobTimer| is kept.
+    """
+
+    __slots__ = ("__job_type", "__timing", "__next_exec", "__skip", "__offset")
+
+    __job_type: JobType
+    __timing: TimingJobTimerUnion
+    __next_exec: dt.datetime
+    __skip: bool
+    __offset: dt.timedelta
 
     def __init__(
         self,
@@ -25,50 +54,176 @@ class JobTimer:
         timing: TimingJobTimerUnion,
         start: dt.datetime,
         skip_missing: bool = False,
+        offset: dt.timedelta = dt.timedelta(),
     ):
-        self.__lock = threading.RLock()
         self.__job_type = job_type
         self.__timing = timing
-        self.__next_exec = start
+        # the cycles of a cyclic timer are relative to the start, shift the start instead
+        self.__next_exec = start + offset if job_type == JobType.CYCLIC else start
         self.__skip = skip_missing
+        self.__offset = offset
         self.calc_next_exec()
 
-    def calc_next_exec(self, ref: Optional[dt.datetime] = None) -> None:
-
-        with self.__lock:
-            if self.__job_type == JobType.CYCLIC:
-                if self.__skip and ref is not None:
-                    self.__next_exec = ref
-                self.__next_exec = self.__next_exec + cast(dt.timedelta, self.__timing)
-                return
-
-            if self.__job_type == JobType.WEEKLY:
-                self.__timing = cast(Weekday, self.__timing)
-                if self.__timing.time.tzinfo:
-                    self.__next_exec = self.__next_exec.astimezone(self.__timing.time.tzinfo)
-                self.__next_exec = next_weekday_time_occurrence(
-                    self.__next_exec, self.__timing, self.__timing.time
-                )
-
-            else:  # self.__job_type in JOB_NEXT_DAYLIKE_MAPPING:
-                self.__timing = cast(dt.time, self.__timing)
-                if self.__next_exec.tzinfo:
-                    self.__next_exec = self.__next_exec.astimezone(self.__timing.tzinfo)
-                self.__next_exec = JOB_NEXT_DAYLIKE_MAPPING[self.__job_type](
-                    self.__next_exec, self.__timing
-                )
-
-            if self.__skip and ref is not None and self.__next_exec < ref:
-                self.__next_exec = ref
-                self.calc_next_exec()
+    @classmethod
+    def restored(
+        cls,
+        job_type: JobType,
+        timing: TimingJobTimerUnion,
+        next_exec: dt.datetime,
+        skip_missing: bool = False,
+        offset: dt.timedelta = dt.timedelta(),
+    ) -> JobTimer:
+        """
+        Recreate a |JobTimer| with a persisted pending execution.
+
+        Parameters
+        ----------
+        job_type : JobType
+            Indicator which defines which calculations has to be used.
+        timing : TimingJobTimerUnion
+            Desired execution time.
+        next_exec : datetime.datetime
+            The pending execution, it is not calculated again.
+        skip_missing : bool
+            If ``True`` only the newest planned execution is scheduled.
+        offset : datetime.timedelta
+            Shift of the executions of the `timing`.
+
+        Returns
+        -------
+        JobTimer
+            The recreated |JobTimer|.
+        """
+        timer = cls.__new__(cls)
+        timer.__job_type = job_type
+        timer.__timing = timing
+        timer.__next_exec = next_exec
+        timer.__skip = skip_missing
+        timer.__offset = offset
+        return timer
+
+    def calc_next_exec(
+        self, ref: Optional[dt.datetime] = None, skip: Optional[bool] = None
+    ) -> int:
+        """
+        Generate the next execution `datetime.datetime` stamp.
+
+        If missed executions are skipped, the first execution after `ref` is
+        calculated directly instead of stepping through all missed executions.
+
+        Parameters
+        ----------
+        ref : Optional[datetime.datetime]
+            Datetime reference for skipping missed executions.
+        skip : Optional[bool]
+            Overwrite the `skip_missing` setting of the |JobTimer| for this call.
+
+        Returns
+        -------
+        int
+            Number of skipped executions.
+        """
+        skip = self.__skip if skip is None else skip
+        last_exec = self.__next_exec
+        # the result is assigned once, readers never see an intermediate value
+        if self.__job_type == JobType.CYCLIC:
+            period = cast(dt.timedelta, self.__timing)
+            if skip and ref is not None:
+                self.__next_exec = ref + period
+                return skipped_occurrences(last_exec, ref, period)
+            self.__next_exec = last_exec + period
+            return 0
+
+        next_exec = self.__next_occurrence(last_exec)
+        if skip and ref is not None and next_exec < ref:
+            self.__next_exec = self.__next_occurrence(ref)
+            if self.__job_type == JobType.CRON or self.__job_type in CALENDAR_JOB_TYPES:
+                # the occurrences after `last_exec` up to and including `ref`
+                micro = dt.timedelta(microseconds=1)
+                return self.__count(last_exec + micro, ref + micro)
+            return skipped_occurrences(last_exec, ref, JOB_PERIOD_MAPPING[self.__job_type])
+        self.__next_exec = next_exec
+        return 0
+
+    def skip_to(self, ref: dt.datetime) -> int:
+        """
+        Drop all executions earlier than `ref` while keeping the phase of the |JobTimer|.
+
+        Parameters
+        ----------
+        ref : datetime.datetime
+            The new pending execution is the first one not earlier than `ref`.
+
+        Returns
+        -------
+        int
+            Number of skipped executions, including the pending one.
+        """
+        last_exec, offset = self.__next_exec, self.__offset
+        next_exec = first_occurrence(
+            self.__job_type, self.__timing, last_exec - offset, ref - offset
+        )
+        if next_exec is None or next_exec + offset == last_exec:
+            return 0
+        self.__next_exec = next_exec + offset
+        if self.__job_type == JobType.CRON or self.__job_type in CALENDAR_JOB_TYPES:
+            return self.__count(last_exec, ref)
+        if self.__job_type == JobType.CYCLIC:
+            period = cast(dt.timedelta, self.__timing)
+        else:
+            period = JOB_PERIOD_MAPPING[self.__job_type]
+        return -((last_exec - ref) // period)
+
+    def __next_occurrence(self, ref: dt.datetime) -> dt.datetime:
+        """Get the first day-like, weekly, cron or calendar occurrence after `ref`."""
+        offset = self.__offset
+        if offset:
+            return self.__next_timing_occurrence(ref - offset) + offset
+        return self.__next_timing_occurrence(ref)
+
+    def __count(self, start: dt.datetime, end: dt.datetime) -> int:
+        """Count the occurrences of a |Cron| or |CalendarTrigger| timing within `[start, end)`."""
+        start, end = start - self.__offset, end - self.__offset
+        if self.__job_type == JobType.CRON:
+            return cast(Cron, self.__timing).count(start, end)
+        return count_calendar_occurrences(cast(CalendarTrigger, self.__timing), start, end)
+
+    def __next_timing_occurrence(self, ref: dt.datetime) -> dt.datetime:
+        """Get the first day-like, weekly, cron or calendar occurrence of the timing after `ref`."""
+        return next_timing_occurrence(self.__job_type, self.__timing, ref)
 
     @property
     def datetime(self) -> dt.datetime:
 
-        with self.__lock:
-            return self.__next_exec
+        return self.__next_exec
+
+    def occurrences(self, start: dt.datetime, end: dt.datetime) -> Iterator[dt.datetime]:
+        """
+        Lazily generate the planned executions within `[start, end)`.
+
+        The executions are calculated from the current state of the |JobTimer|
+        without changing it.
+        """
+        next_exec, timing, offset = self.__next_exec, self.__timing, self.__offset
+        if not offset:
+            return timer_occurrences(self.__job_type, timing, next_exec, start, end)
+        occurrences = timer_occurrences(
+            self.__job_type, timing, next_exec - offset, start - offset, end - offset
+        )
+        return (occurrence + offset for occurrence in occurrences)
+
+    @property
+    def offset(self) -> dt.timedelta:
+        """
+        Get the shift of the executions of the timing.
+
+        Returns
+        -------
+        datetime.timedelta
+            Offset of the |JobTimer|, zero by default.
+        """
+        return self.__offset
 
     def timedelta(self, dt_stamp: dt.datetime) -> dt.timedelta:
 
-        with self.__lock:
-            return self.__next_exec - dt_stamp
+        return self.__next_exec - dt_stamp
@@ -7,9 +7,9 @@ Implementation of essential functions for a `BaseJob`.
 from __future__ import annotations
 
 import datetime as dt
-from typing import Optional, cast
-
-import typeguard as tg
+import hashlib
+from collections.abc import Hashable
+from typing import Any, Optional, cast, get_args
 
 from scheduler.base.definition import JOB_TIMING_TYPE_MAPPING, JobType
 from scheduler.base.job_timer import JobTimer
@@ -18,11 +18,29 @@ from scheduler.error import SchedulerError
 from scheduler.message import (
     _TZ_ERROR_MSG,
     DUPLICATE_EFFECTIVE_TIME,
+    ONCE_TYPE_ERROR_MSG,
     START_STOP_ERROR,
     TZ_ERROR_MSG,
 )
+from scheduler.trigger.calendar import CalendarTrigger
 from scheduler.trigger.core import Weekday
-from scheduler.util import are_times_unique, are_weekday_times_unique
+from scheduler.trigger.cron import Cron
+from scheduler.util import (
+    CALENDAR_JOB_TYPES,
+    JOB_PERIOD_MAPPING,
+    are_times_unique,
+    are_weekday_times_unique,
+)
+
+# element type of the timing list for each `JobType`
+_TIMING_ELEMENT_TYPE_MAPPING: dict[JobType, type] = {
+    job_type: get_args(mapping["type"])[0] for job_type, mapping in JOB_TIMING_TYPE_MAPPING.items()
+}
+_ONCE_TIMING_TYPES = (dt.datetime, dt.timedelta, dt.time, Weekday, Cron, CalendarTrigger)
+
+# keys of already validated timings, see `validate_timing`
+_VALID_TIMINGS: set[Hashable] = set()
+_VALID_TIMINGS_MAXSIZE = 4096
 
 
 def prettify_timedelta(timedelta: dt.timedelta) -> str:
@@ -37,25 +55,119 @@ def prettify_timedelta(timedelta: dt.timedelta) -> str:
 
 def get_pending_timer(timers: list[JobTimer]) -> JobTimer:
     """Get the the timer with the largest overdue time."""
-    unsorted_timer_datetimes: dict[JobTimer, dt.datetime] = {}
-    for timer in timers:
-        unsorted_timer_datetimes[timer] = timer.datetime
-    sorted_timers = sorted(
-        unsorted_timer_datetimes,
-        key=unsorted_timer_datetimes.get,  # type: ignore
-    )
-    return sorted_timers[0]
+    if len(timers) == 1:
+        return timers[0]
+    return min(timers, key=lambda timer: timer.datetime)
+
+
+def jitter_seed(
+    handle: Any, args: tuple[Any, ...], kwargs: dict[str, Any], alias: Optional[str]
+) -> str:
+    """Get the seed of the jitter of a |BaseJob|, its alias or its callback and arguments."""
+    if alias is not None:
+        return alias
+    name = getattr(handle, "__qualname__", None)
+    if name is None:
+        return repr((handle, args, kwargs))
+    return repr((getattr(handle, "__module__", None), name, args, kwargs))
+
+
+def jitter_offset(
+    job_type: JobType, timing: TimingJobUnion, jitter: Optional[dt.timedelta], seed: str
+) -> dt.timedelta:
+    r"""
+    Get the deterministic offset of the |JobTimer|\ s of a |BaseJob| within its jitter.
+
+    The offset is derived from a stable hash of the `seed`, it is the same in
+    every process. The window is limited to the shortest period of the |JobType|
+    and `timing`, such that the executions of every |JobTimer| keep their order.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Indicator which defines which calculations has to be used.
+    timing : TimingJobUnion
+        Desired execution time(s).
+    jitter : Optional[datetime.timedelta]
+        Width of the window of the offset, ``None`` disables the offset.
+    seed : str
+        Seed of the offset, see `jitter_seed`.
+
+    Returns
+    -------
+    datetime.timedelta
+        Offset within ``[0, jitter)``.
+    """
+    if not jitter or jitter < dt.timedelta():
+        return dt.timedelta()
+    if job_type == JobType.CYCLIC:
+        window = min(jitter, *cast(list[dt.timedelta], timing))
+    elif job_type == JobType.CRON:
+        window = min(jitter, *(cron.interval for cron in cast(list[Cron], timing)))
+    elif job_type in CALENDAR_JOB_TYPES:
+        # matching days of a calendar trigger can be adjacent
+        window = min(jitter, dt.timedelta(days=1))
+    else:
+        window = min(jitter, JOB_PERIOD_MAPPING[job_type])
+    micros = window // dt.timedelta(microseconds=1)
+    if micros <= 0:
+        return dt.timedelta()
+    digest = hashlib.blake2b(seed.encode(), digest_size=8).digest()
+    return dt.timedelta(microseconds=int.from_bytes(digest, "little") % micros)
 
 
 def sane_timing_types(job_type: JobType, timing: TimingJobUnion) -> None:
 
+    element_type = _TIMING_ELEMENT_TYPE_MAPPING[job_type]
+    if (
+        not isinstance(timing, list)
+        or not all(isinstance(elem, element_type) for elem in timing)
+        or (job_type is JobType.CYCLIC and len(timing) != 1)
+    ):
+        raise SchedulerError(JOB_TIMING_TYPE_MAPPING[job_type]["err"])
+
+
+def sane_once_timing_type(timing: Any) -> None:
+    """Raise if `timing` is not supported by a oneshot |BaseJob|."""
+    if not isinstance(timing, _ONCE_TIMING_TYPES):
+        raise SchedulerError(ONCE_TYPE_ERROR_MSG)
+
+
+def _timing_key(elem: Any) -> Hashable:
+    """Get a key that identifies an element of a timing including its timezone."""
+    if isinstance(elem, Weekday):
+        return (elem.value, elem.time, elem.time.tzinfo)
+    # equal `datetime.time` objects can differ in their `tzinfo`
+    return (elem, getattr(elem, "tzinfo", None))
+
+
+def validate_timing(
+    job_type: JobType,
+    timing: TimingJobUnion,
+    tzinfo: Optional[dt.tzinfo],
+) -> None:
+    """
+    Raise if `timing` is invalid for `job_type` and `tzinfo`.
+
+    The timezone and duplicate checks of a successfully validated timing are
+    memoized, recurring timings only pay for the type check.
+    """
+    sane_timing_types(job_type, timing)
+    if job_type is JobType.CYCLIC:
+        return
+    key: Optional[Hashable]
     try:
-        tg.check_type(timing, JOB_TIMING_TYPE_MAPPING[job_type]["type"])
-        if job_type == JobType.CYCLIC:
-            if not len(timing) == 1:
-                raise TypeError
-    except TypeError as err:
-        raise SchedulerError(JOB_TIMING_TYPE_MAPPING[job_type]["err"]) from err
+        key = (job_type, tzinfo, tuple(_timing_key(elem) for elem in timing))
+        if key in _VALID_TIMINGS:
+            return
+    except TypeError:  # unhashable tzinfo
+        key = None
+    check_timing_tzinfo(job_type, timing, tzinfo)
+    check_duplicate_effective_timings(job_type, timing, tzinfo)
+    if key is not None:
+        if len(_VALID_TIMINGS) >= _VALID_TIMINGS_MAXSIZE:
+            _VALID_TIMINGS.clear()
+        _VALID_TIMINGS.add(key)
 
 
 def standardize_timing_format(job_type: JobType, timing: TimingJobUnion) -> TimingJobUnion:
@@ -81,6 +193,14 @@ def check_timing_tzinfo(
         for time in cast(list[dt.time], timing):
             if bool(time.tzinfo) ^ bool(tzinfo):
                 raise SchedulerError(TZ_ERROR_MSG)
+    elif job_type is JobType.CRON:
+        for cron in cast(list[Cron], timing):
+            if bool(cron.tzinfo) ^ bool(tzinfo):
+                raise SchedulerError(TZ_ERROR_MSG)
+    elif job_type in CALENDAR_JOB_TYPES:
+        for trigger in cast(list[CalendarTrigger], timing):
+            if bool(trigger.tzinfo) ^ bool(tzinfo):
+                raise SchedulerError(TZ_ERROR_MSG)
 
 
 def check_duplicate_effective_timings(
@@ -99,6 +219,9 @@ def check_duplicate_effective_timings(
     ):
         if not are_times_unique(cast(list[dt.time], timing)):
             raise SchedulerError(DUPLICATE_EFFECTIVE_TIME)
+    elif job_type is JobType.CRON or job_type in CALENDAR_JOB_TYPES:
+        if len(set(cast(list[Hashable], timing))) != len(timing):
+            raise SchedulerError(DUPLICATE_EFFECTIVE_TIME)
 
 
 def set_start_check_stop_tzinfo(
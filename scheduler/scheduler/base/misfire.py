@@ -0,0 +1,87 @@
+"""
+Catch up handling for executions of a `BaseJob` missed beyond their grace window.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import time
+from typing import Any, Optional
+
+from scheduler.base.definition import Misfire
+from scheduler.base.job import BaseJob
+
+
+class CatchUpLimiter:
+    """
+    Token bucket limiting the rate of catch up executions.
+
+    Parameters
+    ----------
+    rate : float
+        Catch up executions per second, ``0`` disables the limit.
+    burst : int
+        Maximum number of catch up executions at once, ``0`` defaults
+        to one second worth of `rate`.
+    """
+
+    def __init__(self, rate: float = 0, burst: int = 0):
+        self.__rate = rate
+        self.__capacity = float(burst or max(1, int(rate)))
+        self.__tokens = self.__capacity
+        self.__stamp = time.monotonic()
+
+    def acquire(self) -> bool:
+        """Take a token if one is available."""
+        if not self.__rate:
+            return True
+        now = time.monotonic()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__stamp) * self.__rate)
+        self.__stamp = now
+        if self.__tokens < 1:
+            return False
+        self.__tokens -= 1
+        return True
+
+    def wait_time(self) -> float:
+        """Get the seconds until the next token is available."""
+        if not self.__rate:
+            return 0.0
+        missing = 1 - self.__tokens - (time.monotonic() - self.__stamp) * self.__rate
+        return max(missing / self.__rate, 0.0)
+
+
+def resolve_misfire(
+    job: BaseJob[Any],
+    misfire: Misfire,
+    misfire_grace: Optional[dt.timedelta],
+) -> tuple[Misfire, Optional[dt.timedelta]]:
+    """Get the effective policy and grace window, settings of the |BaseJob| take precedence."""
+    return (
+        misfire if job.misfire is None else job.misfire,
+        misfire_grace if job.misfire_grace is None else job.misfire_grace,
+    )
+
+
+def is_misfired(
+    job: BaseJob[Any], ref_dt: dt.datetime, misfire_grace: Optional[dt.timedelta]
+) -> bool:
+    """Check if the pending execution of a due |BaseJob| is later than its grace window."""
+    if misfire_grace is None or job._initial:  # pylint: disable=protected-access
+        return False
+    return ref_dt - job.datetime > misfire_grace
+
+
+def calc_next_exec(
+    job: BaseJob[Any], ref_dt: dt.datetime, misfire: Misfire, misfired: bool
+) -> None:
+    """Calculate the next execution of an executed |BaseJob| according to the policy."""
+    # pylint: disable=protected-access
+    if not misfired or misfire is Misfire.ALL:
+        job._calc_next_exec(ref_dt)
+    elif misfire is Misfire.ONCE:
+        job._calc_next_exec(ref_dt, skip_missing=True)
+    else:
+        job._calc_next_exec(ref_dt, skip_missing=False)
+        job._skip_to(ref_dt + dt.timedelta(microseconds=1))
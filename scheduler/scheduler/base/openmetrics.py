@@ -0,0 +1,359 @@
+r"""
+OpenMetrics text exposition of scheduler metrics with an optional HTTP endpoint.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import threading
+from collections.abc import Iterable, Sequence
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger
+from typing import Any, Callable, Optional, Union
+
+from scheduler.base.scheduler import LOGGER, BaseScheduler
+from scheduler.base.stats import ExecutionStats, Histogram
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# upper bounds of the latency histograms in seconds
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items()) + "}"
+
+
+class _Exposition:
+    """Collect metric families in the OpenMetrics text format."""
+
+    __namespace: str
+    __bounds: list[int]
+    __les: list[str]
+    __lines: list[str]
+
+    def __init__(self, namespace: str, buckets: Sequence[float]):
+        self.__namespace = namespace
+        self.__bounds = [round(bound * 1e9) for bound in buckets]
+        self.__les = [repr(float(bound)) for bound in buckets]
+        self.__lines = []
+
+    def family(self, name: str, kind: str, text: str) -> str:
+        """Start a metric family and get its full name."""
+        name = f"{self.__namespace}_{name}"
+        self.__lines.append(f"# TYPE {name} {kind}")
+        self.__lines.append(f"# HELP {name} {text}")
+        return name
+
+    def sample(self, name: str, value: Union[int, float], **labels: str) -> None:
+        self.__lines.append(f"{name}{_labels(labels)} {value}")
+
+    def histogram(self, name: str, histogram: Histogram, **labels: str) -> None:
+        """Add the samples of a |Histogram| in nanoseconds as seconds."""
+        for le, count in zip(self.__les, histogram.cumulative(self.__bounds)):
+            self.sample(f"{name}_bucket", count, **labels, le=le)
+        count = histogram.count
+        self.sample(f"{name}_bucket", count, **labels, le="+Inf")
+        self.sample(f"{name}_count", count, **labels)
+        self.sample(f"{name}_sum", histogram.sum / 1e9, **labels)
+
+    def text(self) -> str:
+        return "\n".join(self.__lines + ["# EOF", ""])
+
+
+def render_openmetrics(
+    scheduler: BaseScheduler[Any, Any],
+    *,
+    tags: Optional[Iterable[str]] = None,
+    namespace: str = "scheduler",
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    r"""
+    Render the metrics of a scheduler in the OpenMetrics text format.
+
+    Scheduler-wide and per tag the number of scheduled and overdue |BaseJob|\ s
+    and the sum of their attempts and failed attempts are exposed as gauges,
+    the executions as counter and the scheduling lag and the duration as
+    histograms. The executing |BaseJob|\ s and the saturation of the executor
+    are exposed scheduler-wide.
+
+    Parameters
+    ----------
+    scheduler : BaseScheduler
+        Scheduler to expose, the executions are only counted if it is instrumented.
+    tags : Optional[Iterable[str]]
+        Tags exposed with a ``tag`` label, defaults to all tags of the scheduled
+        |BaseJob|\ s.
+    namespace : str
+        Prefix of the metric names.
+    buckets : Sequence[float]
+        Ascending upper bounds of the latency histograms in seconds.
+
+    Returns
+    -------
+    str
+        The OpenMetrics text exposition.
+
+    Notes
+    -----
+    The latency histograms are derived from the log buckets of the |ExecutionStats|,
+    an execution is at most counted in the next higher bucket.
+    """
+    jobs = scheduler.jobs
+    due_jobs = scheduler.due_jobs
+    n_executing = len(scheduler.executing_jobs)
+    max_in_flight = scheduler.max_in_flight
+    if tags is None:
+        tags = set().union(*(job.tags for job in jobs))
+    tags = sorted(tags)
+
+    n_jobs: collections.Counter[str] = collections.Counter()
+    n_due: collections.Counter[str] = collections.Counter()
+    attempts: collections.Counter[str] = collections.Counter()
+    failed_attempts: collections.Counter[str] = collections.Counter()
+    selected = set(tags)
+    for job in jobs:
+        for tag in job.tags & selected:
+            n_jobs[tag] += 1
+            attempts[tag] += job.attempts
+            failed_attempts[tag] += job.failed_attempts
+    for job in due_jobs:
+        for tag in job.tags & selected:
+            n_due[tag] += 1
+    stats = scheduler.stats()
+    tag_stats = {tag: scheduler.stats({tag}) for tag in tags}
+
+    out = _Exposition(namespace, buckets)
+    name = out.family("jobs", "gauge", "Number of scheduled jobs.")
+    out.sample(name, len(jobs))
+    name = out.family("overdue_jobs", "gauge", "Number of due jobs not executing yet.")
+    out.sample(name, len(due_jobs))
+    name = out.family("executing_jobs", "gauge", "Number of executing jobs.")
+    out.sample(name, n_executing)
+    name = out.family(
+        "max_in_flight", "gauge", "Maximum number of concurrently executing jobs, 0 if unbounded."
+    )
+    out.sample(name, max_in_flight)
+    if max_in_flight:
+        name = out.family(
+            "executor_saturation", "gauge", "Executing jobs relative to the maximum in flight."
+        )
+        out.sample(name, n_executing / max_in_flight)
+    name = out.family("job_attempts", "gauge", "Sum of the attempts of the scheduled jobs.")
+    out.sample(name, sum(job.attempts for job in jobs))
+    name = out.family(
+        "job_failed_attempts", "gauge", "Sum of the failed attempts of the scheduled jobs."
+    )
+    out.sample(name, sum(job.failed_attempts for job in jobs))
+    _render_stats(out, "", stats)
+
+    if tags:
+        name = out.family("tag_jobs", "gauge", "Number of scheduled jobs per tag.")
+        for tag in tags:
+            out.sample(name, n_jobs[tag], tag=tag)
+        name = out.family("tag_overdue_jobs", "gauge", "Number of overdue jobs per tag.")
+        for tag in tags:
+            out.sample(name, n_due[tag], tag=tag)
+        name = out.family("tag_job_attempts", "gauge", "Sum of the attempts per tag.")
+        for tag in tags:
+            out.sample(name, attempts[tag], tag=tag)
+        name = out.family("tag_job_failed_attempts", "gauge", "Sum of the failed attempts per tag.")
+        for tag in tags:
+            out.sample(name, failed_attempts[tag], tag=tag)
+        _render_stats(out, "tag_", tag_stats)
+    return out.text()
+
+
+def _render_stats(
+    out: _Exposition, prefix: str, stats: Union[ExecutionStats, dict[str, ExecutionStats]]
+) -> None:
+    """Add the execution counters and latency histograms, per tag if given a `dict`."""
+    per_tag = stats if isinstance(stats, dict) else {"": stats}
+
+    def labels(tag: str) -> dict[str, str]:
+        return {"tag": tag} if isinstance(stats, dict) else {}
+
+    name = out.family(f"{prefix}executions", "counter", "Number of instrumented executions.")
+    for tag, elem in per_tag.items():
+        out.sample(f"{name}_total", elem.successes, **labels(tag), outcome="success")
+        out.sample(f"{name}_total", elem.failures, **labels(tag), outcome="failure")
+    name = out.family(
+        f"{prefix}execution_lag_seconds",
+        "histogram",
+        "Actual minus planned start of the executions.",
+    )
+    for tag, elem in per_tag.items():
+        out.histogram(name, elem.lag, **labels(tag))
+    name = out.family(
+        f"{prefix}execution_duration_seconds", "histogram", "Run time of the executions."
+    )
+    for tag, elem in per_tag.items():
+        out.histogram(name, elem.duration, **labels(tag))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer a GET of the metrics path with the OpenMetrics text."""
+
+    def __init__(self, path: str, render: Callable[[], str], logger: Logger, *args: Any):
+        self.__path = path
+        self.__render = render
+        self.__logger = logger
+        super().__init__(*args)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path.split("?", 1)[0] != self.__path:
+            self.send_error(404)
+            return
+        try:
+            body = self.__render().encode()
+        except Exception:  # pylint: disable=broad-except
+            self.__logger.exception("Failed to render the scheduler metrics!")
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        self.__logger.debug(format, *args)
+
+
+class MetricsServer:
+    r"""
+    Serve the OpenMetrics text of a scheduler from a daemon thread.
+
+    Only the standard library is used. The socket is bound on creation, the
+    thread is started by `start`.
+
+    Parameters
+    ----------
+    scheduler : BaseScheduler
+        Scheduler to expose, see `render_openmetrics`.
+    host : str
+        Interface to listen on.
+    port : int
+        Port to listen on, ``0`` picks a free port, see `address`.
+    path : str
+        Path of the metrics endpoint, other paths are answered with 404.
+    tags : Optional[Iterable[str]]
+        Tags exposed with a ``tag`` label, defaults to all tags in use.
+    namespace : str
+        Prefix of the metric names.
+    buckets : Sequence[float]
+        Ascending upper bounds of the latency histograms in seconds.
+    loop : Optional[asyncio.AbstractEventLoop]
+        Event loop of an |AioScheduler|, the metrics are then collected in the
+        loop instead of the server thread.
+    timeout : float
+        Seconds to wait for the collection in the event loop.
+    logger : Optional[logging.Logger]
+        A custom Logger instance.
+    """
+
+    __scheduler: BaseScheduler[Any, Any]
+    __tags: Optional[list[str]]
+    __namespace: str
+    __buckets: Sequence[float]
+    __loop: Optional[asyncio.AbstractEventLoop]
+    __timeout: float
+    __server: ThreadingHTTPServer
+    __thread: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        scheduler: BaseScheduler[Any, Any],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/metrics",
+        tags: Optional[Iterable[str]] = None,
+        namespace: str = "scheduler",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        timeout: float = 5.0,
+        logger: Optional[Logger] = None,
+    ):
+        self.__scheduler = scheduler
+        self.__tags = None if tags is None else list(tags)
+        self.__namespace = namespace
+        self.__buckets = buckets
+        self.__loop = loop
+        self.__timeout = timeout
+        handler = partial(_Handler, path, self.render, logger if logger else LOGGER)
+        self.__server = ThreadingHTTPServer((host, port), handler)
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    def render(self) -> str:
+        """Collect the metrics of the scheduler in the OpenMetrics text format."""
+        if self.__loop is None:
+            return self.__render()
+
+        async def collect() -> str:
+            return self.__render()
+
+        future = asyncio.run_coroutine_threadsafe(collect(), self.__loop)
+        return future.result(self.__timeout)
+
+    def __render(self) -> str:
+        return render_openmetrics(
+            self.__scheduler, tags=self.__tags, namespace=self.__namespace, buckets=self.__buckets
+        )
+
+    def start(self) -> None:
+        """Serve the metrics from a daemon thread."""
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, name="scheduler-metrics", daemon=True
+        )
+        self.__thread.start()
+
+    def shutdown(self) -> None:
+        """Stop serving and close the socket."""
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Get the address the server is bound to.
+
+        Returns
+        -------
+        tuple[str, int]
+            Host and port.
+        """
+        host, port = self.__server.server_address[:2]
+        return str(host), int(port)
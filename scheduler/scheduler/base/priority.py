@@ -0,0 +1,84 @@
+r"""
+Ranking of due `BaseJob`\ s by a priority function of their weight and lateness.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from typing import Any, Callable, Optional, Union
+
+from scheduler.base.definition import Priority
+from scheduler.base.job import BaseJob, BaseJobType
+
+# lateness in seconds, weight -> priority
+PriorityFunction = Callable[[float, float], float]
+
+# lateness unit of the builtin priority functions in seconds
+_MINUTE = 60.0
+# largest exponent of `Priority.EXPONENTIAL`, keeps the priority finite
+_MAX_EXPONENT = 1000.0
+
+
+def _linear(lateness: float, weight: float) -> float:
+    return weight * (1 + lateness / _MINUTE)
+
+
+def _exponential(lateness: float, weight: float) -> float:
+    return weight * 2.0 ** min(lateness / _MINUTE, _MAX_EXPONENT)
+
+
+def _constant(lateness: float, weight: float) -> float:  # pylint: disable=unused-argument
+    return weight
+
+
+PRIORITY_FUNCTIONS: dict[Priority, PriorityFunction] = {
+    Priority.LINEAR: _linear,
+    Priority.EXPONENTIAL: _exponential,
+    Priority.CONSTANT: _constant,
+}
+
+
+def priority_function(priority: Union[Priority, PriorityFunction, None]) -> PriorityFunction:
+    """Get the priority function of a policy, ``None`` ranks by the weight only."""
+    if priority is None:
+        return _constant
+    if isinstance(priority, Priority):
+        return PRIORITY_FUNCTIONS[priority]
+    return priority
+
+
+def job_priority(job: BaseJob[Any], ref_dt: dt.datetime, function: PriorityFunction) -> float:
+    """Get the priority of a due |BaseJob| at `ref_dt`."""
+    lateness = (ref_dt - job.datetime).total_seconds()
+    return function(lateness if lateness > 0 else 0.0, job.weight)
+
+
+def rank_jobs(
+    jobs: Sequence[BaseJobType], ref_dt: dt.datetime, function: Optional[PriorityFunction]
+) -> list[BaseJobType]:
+    r"""
+    Order due |BaseJob|\ s by descending priority.
+
+    The order is stable, |BaseJob|\ s of equal priority keep their order by
+    datetime. Without a priority function the order is kept as is.
+
+    Parameters
+    ----------
+    jobs : Sequence[BaseJob]
+        Due |BaseJob|\ s ordered by datetime.
+    ref_dt : datetime.datetime
+        Reference of the lateness.
+    function : Optional[PriorityFunction]
+        Priority as function of the lateness in seconds and the weight.
+
+    Returns
+    -------
+    list[BaseJob]
+        The ranked |BaseJob|\ s.
+    """
+    if function is None or len(jobs) < 2:
+        return list(jobs)
+    priorities = {job: job_priority(job, ref_dt, function) for job in jobs}
+    return sorted(jobs, key=priorities.__getitem__, reverse=True)
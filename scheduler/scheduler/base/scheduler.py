@@ -1,17 +1,24 @@
 
 
+import datetime as dt
+import os
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from functools import wraps
 from logging import Logger, getLogger
-from typing import Any, Callable, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Generic, List, Optional, TypeVar, Union
 
 from scheduler.base.job import BaseJobType
+from scheduler.base.stats import ExecutionStats
 from scheduler.base.timingtype import (
+    TimingBusinessDayUnion,
+    TimingCronUnion,
     TimingCyclic,
     TimingDailyUnion,
+    TimingMonthlyUnion,
     TimingOnceUnion,
+    TimingUnion,
     TimingWeeklyUnion,
 )
 
@@ -28,8 +35,22 @@ def select_jobs_by_tag(
 ) -> set[BaseJobType]:
 
     if any_tag:
-        return {job for job in jobs if tags & job.tags}
-    return {job for job in jobs if tags <= job.tags}
+        return {job for job in jobs if not job._tags.isdisjoint(tags)}
+    return {job for job in jobs if tags <= job._tags}
+
+
+def create_job_instance(
+    job_class: type[BaseJobType],
+    timing: TimingUnion,
+    **kwargs: Any,
+) -> BaseJobType:
+    """Create a job instance from the given input parameters."""
+    if not isinstance(timing, list):
+        timing = [timing]
+    return job_class(
+        timing=timing,
+        **kwargs,
+    )
 
 
 def deprecated(fields: List[str]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -108,6 +129,18 @@ class BaseScheduler(
     def weekly(self, timing: TimingWeeklyUnion, handle: T, **kwargs) -> BaseJobType:
         """Schedule a weekly |BaseJob|."""
 
+    @abstractmethod
+    def cron(self, timing: TimingCronUnion, handle: T, **kwargs) -> BaseJobType:
+        """Schedule a |BaseJob| by cron expressions."""
+
+    @abstractmethod
+    def monthly(self, timing: TimingMonthlyUnion, handle: T, **kwargs) -> BaseJobType:
+        """Schedule a monthly |BaseJob|."""
+
+    @abstractmethod
+    def business_day(self, timing: TimingBusinessDayUnion, handle: T, **kwargs) -> BaseJobType:
+        """Schedule a |BaseJob| on business days."""
+
     @abstractmethod
     def once(
         self,
@@ -121,7 +154,56 @@ class BaseScheduler(
     ) -> BaseJobType:
         """Schedule a oneshot |BaseJob|."""
 
+    @abstractmethod
+    def get_job(self, alias: str) -> Optional[BaseJobType]:
+        """Get a |BaseJob| by its alias."""
+
+    @abstractmethod
+    def delete_job_by_alias(self, alias: str) -> BaseJobType:
+        """Delete a |BaseJob| from the `BaseScheduler` by its alias."""
+
+    @abstractmethod
+    def reschedule(
+        self,
+        alias: str,
+        timing: TimingUnion,
+        *,
+        start: Optional[dt.datetime] = None,
+    ) -> BaseJobType:
+        """Replace the timing of a scheduled |BaseJob| in place."""
+
+    @abstractmethod
+    def add_jobs(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""Add already created |BaseJob|\ s to the `BaseScheduler`."""
+
+    @abstractmethod
+    def schedule_many(self, specs: Iterable[dict[str, Any]]) -> list[BaseJobType]:
+        r"""Schedule many |BaseJob|\ s at once."""
+
+    @abstractmethod
+    def snapshot(self, path: Union[str, os.PathLike[str]]) -> int:
+        r"""Write all |BaseJob|\ s to a compact binary snapshot file."""
+
+    @abstractmethod
+    def stats(self, tags: Optional[set[str]] = None, any_tag: bool = False) -> ExecutionStats:
+        r"""Get the statistics of the instrumented executions of the `BaseScheduler`."""
+
     @property
     @abstractmethod
     def jobs(self) -> set[BaseJobType]:
         r"""Get the set of all |BaseJob|\ s."""
+
+    @property
+    @abstractmethod
+    def due_jobs(self) -> list[BaseJobType]:
+        r"""Get the |BaseJob|\ s which are due but not executing yet."""
+
+    @property
+    @abstractmethod
+    def executing_jobs(self) -> set[BaseJobType]:
+        r"""Get the |BaseJob|\ s which are currently executing."""
+
+    @property
+    @abstractmethod
+    def max_in_flight(self) -> int:
+        r"""Get the maximum number of concurrently executing |BaseJob|\ s, ``0`` <=> unbounded."""
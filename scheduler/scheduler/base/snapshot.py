@@ -0,0 +1,566 @@
+r"""
+Compact binary snapshot of the `BaseJob`\ s of a scheduler.
+
+All integers are little endian, the file consists of the following sections::
+
+    header   magic, version and the number of entries of every table
+    strings  offsets of the interned strings followed by their utf-8 data
+    timings  one record per distinct timing element
+    jobs     one fixed size record per job
+    timers   timing index and pending execution of every timer
+    tags     string index of every tag
+    payload  pickled args and kwargs of the jobs having any
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import gc
+import importlib
+import mmap
+import os
+import pickle
+import struct
+import zoneinfo
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional, Union, cast
+
+from scheduler.base.definition import JobType, Misfire
+from scheduler.base.job import BaseJobType
+from scheduler.error import SchedulerError
+from scheduler.message import (
+    SNAPSHOT_ERROR_MSG,
+    SNAPSHOT_FORMAT_ERROR_MSG,
+    SNAPSHOT_HANDLE_ERROR_MSG,
+)
+from scheduler.trigger.calendar import BusinessDay, HolidayCalendar, Monthly
+from scheduler.trigger.core import Weekday, weekday
+from scheduler.trigger.cron import Cron
+
+_MAGIC = b"SCHEDSNP"
+_VERSION = 1
+
+# magic, version, strings, timings, jobs, timers, tags, payload size
+_HEADER = struct.Struct("<8sHxxIIIIIQ")
+_OFFSET = struct.Struct("<I")
+# kind, microseconds or cron expression string, weekday or day of the month,
+# timezone string, holiday calendar string
+_TIMING = struct.Struct("<Bqbii")
+# type, flags, misfire, max_attempts, attempts, failed_attempts, skipped_executions,
+# handle string, alias string, tzinfo string, start, start timezone string, stop,
+# stop timezone string, misfire_grace, weight, jitter, first timer, timers, first tag,
+# tags, payload offset, payload size
+_JOB = struct.Struct("<BBBIIIIIiiqiqiqdqIHIHII")
+# timing index, pending execution, timezone string
+_TIMER = struct.Struct("<Iqi")
+
+_TIMEDELTA = 0
+_TIME = 1
+_WEEKDAY = 2
+_CRON = 3
+_MONTHLY = 4
+_BUSINESS_DAY = 5
+
+_DELAY = 1
+_SKIP_MISSING = 2
+_STOP = 4
+_MISFIRE_GRACE = 8
+_JITTER = 16
+
+_NONE = -1
+_EPOCH = dt.datetime(1970, 1, 1)
+_JOB_TYPES = {job_type.value: job_type for job_type in JobType}
+_MISFIRES = {misfire.value: misfire for misfire in Misfire}
+
+
+def _micros(delta: dt.timedelta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class _Encoder:
+    """Intern the strings of a snapshot, encode every timezone, calendar and datetime once."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.tzinfos: dict[dt.tzinfo, int] = {}
+        self.datetimes: dict[int, tuple[dt.datetime, int, int]] = {}
+        self.calendars: dict[int, tuple[HolidayCalendar, int]] = {}
+
+    def string(self, string: Optional[str]) -> int:
+        if string is None:
+            return _NONE
+        idx = self.strings.get(string)
+        if idx is None:
+            idx = self.strings[string] = len(self.strings)
+        return idx
+
+    def tzinfo(self, tzinfo: Optional[dt.tzinfo]) -> int:
+        if tzinfo is None:
+            return _NONE
+        idx = self.tzinfos.get(tzinfo)
+        if idx is None:
+            if isinstance(tzinfo, zoneinfo.ZoneInfo) and tzinfo.key is not None:
+                token = "zoneinfo:" + tzinfo.key
+            elif isinstance(tzinfo, dt.timezone):
+                token = f"offset:{_micros(cast(dt.timedelta, tzinfo.utcoffset(None)))}"
+            else:
+                raise SchedulerError(SNAPSHOT_ERROR_MSG)
+            idx = self.tzinfos[tzinfo] = self.string(token)
+        return idx
+
+    def calendar(self, calendar: Optional[HolidayCalendar]) -> int:
+        """Encode the weekend and the holiday ordinals of a |HolidayCalendar| once."""
+        if calendar is None:
+            return _NONE
+        entry = self.calendars.get(id(calendar))
+        if entry is None:
+            ordinals = ",".join(str(day.toordinal()) for day in calendar.holidays)
+            token = "".join(map(str, calendar.weekend)) + ":" + ordinals
+            entry = self.calendars[id(calendar)] = (calendar, self.string(token))
+        return entry[1]
+
+    def datetime(self, datetime: dt.datetime) -> tuple[int, int]:
+        """Encode the wall time and the fold of a `datetime.datetime` and its timezone."""
+        # shared datetime objects are encoded once, the entry keeps the object alive
+        entry = self.datetimes.get(id(datetime))
+        if entry is None:
+            micros = _micros(datetime.replace(tzinfo=None) - _EPOCH)
+            entry = (datetime, micros << 1 | datetime.fold, self.tzinfo(datetime.tzinfo))
+            self.datetimes[id(datetime)] = entry
+        return entry[1], entry[2]
+
+    def pack_strings(self) -> bytes:
+        data = [string.encode() for string in self.strings]
+        offsets = [0]
+        for encoded in data:
+            offsets.append(offsets[-1] + len(encoded))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(data)
+
+
+def _import_path(handle: Callable[..., Any]) -> str:
+    """Get the import path of a handle, raise if it doesn't resolve to the handle."""
+    try:
+        path = f"{handle.__module__}:{handle.__qualname__}"
+        resolved = _resolve(path)
+    except Exception as err:  # pylint: disable=broad-except
+        raise SchedulerError(SNAPSHOT_ERROR_MSG) from err
+    if resolved is not handle:
+        raise SchedulerError(SNAPSHOT_ERROR_MSG)
+    return path
+
+
+def _resolve(path: str) -> Any:
+    module, qualname = path.split(":")
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _import_handle(path: str) -> Any:
+    """Import the handle of a snapshot, raise if it was renamed or moved since."""
+    try:
+        return _resolve(path)
+    except Exception as err:  # pylint: disable=broad-except
+        raise SchedulerError(SNAPSHOT_HANDLE_ERROR_MSG.format(path)) from err
+
+
+@contextlib.contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while many objects are created.
+
+    Otherwise every collection of the oldest generation traverses the growing
+    heap again. Nested pauses are resumed by the outermost one.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _parse_tzinfo(token: str) -> dt.tzinfo:
+    kind, value = token.split(":", 1)
+    if kind == "zoneinfo":
+        return zoneinfo.ZoneInfo(value)
+    return dt.timezone(dt.timedelta(microseconds=int(value)))
+
+
+def _timing_key(encoder: _Encoder, elem: Any) -> tuple[int, int, int, int, int]:
+    """Encode a timing element to a record of the timing table."""
+    if isinstance(elem, dt.timedelta):
+        return (_TIMEDELTA, _micros(elem), _NONE, _NONE, _NONE)
+    if isinstance(elem, Weekday):
+        time = elem.time
+        return (_WEEKDAY, _time_micros(time), elem.value, encoder.tzinfo(time.tzinfo), _NONE)
+    if isinstance(elem, Cron):
+        expression = encoder.string(elem.expression)
+        return (_CRON, expression, _NONE, encoder.tzinfo(elem.tzinfo), _NONE)
+    if isinstance(elem, Monthly):
+        micros, tz_idx = _time_micros(elem.time), encoder.tzinfo(elem.tzinfo)
+        return (_MONTHLY, micros, elem.day, tz_idx, encoder.calendar(elem.calendar))
+    if isinstance(elem, BusinessDay):
+        micros, tz_idx = _time_micros(elem.time), encoder.tzinfo(elem.tzinfo)
+        return (_BUSINESS_DAY, micros, _NONE, tz_idx, encoder.calendar(elem.calendar))
+    return (_TIME, _time_micros(elem), _NONE, encoder.tzinfo(elem.tzinfo), _NONE)
+
+
+def write_snapshot(path: Union[str, os.PathLike[str]], jobs: Iterable[BaseJobType]) -> int:
+    r"""
+    Write |BaseJob|\ s to a snapshot file.
+
+    The file is written to a temporary file first and replaces `path` at once.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        Path of the snapshot file.
+    jobs : Iterable[BaseJob]
+        |BaseJob|\ s to write.
+
+    Returns
+    -------
+    int
+        Number of written |BaseJob|\ s.
+
+    Raises
+    ------
+    SchedulerError
+        If a handle is not importable by its qualified name, the args or kwargs
+        are not picklable or a timezone is not supported.
+    """
+    encoder = _Encoder()
+    handles: dict[int, int] = {}
+    timings: dict[tuple[int, int, int, int, int], int] = {}
+    job_rows = []
+    timer_rows = []
+    tag_rows = []
+    payload = []
+    payload_size = 0
+
+    with paused_gc():
+        for job in jobs:
+            # pylint: disable=protected-access
+            definition = job._definition()
+            attempts, failed_attempts, skipped_executions, datetimes = job._state()
+            handle = definition["handle"]
+            handle_idx = handles.get(id(handle))
+            if handle_idx is None:
+                handle_idx = handles[id(handle)] = encoder.string(_import_path(handle))
+
+            first_timer = len(timer_rows)
+            for elem, datetime in zip(definition["timing"], datetimes):
+                key = _timing_key(encoder, elem)
+                timing_idx = timings.setdefault(key, len(timings))
+                timer_rows.append((timing_idx, *encoder.datetime(datetime)))
+
+            first_tag = len(tag_rows)
+            tag_rows.extend(encoder.string(tag) for tag in sorted(definition["tags"] or ()))
+
+            payload_offset = payload_size
+            if definition["args"] or definition["kwargs"]:
+                try:
+                    data = pickle.dumps((definition["args"], definition["kwargs"]))
+                except Exception as err:  # pylint: disable=broad-except
+                    raise SchedulerError(SNAPSHOT_ERROR_MSG) from err
+                payload.append(data)
+                payload_size += len(data)
+
+            flags = (
+                (_DELAY if definition["delay"] else 0)
+                | (_SKIP_MISSING if definition["skip_missing"] else 0)
+                | (_STOP if definition["stop"] is not None else 0)
+                | (_MISFIRE_GRACE if definition["misfire_grace"] is not None else 0)
+                | (_JITTER if definition["jitter"] is not None else 0)
+            )
+            stop, stop_tz = 0, _NONE
+            if definition["stop"] is not None:
+                stop, stop_tz = encoder.datetime(definition["stop"])
+            misfire = definition["misfire"]
+            misfire_grace = definition["misfire_grace"]
+            jitter = definition["jitter"]
+            job_rows.append(
+                _JOB.pack(
+                    definition["job_type"].value,
+                    flags,
+                    0 if misfire is None else misfire.value,
+                    definition["max_attempts"],
+                    attempts,
+                    failed_attempts,
+                    skipped_executions,
+                    handle_idx,
+                    encoder.string(definition["alias"]),
+                    encoder.tzinfo(definition["tzinfo"]),
+                    *encoder.datetime(definition["start"]),
+                    stop,
+                    stop_tz,
+                    0 if misfire_grace is None else _micros(misfire_grace),
+                    definition["weight"],
+                    0 if jitter is None else _micros(jitter),
+                    first_timer,
+                    len(timer_rows) - first_timer,
+                    first_tag,
+                    len(tag_rows) - first_tag,
+                    payload_offset,
+                    payload_size - payload_offset,
+                )
+            )
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        len(encoder.strings),
+        len(timings),
+        len(job_rows),
+        len(timer_rows),
+        len(tag_rows),
+        payload_size,
+    )
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(header)
+        file.write(encoder.pack_strings())
+        file.write(b"".join(_TIMING.pack(*key) for key in timings))
+        file.write(b"".join(job_rows))
+        file.write(b"".join(_TIMER.pack(*row) for row in timer_rows))
+        file.write(struct.pack(f"<{len(tag_rows)}I", *tag_rows))
+        file.write(b"".join(payload))
+    os.replace(tmp_path, path)
+    return len(job_rows)
+
+
+def _time_micros(time: dt.time) -> int:
+    return ((time.hour * 60 + time.minute) * 60 + time.second) * 1_000_000 + time.microsecond
+
+
+def read_snapshot(
+    path: Union[str, os.PathLike[str]], job_class: type[BaseJobType]
+) -> list[BaseJobType]:
+    r"""
+    Read the |BaseJob|\ s of a snapshot file.
+
+    The file is memory mapped and every table is unpacked at once. Timing
+    elements, handles and timezones are decoded once and shared by all
+    |BaseJob|\ s referring to them, the |BaseJob|\ s are recreated without
+    running their validation and timer calculations.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        Path of the snapshot file.
+    job_class : type[BaseJob]
+        Class the |BaseJob|\ s are recreated as.
+
+    Returns
+    -------
+    list[BaseJob]
+        The |BaseJob|\ s in the order they were written.
+
+    Raises
+    ------
+    SchedulerError
+        If the file is not a snapshot of a compatible version or a handle
+        can't be imported.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < _HEADER.size:
+            raise SchedulerError(SNAPSHOT_FORMAT_ERROR_MSG)
+        buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    # the tables are unpacked from views of the mapped file without copying them
+    sections: list[memoryview] = []
+    try:
+        with memoryview(buf) as view:
+            sections.extend(_sections(view))
+        return _decode(job_class, *sections)
+    finally:
+        for section in sections:
+            section.release()
+        # a view referenced by a traceback closes the mapping once it is collected
+        with contextlib.suppress(BufferError):
+            buf.close()
+
+
+def _sections(view: memoryview) -> list[memoryview]:
+    """Split a snapshot into the views of the string data and of the tables."""
+    magic, version, n_strings, n_timings, n_jobs, n_timers, n_tags, payload_size = (
+        _HEADER.unpack_from(view)
+    )
+    if magic != _MAGIC or version != _VERSION:
+        raise SchedulerError(SNAPSHOT_FORMAT_ERROR_MSG)
+    pos = _HEADER.size
+    last_offset = pos + n_strings * _OFFSET.size
+    if last_offset + _OFFSET.size > len(view):
+        raise SchedulerError(SNAPSHOT_FORMAT_ERROR_MSG)
+    sections = []
+    for size in (
+        (n_strings + 1) * _OFFSET.size,
+        _OFFSET.unpack_from(view, last_offset)[0],
+        n_timings * _TIMING.size,
+        n_jobs * _JOB.size,
+        n_timers * _TIMER.size,
+        n_tags * _OFFSET.size,
+        payload_size,
+    ):
+        if pos + size > len(view):
+            raise SchedulerError(SNAPSHOT_FORMAT_ERROR_MSG)
+        sections.append(view[pos : pos + size])
+        pos += size
+    return sections
+
+
+def _decode(
+    job_class: type[BaseJobType],
+    offset_data: memoryview,
+    string_data: memoryview,
+    timing_data: memoryview,
+    job_data: memoryview,
+    timer_data: memoryview,
+    tag_data: memoryview,
+    payload: memoryview,
+) -> list[BaseJobType]:
+    r"""Recreate the |BaseJob|\ s of the sections of a snapshot."""
+    offsets = [offset for (offset,) in _OFFSET.iter_unpack(offset_data)]
+    strings = [str(string_data[begin:end], "utf-8") for begin, end in zip(offsets, offsets[1:])]
+    with paused_gc():
+        decoder = _Decoder(strings)
+        timings: list[Any] = []
+        for kind, micros, weekday_value, tz_idx, calendar_idx in _TIMING.iter_unpack(timing_data):
+            if kind == _TIMEDELTA:
+                timings.append(dt.timedelta(microseconds=micros))
+                continue
+            if kind == _CRON:
+                timings.append(Cron(strings[micros], decoder.tzinfo(tz_idx)))
+                continue
+            time = (_EPOCH + dt.timedelta(microseconds=micros)).time()
+            time = time.replace(tzinfo=decoder.tzinfo(tz_idx))
+            if kind == _MONTHLY:
+                timings.append(Monthly(weekday_value, time, decoder.calendar(calendar_idx)))
+            elif kind == _BUSINESS_DAY:
+                timings.append(BusinessDay(time, decoder.calendar(calendar_idx)))
+            else:
+                timings.append(time if kind == _TIME else weekday(weekday_value, time))
+
+        timer_rows = list(_TIMER.iter_unpack(timer_data))
+        timer_timings = [timings[timing_idx] for timing_idx, _, _ in timer_rows]
+        timer_datetimes = [decoder.datetime(value, tz_idx) for _, value, tz_idx in timer_rows]
+        tags = [strings[idx] for (idx,) in _OFFSET.iter_unpack(tag_data)]
+
+        return _create_jobs(
+            job_class, job_data, decoder, timer_timings, timer_datetimes, tags, payload
+        )
+
+
+class _Decoder:
+    """Decode every referenced timezone, calendar and datetime of a snapshot once."""
+
+    def __init__(self, strings: list[str]) -> None:
+        self.strings = strings
+        self.tzinfos: dict[int, Optional[dt.tzinfo]] = {_NONE: None}
+        self.datetimes: dict[tuple[int, int], dt.datetime] = {}
+        self.calendars: dict[int, Optional[HolidayCalendar]] = {_NONE: None}
+
+    def tzinfo(self, idx: int) -> Optional[dt.tzinfo]:
+        if idx not in self.tzinfos:
+            self.tzinfos[idx] = _parse_tzinfo(self.strings[idx])
+        return self.tzinfos[idx]
+
+    def calendar(self, idx: int) -> Optional[HolidayCalendar]:
+        if idx not in self.calendars:
+            weekend, _, ordinals = self.strings[idx].partition(":")
+            holidays = [dt.date.fromordinal(int(day)) for day in ordinals.split(",") if day]
+            self.calendars[idx] = HolidayCalendar(holidays, map(int, weekend))
+        return self.calendars[idx]
+
+    def datetime(self, value: int, tz_idx: int) -> dt.datetime:
+        # equal datetimes are shared, they are immutable
+        datetime = self.datetimes.get((value, tz_idx))
+        if datetime is None:
+            datetime = _EPOCH + dt.timedelta(microseconds=value >> 1)
+            if tz_idx != _NONE or value & 1:
+                datetime = datetime.replace(tzinfo=self.tzinfo(tz_idx), fold=value & 1)
+            self.datetimes[value, tz_idx] = datetime
+        return datetime
+
+
+def _create_jobs(
+    job_class: type[BaseJobType],
+    job_data: memoryview,
+    decoder: _Decoder,
+    timer_timings: list[Any],
+    timer_datetimes: list[dt.datetime],
+    tags: list[str],
+    payload: memoryview,
+) -> list[BaseJobType]:
+    r"""Recreate the |BaseJob|\ s of the unpacked job table."""
+    strings = decoder.strings
+    handles: dict[int, Any] = {}
+    jobs = []
+    restore = job_class._restored  # pylint: disable=protected-access
+    for (
+        job_type,
+        flags,
+        misfire,
+        max_attempts,
+        attempts,
+        failed_attempts,
+        skipped_executions,
+        handle_idx,
+        alias_idx,
+        tz_idx,
+        start,
+        start_tz,
+        stop,
+        stop_tz,
+        misfire_grace,
+        weight,
+        jitter,
+        first_timer,
+        n_job_timers,
+        first_tag,
+        n_job_tags,
+        payload_offset,
+        n_payload,
+    ) in _JOB.iter_unpack(job_data):
+        handle = handles.get(handle_idx)
+        if handle is None:
+            handle = handles[handle_idx] = _import_handle(strings[handle_idx])
+        args: tuple[Any, ...] = ()
+        kwargs: dict[str, Any] = {}
+        if n_payload:
+            args, kwargs = pickle.loads(payload[payload_offset : payload_offset + n_payload])
+        end_timer = first_timer + n_job_timers
+        definition = {
+            "job_type": _JOB_TYPES[job_type],
+            "timing": timer_timings[first_timer:end_timer],
+            "handle": handle,
+            "args": args,
+            "kwargs": kwargs,
+            "max_attempts": max_attempts,
+            "tags": tags[first_tag : first_tag + n_job_tags],
+            "delay": bool(flags & _DELAY),
+            "start": decoder.datetime(start, start_tz),
+            "stop": decoder.datetime(stop, stop_tz) if flags & _STOP else None,
+            "skip_missing": bool(flags & _SKIP_MISSING),
+            "alias": None if alias_idx == _NONE else strings[alias_idx],
+            "tzinfo": decoder.tzinfo(tz_idx),
+            "misfire": _MISFIRES.get(misfire),
+            "misfire_grace": (
+                dt.timedelta(microseconds=misfire_grace) if flags & _MISFIRE_GRACE else None
+            ),
+            "weight": weight,
+            "jitter": dt.timedelta(microseconds=jitter) if flags & _JITTER else None,
+        }
+        state = (
+            attempts,
+            failed_attempts,
+            skipped_executions,
+            tuple(timer_datetimes[first_timer:end_timer]),
+        )
+        jobs.append(restore(definition, state))
+    return jobs
+
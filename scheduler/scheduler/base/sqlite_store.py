@@ -0,0 +1,308 @@
+r"""
+Job store persisting `BaseJob`\ s in a SQLite database.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from scheduler.base.job import BaseJobType
+from scheduler.base.job_store import BaseJobStore
+from scheduler.error import SchedulerError
+from scheduler.message import JOB_STORE_PICKLE_ERROR_MSG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    next_exec REAL NOT NULL,
+    definition BLOB NOT NULL,
+    state BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_next_exec ON jobs (next_exec);
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO jobs (id, next_exec, definition, state) VALUES (?, ?, ?, ?)"
+_UPDATE = "UPDATE jobs SET next_exec = ?, state = ? WHERE id = ?"
+_DELETE = "DELETE FROM jobs WHERE id = ?"
+_SELECT_DUE = (
+    "SELECT id, definition, state FROM jobs WHERE next_exec > ? AND next_exec <= ? "
+    "ORDER BY next_exec"
+)
+
+
+def _dump_definition(job: BaseJobType) -> bytes:
+    """Serialize the definition of a |BaseJob|, raise if it is not picklable."""
+    try:
+        return pickle.dumps(
+            job._definition(), pickle.HIGHEST_PROTOCOL  # pylint: disable=protected-access
+        )
+    except Exception as err:  # pylint: disable=broad-except
+        raise SchedulerError(JOB_STORE_PICKLE_ERROR_MSG) from err
+
+
+def _dump_state(job: BaseJobType) -> bytes:
+    """Serialize the execution state of a |BaseJob|."""
+    return pickle.dumps(job._state(), pickle.HIGHEST_PROTOCOL)  # pylint: disable=protected-access
+
+
+# positions in a buffered row `[next_exec, definition, state]`
+_DEFINITION = 1
+
+
+class SQLiteJobStore(BaseJobStore[BaseJobType]):
+    r"""
+    Store |BaseJob|\ s in a SQLite database of the standard library.
+
+    The definition of a |BaseJob| is written once, an execution only rewrites
+    the small state row. Writes are buffered and coalesced per |BaseJob|, a
+    full buffer is written in a single transaction to a database in
+    write-ahead logging mode. The pending execution is indexed, such that a
+    `load` only reads and deserializes the rows due within the requested range.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        Path of the database file, created if missing.
+    batch_size : int
+        Number of buffered writes triggering a flush.
+    flush_interval : datetime.timedelta
+        Maximum age of a buffered write before a non forced `flush` persists it.
+
+    Notes
+    -----
+    The handle of a |BaseJob| is stored by reference, it has to be importable
+    by its qualified name, like a function at module level.
+    """
+
+    __lock: threading.Lock
+    __connection: sqlite3.Connection
+    __batch_size: int
+    __flush_interval: float
+    __ids: dict[BaseJobType, int]
+    __next_id: int
+    __rows: dict[int, list[Any]]
+    __deleted: set[int]
+    __first_write: Optional[float]
+    __loaded_until: float
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        batch_size: int = 256,
+        flush_interval: dt.timedelta = dt.timedelta(seconds=1),
+    ):
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(_SCHEMA)
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval.total_seconds()
+        self.__ids = {}
+        (max_id,) = self.__connection.execute("SELECT COALESCE(MAX(id), 0) FROM jobs").fetchone()
+        self.__next_id = max_id + 1
+        self.__rows = {}
+        self.__deleted = set()
+        self.__first_write = None
+        self.__loaded_until = float("-inf")
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__write()
+            (n_rows,) = self.__connection.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            return int(n_rows)
+
+    def add(self, job: BaseJobType) -> None:
+        """
+        Store the definition and the state of a |BaseJob|.
+
+        The definition is serialized immediately, an already stored |BaseJob|
+        is replaced.
+
+        Raises
+        ------
+        SchedulerError
+            If the handle is not importable or the arguments are not picklable.
+        """
+        definition = _dump_definition(job)
+        state = _dump_state(job)
+        with self.__lock:
+            self.__buffer(self.__row_id(job), [job.datetime.timestamp(), definition, state])
+
+    def add_many(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""
+        Store the definitions and the states of many |BaseJob|\ s in one transaction.
+
+        All |BaseJob|\ s are serialized before the first write, either all or
+        none of them are stored.
+
+        Raises
+        ------
+        SchedulerError
+            If a handle is not importable or the arguments are not picklable.
+        """
+        rows = [(job, _dump_definition(job), _dump_state(job)) for job in jobs]
+        if not rows:
+            return
+        with self.__lock:
+            # the buffered writes must not be discarded with the new ones
+            self.__write()
+            known = set(self.__ids)
+            try:
+                for job, definition, state in rows:
+                    row_id = self.__row_id(job)
+                    self.__rows[row_id] = [job.datetime.timestamp(), definition, state]
+                self.__write()
+            except BaseException:
+                self.__rows.clear()
+                for job, _, _ in rows:
+                    if job not in known:
+                        self.__ids.pop(job, None)
+                raise
+
+    def update(self, job: BaseJobType) -> None:
+        """Store the state of a |BaseJob| after an execution, unknown ones are ignored."""
+        state = _dump_state(job)
+        with self.__lock:
+            row_id = self.__ids.get(job)
+            if row_id is None:
+                return
+            row = self.__rows.get(row_id)
+            # keep a buffered definition, it has not been written yet
+            definition = None if row is None else row[_DEFINITION]
+            self.__buffer(row_id, [job.datetime.timestamp(), definition, state])
+
+    def remove(self, job: BaseJobType) -> None:
+        """Remove a |BaseJob| from the store, unknown ones are ignored."""
+        with self.__lock:
+            row_id = self.__ids.pop(job, None)
+            if row_id is None:
+                return
+            self.__rows.pop(row_id, None)
+            self.__deleted.add(row_id)
+            self.__flush_full()
+
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s including the ones not loaded yet."""
+        with self.__lock:
+            self.__ids.clear()
+            self.__rows.clear()
+            self.__deleted.clear()
+            self.__first_write = None
+            self.__connection.execute("DELETE FROM jobs")
+
+    def load(self, until: dt.datetime, job_class: type[BaseJobType]) -> list[BaseJobType]:
+        r"""
+        Load the stored |BaseJob|\ s due not later than `until`.
+
+        Only the index range between the previous and the current `until` is
+        read, every stored |BaseJob| is therefore deserialized at most once.
+
+        Parameters
+        ----------
+        until : datetime.datetime
+            Upper bound of the pending executions to load.
+        job_class : type[BaseJob]
+            Class the stored |BaseJob|\ s are recreated as.
+
+        Returns
+        -------
+        list[BaseJob]
+            Newly loaded |BaseJob|\ s ordered by their pending execution.
+        """
+        bound = until.timestamp()
+        with self.__lock:
+            if bound <= self.__loaded_until:
+                return []
+            self.__write()
+            rows = self.__connection.execute(_SELECT_DUE, (self.__loaded_until, bound)).fetchall()
+            self.__loaded_until = bound
+            known = set(self.__ids.values())
+            jobs = []
+            for row_id, definition, state in rows:
+                if row_id in known:
+                    continue
+                # pylint: disable-next=protected-access
+                job = job_class._restored(pickle.loads(definition), pickle.loads(state))
+                self.__ids[job] = row_id
+                jobs.append(job)
+            return jobs
+
+    def flush(self, force: bool = True) -> None:
+        """
+        Persist the buffered writes.
+
+        Parameters
+        ----------
+        force : bool
+            If ``False`` the writes are only persisted if the buffer is full
+            or its oldest write exceeds the flush interval.
+        """
+        with self.__lock:
+            if force:
+                self.__write()
+            else:
+                self.__flush_full()
+
+    def close(self) -> None:
+        """Flush the buffered writes and close the database."""
+        with self.__lock:
+            self.__write()
+            self.__connection.close()
+
+    def __row_id(self, job: BaseJobType) -> int:
+        """Get the row of a |BaseJob|, a new one is assigned to an unknown |BaseJob|."""
+        row_id = self.__ids.get(job)
+        if row_id is None:
+            row_id = self.__ids[job] = self.__next_id
+            self.__next_id += 1
+        return row_id
+
+    def __buffer(self, row_id: int, row: list[Any]) -> None:
+        self.__rows[row_id] = row
+        self.__flush_full()
+
+    def __flush_full(self) -> None:
+        """Write the buffer if it is full or its oldest write exceeds the flush interval."""
+        n_pending = len(self.__rows) + len(self.__deleted)
+        if not n_pending:
+            return
+        now = time.monotonic()
+        if self.__first_write is None:
+            self.__first_write = now
+        if n_pending >= self.__batch_size or now - self.__first_write >= self.__flush_interval:
+            self.__write()
+
+    def __write(self) -> None:
+        """Write the buffer in a single transaction."""
+        if not self.__rows and not self.__deleted:
+            return
+        upserts = []
+        updates = []
+        for row_id, (next_exec, definition, state) in self.__rows.items():
+            if definition is None:
+                updates.append((next_exec, state, row_id))
+            else:
+                upserts.append((row_id, next_exec, definition, state))
+        connection = self.__connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(_DELETE, [(row_id,) for row_id in self.__deleted])
+            connection.executemany(_UPSERT, upserts)
+            connection.executemany(_UPDATE, updates)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        self.__rows.clear()
+        self.__deleted.clear()
+        self.__first_write = None
@@ -0,0 +1,266 @@
+r"""
+Streaming execution statistics of `BaseJob`\ s and schedulers.
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime as dt
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Callable, Optional
+
+# sub-buckets per power of two as power of two, the relative error is below 1 / 2**_SUB_BITS
+_SUB_BITS = 3
+# values below are counted exactly
+_LINEAR = 1 << (_SUB_BITS + 1)
+
+# job, lag in nanoseconds, duration in nanoseconds, success
+ExecutionHook = Callable[[Any, int, int, bool], None]
+
+
+def timedelta_ns(delta: dt.timedelta) -> int:
+    """Convert a `datetime.timedelta` to integer nanoseconds."""
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+def bucket_bounds(idx: int) -> tuple[int, int]:
+    """Get the inclusive lower and upper bound of the values counted in a bucket."""
+    if idx < _LINEAR:
+        return idx, idx
+    shift = (idx >> _SUB_BITS) - 1
+    mantissa = idx - (shift << _SUB_BITS)
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Log-bucketed streaming histogram of non-negative integers.
+
+    Every power of two is split into ``2 ** 3`` sub-buckets like in a HDR
+    histogram, the relative error of every quantile is below 12.5%. Only the
+    occupied buckets are stored, recording a value is O(1) and allocates nothing
+    but the first count of a bucket. The count and the minimum are derived from
+    the buckets on demand, the maximum is exact.
+
+    Notes
+    -----
+    Negative values are counted as zero.
+    """
+
+    __slots__ = ("__counts", "__sum", "__max")
+
+    __counts: dict[int, int]
+    __sum: int
+    __max: int
+
+    def __init__(self) -> None:
+        self.__counts = {}
+        self.__sum = 0
+        self.__max = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"Histogram(count={self.count}, min={self.min}, "
+            f"p50={self.quantile(0.5)}, p99={self.quantile(0.99)}, max={self.__max})"
+        )
+
+    def record(self, value: int) -> None:
+        """Count a value."""
+        if value < _LINEAR:
+            if value < 0:
+                value = 0
+            idx = value
+        else:
+            shift = value.bit_length() - _SUB_BITS - 1
+            idx = (shift << _SUB_BITS) + (value >> shift)
+        counts = self.__counts
+        counts[idx] = counts.get(idx, 0) + 1
+        self.__sum += value
+        if value > self.__max:
+            self.__max = value
+
+    def merge(self, other: Histogram) -> None:
+        """Add the counts of another |Histogram|."""
+        counts = self.__counts
+        # copied at once, the other histogram may be recorded to concurrently
+        for idx, count in list(other.__counts.items()):
+            counts[idx] = counts.get(idx, 0) + count
+        self.__sum += other.__sum
+        self.__max = max(self.__max, other.__max)
+
+    def copy(self) -> Histogram:
+        """Get an independent copy."""
+        histogram = Histogram()
+        histogram.merge(self)
+        return histogram
+
+    def quantile(self, quantile: float) -> int:
+        """
+        Estimate a quantile.
+
+        Parameters
+        ----------
+        quantile : float
+            Quantile between ``0`` and ``1``.
+
+        Returns
+        -------
+        int
+            Upper bound of the bucket containing the quantile, ``0`` if empty.
+        """
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for upper, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(upper, self.__max)
+        return self.__max
+
+    def buckets(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterate the occupied buckets in ascending order.
+
+        Returns
+        -------
+        Iterator[tuple[int, int]]
+            Inclusive upper bound and count of every occupied bucket.
+        """
+        for idx in sorted(self.__counts):
+            yield bucket_bounds(idx)[1], self.__counts[idx]
+
+    def cumulative(self, bounds: Sequence[int]) -> list[int]:
+        """
+        Count the recorded values up to every bound.
+
+        A bucket is counted at the first bound not lower than its upper bound,
+        a value is therefore at most counted at the next higher bound.
+
+        Parameters
+        ----------
+        bounds : Sequence[int]
+            Ascending upper bounds.
+
+        Returns
+        -------
+        list[int]
+            Cumulative count for every bound.
+        """
+        counts = [0] * len(bounds)
+        for upper, count in self.buckets():
+            pos = bisect.bisect_left(bounds, upper)
+            if pos < len(counts):
+                counts[pos] += count
+        return list(itertools.accumulate(counts))
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return sum(self.__counts.values())
+
+    @property
+    def sum(self) -> int:
+        """Sum of the recorded values."""
+        return self.__sum
+
+    @property
+    def min(self) -> int:
+        """Lower bound of the lowest occupied bucket, ``0`` if empty."""
+        return bucket_bounds(min(self.__counts))[0] if self.__counts else 0
+
+    @property
+    def max(self) -> int:
+        """Largest recorded value, ``0`` if empty."""
+        return self.__max
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values, ``0`` if empty."""
+        count = self.count
+        return self.__sum / count if count else 0.0
+
+
+class ExecutionStats:
+    r"""
+    Statistics of the executions of a |BaseJob| or of all |BaseJob|\ s of a scheduler.
+
+    The scheduling lag is the actual start of an execution minus its planned
+    `datetime.datetime`, the duration is the run time of the callback function.
+    Both are recorded in nanoseconds.
+    """
+
+    __slots__ = ("__lag", "__duration", "__successes", "__failures")
+
+    __lag: Histogram
+    __duration: Histogram
+    __successes: int
+    __failures: int
+
+    def __init__(self) -> None:
+        self.__lag = Histogram()
+        self.__duration = Histogram()
+        self.__successes = 0
+        self.__failures = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExecutionStats(successes={self.__successes}, failures={self.__failures}, "
+            f"lag={self.__lag!r}, duration={self.__duration!r})"
+        )
+
+    def record(self, lag: int, duration: int, success: bool) -> None:
+        """Count an execution with its lag and duration in nanoseconds."""
+        self.__lag.record(lag)
+        self.__duration.record(duration)
+        if success:
+            self.__successes += 1
+        else:
+            self.__failures += 1
+
+    def merge(self, other: ExecutionStats) -> None:
+        """Add the executions of other |ExecutionStats|."""
+        self.__lag.merge(other.__lag)
+        self.__duration.merge(other.__duration)
+        self.__successes += other.__successes
+        self.__failures += other.__failures
+
+    def copy(self) -> ExecutionStats:
+        """Get an independent copy."""
+        stats = ExecutionStats()
+        stats.merge(self)
+        return stats
+
+    @property
+    def lag(self) -> Histogram:
+        """Scheduling lag in nanoseconds."""
+        return self.__lag
+
+    @property
+    def duration(self) -> Histogram:
+        """Run time of the callback function in nanoseconds."""
+        return self.__duration
+
+    @property
+    def successes(self) -> int:
+        """Number of executions without an exception."""
+        return self.__successes
+
+    @property
+    def failures(self) -> int:
+        """Number of executions raising an exception."""
+        return self.__failures
+
+    @property
+    def executions(self) -> int:
+        """Number of executions."""
+        return self.__successes + self.__failures
+
+
+def merged_stats(stats: Iterable[Optional[ExecutionStats]]) -> ExecutionStats:
+    """Merge |ExecutionStats|, missing ones are skipped."""
+    total = ExecutionStats()
+    for elem in stats:
+        if elem is not None:
+            total.merge(elem)
+    return total
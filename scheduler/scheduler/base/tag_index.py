@@ -0,0 +1,67 @@
+r"""
+Inverted index from tags to the `BaseJob`\ s carrying them.
+
+"""
+
+from __future__ import annotations
+
+from typing import Generic
+
+from scheduler.base.job import BaseJobType
+
+
+class TagIndex(Generic[BaseJobType]):
+    r"""
+    Map every tag to the set of |BaseJob|\ s carrying it.
+
+    A query only touches the posting sets of the requested tags instead of
+    scanning all |BaseJob|\ s. Matching any tag is the union of the posting
+    sets, matching all tags is their intersection, starting from the smallest.
+    """
+
+    __postings: dict[str, set[BaseJobType]]
+
+    def __init__(self) -> None:
+        self.__postings = {}
+
+    def add(self, job: BaseJobType) -> None:
+        """Index the tags of a |BaseJob|."""
+        for tag in job._tags:  # pylint: disable=protected-access
+            self.__postings.setdefault(tag, set()).add(job)
+
+    def discard(self, job: BaseJobType) -> None:
+        """Remove a |BaseJob| from the index if it is indexed."""
+        for tag in job._tags:  # pylint: disable=protected-access
+            posting = self.__postings.get(tag)
+            if posting is None:
+                continue
+            posting.discard(job)
+            if not posting:
+                del self.__postings[tag]
+
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s."""
+        self.__postings.clear()
+
+    def select(self, tags: set[str], any_tag: bool) -> set[BaseJobType]:
+        r"""
+        Get the |BaseJob|\ s matching the given tags.
+
+        Parameters
+        ----------
+        tags : set[str]
+            Non-empty set of tags.
+        any_tag : bool
+            False: To match a |BaseJob| all tags have to match.
+            True: To match a |BaseJob| at least one tag has to match.
+
+        Returns
+        -------
+        set[BaseJob]
+            Matching |BaseJob|\ s.
+        """
+        postings = [self.__postings.get(tag, set()) for tag in tags]
+        if any_tag:
+            return set().union(*postings)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
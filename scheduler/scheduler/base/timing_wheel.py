@@ -0,0 +1,270 @@
+r"""
+Hierarchical timing wheel of `BaseJob`\ s for huge numbers of short timeouts.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+from scheduler.base.job import BaseJobType
+from scheduler.base.job_queue import BaseJobQueue
+from scheduler.error import SchedulerError
+from scheduler.message import TIMING_WHEEL_ERROR_MSG
+
+# level of the expired and the overflow container in an entry
+_EXPIRED = -1
+
+# positions in an entry `[tick, level, container, datetime, counter]`
+_TICK = 0
+_LEVEL = 1
+_CONTAINER = 2
+_DATETIME = 3
+_COUNTER = 4
+
+
+class TimingWheel(BaseJobQueue[BaseJobType]):
+    r"""
+    Hierarchical timing wheel of |BaseJob|\ s as alternative to the |JobQueue|.
+
+    The datetimes are discretized into ticks of `resolution`. Every level is a
+    ring of ``2 ** slot_bits`` slots, a slot of level ``L`` spans
+    ``2 ** (slot_bits * L)`` ticks. A |BaseJob| is stored in the lowest level
+    its tick shares the enclosing span with the current tick, such that insertion
+    and cancellation are O(1) set operations. When the current tick enters a new
+    span, the slot of that span is redistributed to the lower levels. Ticks
+    beyond the highest level are kept in an overflow set.
+
+    Parameters
+    ----------
+    resolution : datetime.timedelta
+        Duration of a tick.
+    slot_bits : int
+        Number of slots per level as power of two.
+    levels : int
+        Number of levels.
+
+    Notes
+    -----
+    |BaseJob|\ s of the current tick are ordered exactly by their datetime.
+    Advancing over empty levels is skipped, the cost of `due` depends on the
+    number of expired |BaseJob|\ s and not on the elapsed time.
+    """
+
+    __resolution: dt.timedelta
+    __bits: int
+    __mask: int
+    __n_levels: int
+    __wheels: list[list[set[BaseJobType]]]
+    __counts: list[int]
+    __overflow: set[BaseJobType]
+    __expired: set[BaseJobType]
+    __entries: dict[BaseJobType, list[Any]]
+    __epoch: Optional[dt.datetime]
+    __now: int
+    __counter: Iterator[int]
+
+    def __init__(
+        self,
+        resolution: dt.timedelta = dt.timedelta(milliseconds=10),
+        slot_bits: int = 8,
+        levels: int = 4,
+    ):
+        if resolution <= dt.timedelta() or slot_bits < 1 or levels < 1:
+            raise SchedulerError(TIMING_WHEEL_ERROR_MSG)
+        self.__resolution = resolution
+        self.__bits = slot_bits
+        self.__mask = (1 << slot_bits) - 1
+        self.__n_levels = levels
+        self.__wheels = [[set() for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.__counts = [0] * levels
+        self.__overflow = set()
+        self.__expired = set()
+        self.__entries = {}
+        self.__epoch = None
+        self.__now = 0
+        self.__counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, job: object) -> bool:
+        return job in self.__entries
+
+    def __iter__(self) -> Iterator[BaseJobType]:
+        return iter(list(self.__entries))
+
+    def push(self, job: BaseJobType) -> None:
+        """Insert a |BaseJob| in O(1), an already queued |BaseJob| is repositioned."""
+        if job in self.__entries:
+            self.__detach(job)
+        datetime = job.datetime
+        entry = [self.__tick(datetime), 0, None, datetime, next(self.__counter)]
+        self.__entries[job] = entry
+        self.__place(job, entry)
+
+    def extend(self, jobs: Iterable[BaseJobType]) -> None:
+        r"""Insert many |BaseJob|\ s in O(1) each."""
+        for job in jobs:
+            self.push(job)
+
+    def remove(self, job: BaseJobType) -> None:
+        """
+        Remove a queued |BaseJob| in O(1).
+
+        Raises
+        ------
+        KeyError
+            If the |BaseJob| is not queued.
+        """
+        self.__detach(job)
+        del self.__entries[job]
+
+    def clear(self) -> None:
+        r"""Remove all |BaseJob|\ s."""
+        for wheel in self.__wheels:
+            for slot in wheel:
+                slot.clear()
+        self.__counts = [0] * self.__n_levels
+        self.__overflow.clear()
+        self.__expired.clear()
+        self.__entries.clear()
+
+    def peek(self) -> Optional[BaseJobType]:
+        """
+        Return the |BaseJob| with the earliest datetime without removing it.
+
+        Only the first occupied slot of the lowest occupied level is searched.
+        """
+        candidates: Iterable[BaseJobType] = self.__expired
+        if not self.__expired:
+            candidates = self.__first_occupied_slot()
+        return min(candidates, key=self.__sort_key, default=None)
+
+    def due(self, ref_dt: dt.datetime) -> list[BaseJobType]:
+        r"""
+        Get all |BaseJob|\ s with a datetime not later than `ref_dt`.
+
+        The wheel is advanced to the tick of `ref_dt` first.
+
+        Returns
+        -------
+        list[BaseJob]
+            Due |BaseJob|\ s ordered by their datetime.
+        """
+        if self.__epoch is not None:
+            self.__advance(self.__tick(ref_dt) + 1)
+        entries = self.__entries
+        due_jobs = [job for job in self.__expired if entries[job][_DATETIME] <= ref_dt]
+        due_jobs.sort(key=self.__sort_key)
+        return due_jobs
+
+    def __sort_key(self, job: BaseJobType) -> tuple[dt.datetime, int]:
+        entry = self.__entries[job]
+        return entry[_DATETIME], entry[_COUNTER]
+
+    def __tick(self, datetime: dt.datetime) -> int:
+        if self.__epoch is None:
+            # anchor the ticks to the wall clock, overdue jobs expire immediately
+            self.__epoch = dt.datetime.now(datetime.tzinfo)
+        return (datetime - self.__epoch) // self.__resolution
+
+    def __place(self, job: BaseJobType, entry: list[Any]) -> None:
+        """Store the |BaseJob| in the lowest level sharing its span with the current tick."""
+        tick = entry[_TICK]
+        if tick < self.__now:
+            level, container = _EXPIRED, self.__expired
+        else:
+            level = max((tick ^ self.__now).bit_length() - 1, 0) // self.__bits
+            if level >= self.__n_levels:
+                container = self.__overflow
+            else:
+                container = self.__wheels[level][(tick >> (self.__bits * level)) & self.__mask]
+                self.__counts[level] += 1
+        container.add(job)
+        entry[_LEVEL] = level
+        entry[_CONTAINER] = container
+
+    def __detach(self, job: BaseJobType) -> None:
+        entry = self.__entries[job]
+        entry[_CONTAINER].discard(job)
+        if 0 <= entry[_LEVEL] < self.__n_levels:
+            self.__counts[entry[_LEVEL]] -= 1
+
+    def __advance(self, target: int) -> None:
+        """Expire all ticks before `target`, empty levels are skipped."""
+        bits, mask = self.__bits, self.__mask
+        while self.__now < target:
+            now = self.__now
+            level = next((idx for idx, count in enumerate(self.__counts) if count), None)
+            if level == 0:
+                block_end = ((now >> bits) + 1) << bits
+                end = min(target, block_end)
+                wheel = self.__wheels[0]
+                for idx in range(now & mask, ((end - 1) & mask) + 1):
+                    if wheel[idx]:
+                        self.__expire(wheel[idx])
+                if end < block_end:
+                    self.__now = end
+                    return
+                self.__cascade(now, block_end)
+                continue
+            if level is None:
+                if not self.__overflow:
+                    self.__now = target
+                    return
+                # jump to the span of the earliest overflowing tick
+                first = min(self.__entries[job][_TICK] for job in self.__overflow)
+                shift = bits * self.__n_levels
+                boundary = max(((now >> shift) + 1) << shift, (first >> shift) << shift)
+            else:
+                # jump to the span of the first occupied slot of the lowest occupied level
+                shift = bits * level
+                wheel = self.__wheels[level]
+                idx = next(idx for idx in range((now >> shift) & mask, mask + 1) if wheel[idx])
+                boundary = ((now >> (shift + bits)) << (shift + bits)) | (idx << shift)
+            if boundary > target:
+                # no digit of an occupied level changes
+                self.__now = target
+                return
+            self.__cascade(now, boundary)
+
+    def __expire(self, slot: set[BaseJobType]) -> None:
+        self.__counts[0] -= len(slot)
+        for job in slot:
+            entry = self.__entries[job]
+            entry[_LEVEL] = _EXPIRED
+            entry[_CONTAINER] = self.__expired
+        self.__expired.update(slot)
+        slot.clear()
+
+    def __cascade(self, old: int, new: int) -> None:
+        """Move the current tick and redistribute the slots of the entered spans."""
+        self.__now = new
+        top = ((old ^ new).bit_length() - 1) // self.__bits
+        moved: list[BaseJobType] = []
+        if top >= self.__n_levels:
+            moved.extend(self.__overflow)
+            self.__overflow.clear()
+        for level in range(min(top, self.__n_levels - 1), 0, -1):
+            slot = self.__wheels[level][(new >> (self.__bits * level)) & self.__mask]
+            self.__counts[level] -= len(slot)
+            moved.extend(slot)
+            slot.clear()
+        for job in moved:
+            self.__place(job, self.__entries[job])
+
+    def __first_occupied_slot(self) -> Iterable[BaseJobType]:
+        """Get the occupied slot holding the earliest ticks."""
+        for level, count in enumerate(self.__counts):
+            if not count:
+                continue
+            wheel = self.__wheels[level]
+            start = (self.__now >> (self.__bits * level)) & self.__mask
+            for idx in range(start, self.__mask + 1):
+                if wheel[idx]:
+                    return wheel[idx]
+        return self.__overflow
@@ -3,20 +3,61 @@
 import datetime as dt
 from typing import Union
 
+from scheduler.trigger.calendar import BusinessDay, Monthly
 from scheduler.trigger.core import Weekday
+from scheduler.trigger.cron import Cron
 
 TimingCyclic = dt.timedelta
 _TimingCyclicList = list[TimingCyclic]
 # time on the clock
 _TimingDaily = dt.time
-TimingDailyList = list[_TimingDaily]  # Job
+_TimingDailyList = list[_TimingDaily]  # Job
 TimingDailyUnion = Union[_TimingDaily, _TimingDailyList]
 
-TimingWeekly = Weekday
+_TimingWeekly = Weekday
 _TimingWeeklyList = list[_TimingWeekly]
 TimingWeeklyUnion = Union[_TimingWeekly, _TimingWeeklyList]
 
-TimingJobTimerUnion = Union[TimingCyclic, _TimingDaily, _TimingWeekly]
-TimingJobUnion = Union[_TimingCyclicList, _TimingDailyList, _TimingWeeklyList]
+_TimingCron = Cron
+_TimingCronList = list[_TimingCron]
+TimingCronUnion = Union[_TimingCron, _TimingCronList]
 
-TimingOnceUnion = Union[dt.datetime, TimingCyclic, _TimingWeekly, _TimingDaily]
+_TimingMonthly = Monthly
+_TimingMonthlyList = list[_TimingMonthly]
+TimingMonthlyUnion = Union[_TimingMonthly, _TimingMonthlyList]
+
+_TimingBusinessDay = BusinessDay
+_TimingBusinessDayList = list[_TimingBusinessDay]
+TimingBusinessDayUnion = Union[_TimingBusinessDay, _TimingBusinessDayList]
+
+# timing of a periodic job, a single element or a list
+TimingUnion = Union[
+    TimingCyclic,
+    TimingDailyUnion,
+    TimingWeeklyUnion,
+    TimingCronUnion,
+    TimingMonthlyUnion,
+    TimingBusinessDayUnion,
+]
+
+TimingJobTimerUnion = Union[
+    TimingCyclic, _TimingDaily, _TimingWeekly, _TimingCron, _TimingMonthly, _TimingBusinessDay
+]
+TimingJobUnion = Union[
+    _TimingCyclicList,
+    _TimingDailyList,
+    _TimingWeeklyList,
+    _TimingCronList,
+    _TimingMonthlyList,
+    _TimingBusinessDayList,
+]
+
+TimingOnceUnion = Union[
+    dt.datetime,
+    TimingCyclic,
+    _TimingWeekly,
+    _TimingDaily,
+    _TimingCron,
+    _TimingMonthly,
+    _TimingBusinessDay,
+]
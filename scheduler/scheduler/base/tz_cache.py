@@ -0,0 +1,195 @@
+"""
+UTC offsets and transitions of timezones memoized per local day.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Optional
+
+MICROS_PER_DAY = 86_400_000_000
+# ordinal of 1970-01-01, the local and the UTC microseconds count from its midnight
+EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+_EPOCH = dt.datetime(1970, 1, 1)
+_UTC_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+_SECOND = 1_000_000
+_DAY = dt.timedelta(days=1)
+# memoized days of a timezone before the cache is cleared
+_MAX_DAYS = 4096
+
+
+def utc_micros(datetime: dt.datetime) -> int:
+    """Get the microseconds since the UTC epoch of an aware `datetime.datetime`."""
+    return (datetime - _UTC_EPOCH) // _MICROSECOND
+
+
+def _micros(offset: Optional[dt.timedelta]) -> int:
+    return offset // _MICROSECOND if offset else 0
+
+
+class ZoneCache:
+    """
+    UTC offsets of a timezone memoized per local day.
+
+    The first lookup of a local day asks the `tzinfo` for the offsets at the
+    midnights enclosing the day and bisects the transition in between if they
+    differ. Later conversions between UTC and the wall clock of the day are
+    integer arithmetic.
+
+    Parameters
+    ----------
+    tzinfo : datetime.tzinfo
+        The timezone.
+
+    Notes
+    -----
+    A day is assumed to contain at most one transition.
+    """
+
+    __slots__ = ("__tzinfo", "__days", "__offset")
+
+    __tzinfo: dt.tzinfo
+    # ordinal -> offset at midnight, wall time of the transition in the offset at
+    # midnight or a full day, offset after the transition
+    __days: dict[int, tuple[int, int, int]]
+    # offset of the last conversion, a guess of the local day of the next one
+    __offset: int
+
+    def __init__(self, tzinfo: dt.tzinfo):
+        self.__tzinfo = tzinfo
+        self.__days = {}
+        self.__offset = 0
+
+    @property
+    def tzinfo(self) -> dt.tzinfo:
+        """
+        Get the timezone.
+
+        Returns
+        -------
+        datetime.tzinfo
+            The timezone of the cache.
+        """
+        return self.__tzinfo
+
+    def __day(self, ordinal: int) -> tuple[int, int, int]:
+        day = self.__days.get(ordinal)
+        if day is None:
+            if len(self.__days) >= _MAX_DAYS:
+                self.__days.clear()
+            day = self.__days[ordinal] = self.__scan(ordinal)
+        return day
+
+    def __scan(self, ordinal: int) -> tuple[int, int, int]:
+        """Get the offsets of a local day and the wall time of its transition."""
+        midnight = dt.datetime.fromordinal(ordinal)
+        before = _micros(self.__tzinfo.utcoffset(midnight))
+        after = _micros(self.__tzinfo.utcoffset(midnight + _DAY))
+        if before == after:
+            return before, MICROS_PER_DAY, after
+        day_start = (ordinal - EPOCH_ORDINAL) * MICROS_PER_DAY
+        # transitions happen at full seconds, bisect the first second of the new offset,
+        # the second before midnight has the old one even for a transition at midnight
+        low = (day_start - before) // _SECOND - 1
+        high = -((after - day_start - MICROS_PER_DAY) // _SECOND)
+        while high - low > 1:
+            mid = (low + high) // 2
+            utc = _UTC_EPOCH + dt.timedelta(seconds=mid)
+            if _micros(utc.astimezone(self.__tzinfo).utcoffset()) == before:
+                low = mid
+            else:
+                high = mid
+        return before, high * _SECOND + before - day_start, after
+
+    def regular(self, ordinal: int) -> bool:
+        """
+        Check if a local day has no transition.
+
+        Parameters
+        ----------
+        ordinal : int
+            Local day.
+
+        Returns
+        -------
+        bool
+            ``True`` if the offset is the same for the whole day and the
+            following midnight.
+        """
+        day = self.__days.get(ordinal)
+        if day is None:
+            day = self.__day(ordinal)
+        # a backward transition at the following midnight repeats the end of the day
+        return day[0] == day[2]
+
+    def local(self, utc: int) -> int:
+        """
+        Get the wall time of an instant.
+
+        Parameters
+        ----------
+        utc : int
+            Microseconds since the UTC epoch.
+
+        Returns
+        -------
+        int
+            Microseconds of the wall clock since the local epoch.
+        """
+        ordinal = (utc + self.__offset) // MICROS_PER_DAY + EPOCH_ORDINAL
+        for _ in range(3):
+            before, transition, after = self.__day(ordinal)
+            day_start = (ordinal - EPOCH_ORDINAL) * MICROS_PER_DAY
+            offset = before if utc + before < day_start + transition else after
+            local = utc + offset
+            if local < day_start:
+                ordinal -= 1
+            elif local >= day_start + MICROS_PER_DAY:
+                ordinal += 1
+            else:
+                self.__offset = offset
+                return local
+        # the offsets of adjacent days contradict each other, ask the timezone
+        local_dt = (_UTC_EPOCH + utc * _MICROSECOND).astimezone(self.__tzinfo)
+        return (local_dt.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+
+    def utc(self, ordinal: int, micros: int) -> Optional[int]:
+        """
+        Get the instant of a wall time.
+
+        A wall time repeated by a backward transition is mapped to its first
+        instant, a wall time skipped by a forward transition does not exist.
+
+        Parameters
+        ----------
+        ordinal : int
+            Local day.
+        micros : int
+            Microseconds since the local midnight.
+
+        Returns
+        -------
+        Optional[int]
+            Microseconds since the UTC epoch, ``None`` for a skipped wall time.
+        """
+        before, transition, after = self.__day(ordinal)
+        local = (ordinal - EPOCH_ORDINAL) * MICROS_PER_DAY + micros
+        if micros < transition:
+            return local - before
+        if micros < transition + after - before:
+            return None
+        return local - after
+
+
+_ZONES: dict[dt.tzinfo, ZoneCache] = {}
+
+
+def zone_cache(tzinfo: dt.tzinfo) -> ZoneCache:
+    """Get the shared |ZoneCache| of a timezone."""
+    zone = _ZONES.get(tzinfo)
+    if zone is None:
+        zone = _ZONES.setdefault(tzinfo, ZoneCache(tzinfo))
+    return zone
@@ -0,0 +1,273 @@
+r"""
+Vectorized forecasting of the executions of many `BaseJob`\ s.
+
+Requires the optional dependency `numpy`.
+
+Every |JobTimer| is compiled into its first execution and its period as
+`numpy.datetime64` and `numpy.timedelta64`, all following executions are then
+generated as array operations. |BaseJob|\ s with a limited number of attempts,
+an undelayed first execution or executions that are not equidistant are
+expanded exactly with `BaseJob.occurrences`.
+
+Notes
+-----
+Aware datetimes are converted to UTC, the periods are applied in UTC as well.
+The executions of |Cron|, |Monthly| and |BusinessDay| timings and of timezone
+aware daily and weekly timings are not equidistant in UTC, they are not
+extrapolated.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    raise ImportError("The `scheduler.forecast` module requires `numpy`.") from err
+
+from scheduler.base.definition import JobType
+from scheduler.base.job import BaseJob
+
+_UNIT = "us"
+_NAT = np.datetime64("NaT", _UNIT)
+_NAT_DELTA = np.timedelta64("NaT", _UNIT)
+_MINUTE = np.timedelta64(1, "m")
+_HORIZON = dt.timedelta(days=1000 * 366)
+# the executions of these job types don't follow from the first two
+_IRREGULAR_JOB_TYPES = frozenset((JobType.CRON, JobType.MONTHLY, JobType.BUSINESS_DAY))
+# the period of these job types changes with the UTC offset of their timezone
+_ZONED_JOB_TYPES = frozenset((JobType.DAILY, JobType.WEEKLY))
+
+
+def _to_datetime64(datetime: dt.datetime) -> np.datetime64:
+    if datetime.tzinfo is not None:
+        datetime = datetime.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(datetime, _UNIT)
+
+
+def _is_regular(job: BaseJob[Any]) -> bool:
+    """Check if all executions of the |BaseJob| follow from the period of its timers."""
+    # pylint: disable=protected-access
+    if job.max_attempts or job._initial or job.type in _IRREGULAR_JOB_TYPES:
+        return False
+    return job._tzinfo is None or job.type not in _ZONED_JOB_TYPES
+
+
+def _compile_timers(
+    jobs: Sequence[BaseJob[Any]], start: dt.datetime, end: dt.datetime
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    r"""
+    Compile the timers of regular |BaseJob|\ s.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        First execution, period, exclusive end and job index of every timer,
+        ordered by the job index.
+    """
+    firsts, periods, ends, job_idxs = [], [], [], []
+    np_end = _to_datetime64(end)
+    for job_idx, job in enumerate(jobs):
+        if not job.has_attempts_remaining or not _is_regular(job):
+            continue
+        timer_end = np_end
+        if job.stop is not None:
+            timer_end = min(np_end, _to_datetime64(job.stop) + np.timedelta64(1, _UNIT))
+        for timer in job._timers:  # pylint: disable=protected-access
+            first, second = itertools.islice(
+                itertools.chain(timer.occurrences(start, end), (None, None)), 2
+            )
+            if first is None:
+                continue
+            np_first = _to_datetime64(first)
+            if np_first >= timer_end:
+                continue
+            firsts.append(np_first)
+            # a timer with a single execution has no period
+            periods.append(_to_datetime64(second) - np_first if second is not None else _NAT_DELTA)
+            ends.append(timer_end)
+            job_idxs.append(job_idx)
+    return (
+        np.array(firsts, dtype=f"datetime64[{_UNIT}]"),
+        np.array(periods, dtype=f"timedelta64[{_UNIT}]"),
+        np.array(ends, dtype=f"datetime64[{_UNIT}]"),
+        np.array(job_idxs, dtype=np.int64),
+    )
+
+
+def _expand(
+    firsts: np.ndarray, periods: np.ndarray, counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Repeat every timer `counts` times and add the multiples of its period."""
+    timer_idx = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return firsts[timer_idx] + offsets * periods[timer_idx], timer_idx
+
+
+def _collect(
+    jobs: Sequence[BaseJob[Any]], start: dt.datetime, end: dt.datetime
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the unordered executions and job indices within `[start, end)`."""
+    firsts, periods, ends, job_idxs = _compile_timers(jobs, start, end)
+    single = np.isnat(periods)
+    periods[single] = np.timedelta64(1, _UNIT)
+    counts = np.where(single, 1, -((firsts - ends) // periods)).astype(np.int64)
+    execs, timer_idx = _expand(firsts, periods, counts)
+    exec_job_idxs = job_idxs[timer_idx]
+
+    extra = [
+        (_to_datetime64(exec_dt), job_idx)
+        for job_idx, job in enumerate(jobs)
+        if not _is_regular(job)
+        for exec_dt in job.occurrences(start, end)
+    ]
+    if extra:
+        extra_execs, extra_idxs = zip(*extra)
+        execs = np.concatenate((execs, np.array(extra_execs, dtype=execs.dtype)))
+        exec_job_idxs = np.concatenate((exec_job_idxs, np.array(extra_idxs, dtype=np.int64)))
+    return execs, exec_job_idxs
+
+
+def occurrences(
+    jobs: Iterable[BaseJob[Any]], start: dt.datetime, end: dt.datetime
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""
+    Calculate all executions of the given |BaseJob|\ s within `[start, end)`.
+
+    Parameters
+    ----------
+    jobs : Iterable[BaseJob]
+        |BaseJob|\ s to forecast, e.g. `Scheduler.jobs`.
+    start : datetime.datetime
+        Inclusive lower bound.
+    end : datetime.datetime
+        Exclusive upper bound.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Sorted executions as `datetime64[us]` and the index of the executed
+        |BaseJob| in `jobs` for each of them.
+    """
+    execs, exec_job_idxs = _collect(list(jobs), start, end)
+    order = np.argsort(execs, kind="stable")
+    return execs[order], exec_job_idxs[order]
+
+
+def next_occurrences(
+    jobs: Iterable[BaseJob[Any]], n: int, start: Optional[dt.datetime] = None
+) -> np.ndarray:
+    r"""
+    Calculate the next `n` executions of every |BaseJob|.
+
+    Parameters
+    ----------
+    jobs : Iterable[BaseJob]
+        |BaseJob|\ s to forecast.
+    n : int
+        Number of executions per |BaseJob|.
+    start : Optional[datetime.datetime]
+        Inclusive lower bound, defaults to now.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(len(jobs), n)`` with `datetime64[us]` executions,
+        missing executions are `NaT`.
+    """
+    jobs = list(jobs)
+    if start is None:
+        tzinfo = jobs[0]._tzinfo if jobs else None  # pylint: disable=protected-access
+        start = dt.datetime.now(tzinfo)
+    end = start + _HORIZON
+
+    result = np.full((len(jobs), n), _NAT)
+    firsts, periods, ends, job_idxs = _compile_timers(jobs, start, end)
+    if len(firsts):
+        # the first `n` executions of each timer, the `n` earliest per job are kept
+        steps = np.arange(n)
+        candidates = firsts[:, None] + steps[None, :] * periods[:, None]
+        candidates[:, 0] = firsts
+        candidates[candidates >= ends[:, None]] = _NAT
+        n_timers = np.bincount(job_idxs, minlength=len(jobs))
+        slot = np.arange(len(job_idxs)) - np.repeat(np.cumsum(n_timers) - n_timers, n_timers)
+        table = np.full((len(jobs), int(n_timers.max()) * n), _NAT)
+        cols = slot[:, None] * n + steps[None, :]
+        table[job_idxs[:, None], cols] = candidates
+        table.sort(axis=1)
+        result[:] = table[:, :n]
+
+    for job_idx, job in enumerate(jobs):
+        if not _is_regular(job):
+            for col, exec_dt in enumerate(itertools.islice(job.occurrences(start, end), n)):
+                result[job_idx, col] = _to_datetime64(exec_dt)
+    return result
+
+
+def firing_histogram(
+    jobs: Iterable[BaseJob[Any]],
+    start: dt.datetime,
+    end: dt.datetime,
+    resolution: dt.timedelta = dt.timedelta(minutes=1),
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""
+    Count the executions of all |BaseJob|\ s per time bin within `[start, end)`.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Start of every bin as `datetime64[us]` and the number of executions in it.
+    """
+    execs, _ = _collect(list(jobs), start, end)
+    np_start = _to_datetime64(start)
+    step = np.timedelta64(resolution, _UNIT)
+    n_bins = int(-((np_start - _to_datetime64(end)) // step))
+    counts = np.bincount(((execs - np_start) // step).astype(np.int64), minlength=n_bins)
+    return np_start + np.arange(n_bins) * step, counts
+
+
+def minute_of_day_histogram(
+    jobs: Iterable[BaseJob[Any]], start: dt.datetime, end: dt.datetime
+) -> np.ndarray:
+    r"""
+    Count the executions of all |BaseJob|\ s per minute of the day within `[start, end)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of length 1440, the index is the minute after midnight.
+    """
+    execs, _ = _collect(list(jobs), start, end)
+    minutes = (execs - execs.astype("datetime64[D]")) // _MINUTE
+    return np.bincount(minutes.astype(np.int64), minlength=24 * 60)
+
+
+def peak_concurrency(
+    jobs: Iterable[BaseJob[Any]],
+    start: dt.datetime,
+    end: dt.datetime,
+    duration: dt.timedelta,
+) -> tuple[Optional[np.datetime64], int]:
+    r"""
+    Find the maximum number of overlapping executions within `[start, end)`.
+
+    Every execution is assumed to run for `duration`.
+
+    Returns
+    -------
+    tuple[Optional[numpy.datetime64], int]
+        Start of the execution at which the peak is reached and the number of
+        concurrently running executions.
+    """
+    execs, _ = occurrences(jobs, start, end)
+    if not len(execs):
+        return None, 0
+    running = np.arange(1, len(execs) + 1) - np.searchsorted(
+        execs, execs - np.timedelta64(duration, _UNIT), side="right"
+    )
+    peak = int(np.argmax(running))
+    return execs[peak], int(running[peak])
@@ -19,6 +19,17 @@ WEEKLY_TYPE_ERROR_MSG = (
     + "DAY | list[DAY]\n"
     + "where `DAY = Weekday`"
 )
+CRON_TYPE_ERROR_MSG = (
+    "Wrong input for Cron! Select one of the following input types:\n" + "Cron | list[Cron]"
+)
+MONTHLY_TYPE_ERROR_MSG = (
+    "Wrong input for Monthly! Select one of the following input types:\n"
+    + "Monthly | list[Monthly]"
+)
+BUSINESS_DAY_TYPE_ERROR_MSG = (
+    "Wrong input for BusinessDay! Select one of the following input types:\n"
+    + "BusinessDay | list[BusinessDay]"
+)
 
 TZ_ERROR_MSG = "Can't use offset-naive and offset-aware datetimes together."
 _TZ_ERROR_MSG = TZ_ERROR_MSG[:-1] + " for {0}."
@@ -27,5 +38,46 @@ START_STOP_ERROR = "Start argument must be smaller than the stop argument."
 
 ONCE_TYPE_ERROR_MSG = (
     "Wrong input for Once! Select one of the following input types:\n"
-    + "dt.datetime | dt.timedelta | Weekday | dt.time"
+    + "dt.datetime | dt.timedelta | Weekday | dt.time | Cron | Monthly | BusinessDay"
+)
+
+DELETE_ERROR_MSG = "An unscheduled job can not be deleted!"
+
+NO_EVENT_LOOP_ERROR_MSG = (
+    "The asyncio Scheduler requires a running event loop or the `loop` argument."
 )
+
+EXECUTOR_ERROR_MSG = "Can't use `n_threads` and `n_processes` together."
+
+PICKLE_ERROR_MSG = (
+    "The handle, args and kwargs of a Job executed in a process pool have to be picklable."
+)
+
+ALIAS_DUPLICATE_ERROR_MSG = "A job with the alias `{0}` is already scheduled!"
+
+ALIAS_UNKNOWN_ERROR_MSG = "No job with the alias `{0}` is scheduled!"
+
+TIMING_WHEEL_ERROR_MSG = "A TimingWheel requires a positive resolution, slot_bits and levels."
+
+JOB_STORE_PICKLE_ERROR_MSG = (
+    "A stored job requires an importable handle and picklable args, kwargs and timing."
+)
+
+SNAPSHOT_ERROR_MSG = (
+    "A snapshot requires importable handles, picklable args and kwargs "
+    "and ZoneInfo or fixed offset timezones."
+)
+
+SNAPSHOT_FORMAT_ERROR_MSG = "The file is not a snapshot of a compatible version."
+
+SNAPSHOT_HANDLE_ERROR_MSG = "The handle `{0}` of the snapshot can't be imported."
+
+CRON_ERROR_MSG = "The cron expression `{0}` is invalid or never matches."
+
+MONTHLY_DAY_ERROR_MSG = "The day `{0}` of a Monthly trigger is out of range."
+
+CALENDAR_ERROR_MSG = "The trigger `{0!r}` never matches."
+
+WEEKEND_ERROR_MSG = "The weekend must be a subset of [0,6] <=> [Monday, Sunday] but not all days."
+
+HOLIDAY_FILE_ERROR_MSG = "Invalid date in line {1} of the holiday calendar `{0}`."
@@ -0,0 +1,28 @@
+import asyncio
+import datetime as dt
+from typing import Any, Optional
+
+from scheduler.asyncio import Scheduler
+
+
+def test_job_deletes_itself() -> None:
+    errors: list[dict[str, Any]] = []
+    calls: list[int] = []
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        schedule = Scheduler()
+        job: Optional[Any] = None
+
+        async def handle() -> None:
+            calls.append(1)
+            schedule.delete_job(job)
+
+        job = schedule.cyclic(dt.timedelta(milliseconds=10), handle)
+        await asyncio.sleep(0.1)
+        assert not schedule.jobs
+
+    asyncio.run(main())
+    assert calls == [1]
+    assert not errors
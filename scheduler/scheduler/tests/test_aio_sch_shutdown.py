@@ -0,0 +1,36 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from scheduler.asyncio import Scheduler
+
+
+@pytest.mark.parametrize("wait", [True, False])
+def test_shutdown(wait: bool) -> None:
+    finished: list[int] = []
+    calls: list[int] = []
+
+    async def slow() -> None:
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def fast() -> None:
+        calls.append(1)
+
+    async def main() -> None:
+        schedule = Scheduler()
+        schedule.once(dt.timedelta(), slow)
+        schedule.cyclic(dt.timedelta(milliseconds=20), fast)
+        await asyncio.sleep(0.01)
+        assert len(schedule.executing_jobs) == 1
+
+        await schedule.shutdown(wait=wait)
+        n_calls = len(calls)
+        await asyncio.sleep(0.1)
+        assert len(calls) == n_calls
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        assert not pending
+
+    asyncio.run(main())
+    assert finished == ([1] if wait else [])
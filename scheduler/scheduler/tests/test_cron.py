@@ -0,0 +1,111 @@
+import bisect
+import datetime as dt
+import random
+from typing import Callable
+
+import pytest
+
+from scheduler import Scheduler, SchedulerError
+from scheduler.trigger import Cron
+
+START = dt.datetime(2023, 12, 1)
+END = dt.datetime(2024, 3, 10)
+MINUTE = dt.timedelta(minutes=1)
+
+CASES: list[tuple[str, Callable[[dt.datetime], bool]]] = [
+    (
+        "*/5 9-17 * * 1-5",
+        lambda t: t.minute % 5 == 0 and 9 <= t.hour <= 17 and t.weekday() < 5,
+    ),
+    # a restricted day and weekday match either of them
+    (
+        "0 0 13 * FRI",
+        lambda t: t.minute == 0 and t.hour == 0 and (t.day == 13 or t.weekday() == 4),
+    ),
+    ("15 8 29 2 *", lambda t: (t.month, t.day, t.hour, t.minute) == (2, 29, 8, 15)),
+    (
+        "0 12 * JAN,FEB SUN",
+        lambda t: (t.hour, t.minute) == (12, 0) and t.month in (1, 2) and t.weekday() == 6,
+    ),
+    ("@hourly", lambda t: t.minute == 0),
+    (
+        "5-59/20 */6 1,15 * ?",
+        lambda t: t.minute in (5, 25, 45) and t.hour % 6 == 0 and t.day in (1, 15),
+    ),
+]
+
+
+def matching_minutes(matches: Callable[[dt.datetime], bool]) -> list[dt.datetime]:
+    minutes = (START + idx * MINUTE for idx in range((END - START) // MINUTE))
+    return [minute for minute in minutes if matches(minute)]
+
+
+def random_datetime(rng: random.Random) -> dt.datetime:
+    return START + (END - START) * rng.random()
+
+
+@pytest.mark.parametrize("expression, matches", CASES)
+def test_next_after(expression: str, matches: Callable[[dt.datetime], bool]) -> None:
+    rng = random.Random(5)
+    cron = Cron(expression)
+    reference = matching_minutes(matches)
+    refs = [random_datetime(rng) for _ in range(200)] + reference[:20]
+    for ref in refs:
+        idx = bisect.bisect_right(reference, ref)
+        if idx < len(reference):
+            assert cron.next_after(ref) == reference[idx]
+
+
+@pytest.mark.parametrize("expression, matches", CASES)
+def test_count(expression: str, matches: Callable[[dt.datetime], bool]) -> None:
+    rng = random.Random(7)
+    cron = Cron(expression)
+    reference = matching_minutes(matches)
+    assert cron.count(START, END) == len(reference)
+    for _ in range(200):
+        start, end = sorted((random_datetime(rng), random_datetime(rng)))
+        expected = bisect.bisect_left(reference, end) - bisect.bisect_left(reference, start)
+        assert cron.count(start, end) == expected
+        assert cron.count(end, start) == 0
+
+
+def test_next_leap_day() -> None:
+    cron = Cron("15 8 29 2 *")
+    assert cron.next_after(dt.datetime(2024, 3, 1)) == dt.datetime(2028, 2, 29, 8, 15)
+
+
+def test_aware_reference() -> None:
+    cron = Cron("0 9 * * *", tzinfo=dt.timezone(dt.timedelta(hours=2)))
+    ref = dt.datetime(2024, 1, 1, 8, tzinfo=dt.timezone.utc)
+    assert cron.next_after(ref) == dt.datetime(2024, 1, 2, 7, tzinfo=dt.timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "expression, interval",
+    [
+        ("*/5 9-17 * * 1-5", dt.timedelta(minutes=5)),
+        ("0,50 * * * *", dt.timedelta(minutes=10)),
+        ("0 9,17 * * *", dt.timedelta(hours=8)),
+        ("@daily", dt.timedelta(days=1)),
+    ],
+)
+def test_interval(expression: str, interval: dt.timedelta) -> None:
+    assert Cron(expression).interval == interval
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "0 0 31 2 *", "0 0 * FOO *"],
+)
+def test_invalid_expression(expression: str) -> None:
+    with pytest.raises(SchedulerError):
+        Cron(expression)
+
+
+def test_scheduler_cron() -> None:
+    schedule = Scheduler()
+    cron = Cron("*/5 9-17 * * 1-5")
+    start = dt.datetime(2024, 1, 6, 12)
+    job = schedule.cron(cron, print, start=start)
+    assert job.datetime == dt.datetime(2024, 1, 8, 9)
+    assert job.datetime == cron.next_after(start)
@@ -0,0 +1,118 @@
+import datetime as dt
+import itertools
+import zoneinfo
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from scheduler import Scheduler
+from scheduler.base.job import BaseJob
+from scheduler.forecast import next_occurrences, occurrences
+from scheduler.trigger import BusinessDay, Cron, HolidayCalendar, Monday, Monthly
+from scheduler.trigger.calendar import CalendarTrigger
+from scheduler.util import next_calendar_occurrence
+
+TZ = zoneinfo.ZoneInfo("Europe/Berlin")
+START = dt.datetime(2024, 1, 1)
+CALENDAR = HolidayCalendar([dt.date(2024, 1, 1), dt.date(2024, 5, 1), dt.date(2024, 12, 25)])
+
+
+def expected(
+    job: BaseJob[Any], start: dt.datetime, end: dt.datetime, n: Optional[int] = None
+) -> list[np.datetime64]:
+    execs = itertools.islice(job.occurrences(start, end), n)
+    return [
+        np.datetime64(exec_dt.astimezone(dt.timezone.utc).replace(tzinfo=None), "us")
+        if exec_dt.tzinfo is not None
+        else np.datetime64(exec_dt, "us")
+        for exec_dt in execs
+    ]
+
+
+def assert_exact(schedule: Scheduler, start: dt.datetime, end: dt.datetime) -> None:
+    jobs = sorted(schedule.jobs)
+    execs, job_idxs = occurrences(jobs, start, end)
+    table = next_occurrences(jobs, 5, start)
+    for job_idx, job in enumerate(jobs):
+        assert list(execs[job_idxs == job_idx]) == expected(job, start, end)
+        assert list(table[job_idx]) == expected(job, start, start + dt.timedelta(days=3660), 5)
+
+
+def test_cron() -> None:
+    schedule = Scheduler()
+    job = schedule.cron(Cron("*/5 9-17 * * 1-5"), print, start=START)
+    end = START + dt.timedelta(days=7)
+
+    execs, _ = occurrences([job], START, end)
+    assert len(execs) == 5 * 9 * 12
+    assert list(execs) == [np.datetime64(exec_dt, "us") for exec_dt in job.occurrences(START, end)]
+    assert_exact(schedule, START, end)
+
+
+def test_cron_next_occurrences_within_hour_field() -> None:
+    schedule = Scheduler()
+    job = schedule.cron(Cron("*/5 9-17 * * 1-5"), print, start=START)
+
+    table = next_occurrences([job], 110, START)
+    assert table[0, 107] == np.datetime64("2024-01-01T17:55")
+    assert table[0, 108] == np.datetime64("2024-01-02T09:00")
+
+
+@pytest.mark.parametrize("start", [dt.datetime(2024, 3, 20), dt.datetime(2024, 10, 20)])
+def test_aware_daily_and_weekly_across_dst(start: dt.datetime) -> None:
+    start = start.replace(tzinfo=TZ)
+    schedule = Scheduler(tzinfo=TZ)
+    schedule.daily(dt.time(9, tzinfo=TZ), print, start=start)
+    schedule.weekly(Monday(dt.time(9, tzinfo=TZ)), print, start=start)
+    assert_exact(schedule, start, start + dt.timedelta(days=28))
+
+
+@pytest.mark.parametrize(
+    "trigger",
+    [
+        Monthly(-1, dt.time(8)),
+        Monthly(31),
+        Monthly(1, dt.time(8), calendar=CALENDAR),
+        BusinessDay(dt.time(8)),
+        BusinessDay(calendar=CALENDAR),
+    ],
+)
+def test_calendar_trigger(trigger: CalendarTrigger) -> None:
+    schedule = Scheduler()
+    if isinstance(trigger, Monthly):
+        job = schedule.monthly(trigger, print, start=START)
+    else:
+        job = schedule.business_day(trigger, print, start=START)
+    end = dt.datetime(2025, 1, 1)
+
+    exec_dt, reference = START, []
+    while True:
+        exec_dt = next_calendar_occurrence(exec_dt, trigger)
+        if exec_dt >= end:
+            break
+        reference.append(np.datetime64(exec_dt, "us"))
+    execs, _ = occurrences([job], START, end)
+    assert list(execs) == reference
+    assert list(next_occurrences([job], 5, START)[0]) == reference[:5]
+    assert_exact(schedule, START, end)
+
+
+def test_business_days_per_year() -> None:
+    schedule = Scheduler()
+    job = schedule.business_day(BusinessDay(calendar=CALENDAR), print, start=START)
+
+    execs, _ = occurrences([job], START, dt.datetime(2025, 1, 1))
+    assert len(execs) == 262 - len(CALENDAR.holidays)
+
+
+def test_monthly_last_day() -> None:
+    schedule = Scheduler()
+    job = schedule.monthly(Monthly(-1), print, start=START)
+
+    table = next_occurrences([job], 3, START)
+    assert list(table[0]) == [
+        np.datetime64("2024-01-31"),
+        np.datetime64("2024-02-29"),
+        np.datetime64("2024-03-31"),
+    ]
@@ -0,0 +1,53 @@
+import datetime as dt
+import random
+
+from scheduler import Scheduler
+from scheduler.base.job_queue import JobQueue
+
+T_0 = dt.datetime(2024, 1, 1)
+
+
+class Item:
+    __slots__ = ("datetime", "name")
+
+    def __init__(self, datetime: dt.datetime, name: int):
+        self.datetime = datetime
+        self.name = name
+
+
+def test_due_order_with_updates_and_removals() -> None:
+    rng = random.Random(1)
+    items = [Item(T_0 + dt.timedelta(seconds=rng.randrange(600)), idx) for idx in range(500)]
+    queue: JobQueue[Item] = JobQueue()
+    queue.extend(items[:250])
+    for item in items[250:]:
+        queue.push(item)
+    for item in rng.sample(items, 200):
+        item.datetime = T_0 + dt.timedelta(seconds=rng.randrange(600))
+        queue.update(item)
+    removed = set(rng.sample(items, 100))
+    for item in removed:
+        queue.remove(item)
+
+    left = [item for item in items if item not in removed]
+    ref_dt = T_0 + dt.timedelta(seconds=300)
+    due = queue.due(ref_dt)
+    assert all(item.datetime <= ref_dt for item in due)
+    assert [item.datetime for item in due] == sorted(item.datetime for item in due)
+    assert set(due) == {item for item in left if item.datetime <= ref_dt}
+    assert len(queue) == len(left)
+    peek = queue.peek()
+    assert peek is not None
+    assert peek.datetime == min(item.datetime for item in left)
+
+
+def test_exec_jobs_in_datetime_order() -> None:
+    calls: list[int] = []
+    schedule = Scheduler()
+    now = dt.datetime.now()
+    for idx in (2, 0, 1):
+        schedule.once(now - dt.timedelta(seconds=3 - idx), calls.append, args=(idx,))
+
+    assert schedule.exec_jobs() == 3
+    assert calls == [0, 1, 2]
+    assert not schedule.jobs
@@ -0,0 +1,41 @@
+import datetime as dt
+import threading
+
+import pytest
+
+from scheduler import Scheduler
+
+
+@pytest.mark.parametrize("force_exec_all", [False, True])
+def test_concurrent_exec_jobs_run_once(force_exec_all: bool) -> None:
+    n_callers = 3
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def handle() -> None:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+
+    schedule = Scheduler()
+    schedule.once(dt.datetime.now() - dt.timedelta(seconds=1), handle)
+    results: list[int] = []
+
+    def caller() -> None:
+        results.append(schedule.exec_jobs(force_exec_all=force_exec_all))
+
+    first = threading.Thread(target=caller)
+    first.start()
+    assert started.wait(timeout=5)
+    others = [threading.Thread(target=caller) for _ in range(n_callers - 1)]
+    for thread in others:
+        thread.start()
+    for thread in others:
+        thread.join(timeout=5)
+    release.set()
+    first.join(timeout=5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [0] * (n_callers - 1) + [1]
+    assert not schedule.jobs
@@ -0,0 +1,28 @@
+import datetime as dt
+from typing import Optional
+
+import pytest
+
+from scheduler import Scheduler
+from scheduler.base.definition import Priority
+
+
+@pytest.mark.parametrize(
+    "priority, executed",
+    [(None, 0), (Priority.LINEAR, 1), (Priority.CONSTANT, 1)],
+)
+def test_dropped_execution_is_counted(priority: Optional[Priority], executed: int) -> None:
+    schedule = Scheduler(max_exec=1, drop_priority=100, priority=priority)
+    start = dt.datetime.now() - dt.timedelta(seconds=90)
+    jobs = [
+        schedule.cyclic(dt.timedelta(minutes=1), lambda: None, start=start, weight=weight)
+        for weight in (1, 2)
+    ]
+
+    assert schedule.exec_jobs() == 1
+    dropped = jobs[1 - executed]
+    assert jobs[executed].attempts == 1
+    assert jobs[executed].skipped_executions == 0
+    assert dropped.attempts == 0
+    assert dropped.skipped_executions == 1
+    assert all(job.datetime > dt.datetime.now() for job in jobs)
@@ -0,0 +1,39 @@
+import datetime as dt
+from typing import Any
+
+from scheduler import Scheduler
+
+
+def test_hook_and_stats() -> None:
+    calls: list[tuple[Any, int, int, bool]] = []
+
+    def fail() -> None:
+        raise ValueError
+
+    schedule = Scheduler(execution_hook=lambda *args: calls.append(args))
+    good = schedule.cyclic(dt.timedelta(hours=1), lambda: None, delay=False)
+    bad = schedule.cyclic(dt.timedelta(hours=1), fail, delay=False)
+
+    assert schedule.exec_jobs() == 2
+    assert {(job, success) for job, _, _, success in calls} == {(good, True), (bad, False)}
+    assert all(lag >= 0 and duration >= 0 for _, lag, duration, _ in calls)
+    assert good.stats is not None and good.stats.successes == 1
+    assert bad.stats is not None and bad.stats.failures == 1
+    stats = schedule.stats()
+    assert (stats.successes, stats.failures) == (1, 1)
+
+
+def test_job_deleted_while_executing_is_retired() -> None:
+    schedule = Scheduler(instrument=True)
+
+    def delete_self() -> None:
+        schedule.delete_job(job)
+
+    job = schedule.cyclic(dt.timedelta(hours=1), delete_self, delay=False)
+    schedule.cyclic(dt.timedelta(hours=1), lambda: None, delay=False)
+
+    assert schedule.exec_jobs() == 2
+    assert len(schedule.jobs) == 1
+    stats = schedule.stats()
+    assert stats.successes == 2
+    assert stats.lag.count == stats.duration.count == 2
@@ -0,0 +1,35 @@
+import datetime as dt
+import threading
+import time
+
+import pytest
+
+from scheduler import Scheduler
+
+
+@pytest.mark.parametrize("n_threads", [0, 1])
+def test_reschedule_running_job_does_not_block(n_threads: int) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def handle() -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    schedule = Scheduler(n_threads=n_threads)
+    job = schedule.cyclic(dt.timedelta(seconds=1), handle, alias="slow", delay=False)
+    runner = threading.Thread(target=schedule.exec_jobs)
+    runner.start()
+    assert started.wait(timeout=5)
+
+    begin = time.perf_counter()
+    schedule.reschedule("slow", dt.timedelta(hours=1))
+    schedule.exec_jobs()
+    elapsed = time.perf_counter() - begin
+    release.set()
+    runner.join(timeout=5)
+    schedule.shutdown()
+
+    assert elapsed < 1
+    assert job.attempts == 1
+    assert job.datetime - dt.datetime.now() > dt.timedelta(minutes=59)
@@ -0,0 +1,86 @@
+import datetime as dt
+import importlib
+import pathlib
+import sys
+import zoneinfo
+
+import pytest
+
+from scheduler import Scheduler, SchedulerError
+from scheduler.trigger import BusinessDay, Cron, HolidayCalendar, Monday, Monthly
+
+TZ = zoneinfo.ZoneInfo("Europe/Berlin")
+
+
+def handle(*args: object, **kwargs: object) -> None:
+    pass
+
+
+def definition(job: object) -> tuple[object, ...]:
+    return tuple(
+        getattr(job, attr)
+        for attr in (
+            "type",
+            "handle",
+            "args",
+            "kwargs",
+            "max_attempts",
+            "tags",
+            "alias",
+            "start",
+            "stop",
+            "skip_missing",
+            "weight",
+            "jitter",
+            "datetime",
+            "attempts",
+        )
+    )
+
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.snap"
+    calendar = HolidayCalendar([dt.date(2024, 12, 25)])
+    schedule = Scheduler(tzinfo=TZ)
+    schedule.cyclic(dt.timedelta(seconds=5), handle, args=(1, "a"), kwargs={"b": 2}, tags={"x"})
+    schedule.daily([dt.time(6, tzinfo=TZ), dt.time(18, tzinfo=TZ)], handle, alias="daily")
+    schedule.weekly(Monday(dt.time(9, tzinfo=TZ)), handle, max_attempts=3, weight=2.5)
+    schedule.cron(Cron("*/5 9-17 * * 1-5", tzinfo=TZ), handle, jitter=dt.timedelta(seconds=30))
+    schedule.monthly(Monthly(-1, dt.time(tzinfo=TZ), calendar), handle)
+    schedule.business_day(BusinessDay(dt.time(8, tzinfo=TZ), calendar), handle)
+    schedule.once(dt.datetime(2030, 1, 1, tzinfo=TZ), handle, tags={"y", "z"})
+
+    assert schedule.snapshot(path) == 7
+    restored = Scheduler.restore(path, tzinfo=TZ)
+    assert sorted(map(definition, restored.jobs), key=repr) == sorted(
+        map(definition, schedule.jobs), key=repr
+    )
+    job = restored.get_job("daily")
+    assert job is not None
+    assert [timing.tzinfo for timing in job._definition()["timing"]] == [TZ, TZ]
+
+
+def test_incompatible_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.snap"
+    path.write_bytes(b"SCHEDSNP" + bytes(40))
+    with pytest.raises(SchedulerError):
+        Scheduler.restore(path)
+
+
+def test_moved_handle(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "snapshot_handles.py").write_text("def work():\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("snapshot_handles")
+    path = tmp_path / "jobs.snap"
+    schedule = Scheduler()
+    schedule.cyclic(dt.timedelta(seconds=5), module.work)
+    schedule.snapshot(path)
+
+    del module.work
+    with pytest.raises(SchedulerError, match="snapshot_handles:work"):
+        Scheduler.restore(path)
+
+    del sys.modules["snapshot_handles"]
+    (tmp_path / "snapshot_handles.py").unlink()
+    with pytest.raises(SchedulerError, match="snapshot_handles:work"):
+        Scheduler.restore(path)
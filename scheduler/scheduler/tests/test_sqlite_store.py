@@ -0,0 +1,83 @@
+import asyncio
+import datetime as dt
+import pathlib
+import sqlite3
+
+import pytest
+
+from scheduler import Scheduler, SchedulerError
+from scheduler.asyncio import Scheduler as AioScheduler
+from scheduler.base.definition import JobType
+from scheduler.base.sqlite_store import SQLiteJobStore
+
+
+def handle(value: int) -> None:
+    pass
+
+
+async def aio_handle(value: int) -> None:
+    pass
+
+
+def n_rows(path: pathlib.Path) -> int:
+    with sqlite3.connect(path) as connection:
+        return int(connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0])
+
+
+def test_reload_after_restart(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.db"
+    schedule = Scheduler(job_store=SQLiteJobStore(path))
+    soon = schedule.cyclic(dt.timedelta(seconds=10), handle, args=(1,), alias="soon")
+    schedule.cyclic(dt.timedelta(hours=1), handle, args=(2,), alias="late")
+    schedule.delete_job(schedule.once(dt.timedelta(seconds=5), handle, args=(3,)))
+    schedule.shutdown()
+    assert n_rows(path) == 2
+
+    restored = Scheduler(job_store=SQLiteJobStore(path, flush_interval=dt.timedelta()))
+    job = restored.get_job("soon")
+    assert job is not None
+    assert job is not soon
+    assert job.type is JobType.CYCLIC
+    assert job.args == (1,)
+    assert job.datetime == soon.datetime
+    # only the jobs due within the horizon are loaded
+    assert restored.get_job("late") is None
+
+
+def test_add_many_is_atomic(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.db"
+    store: SQLiteJobStore = SQLiteJobStore(path)
+    schedule = Scheduler(job_store=store)
+    specs = [
+        {"job_type": JobType.CYCLIC, "timing": dt.timedelta(seconds=10), "handle": handle},
+        {"job_type": JobType.CYCLIC, "timing": dt.timedelta(seconds=10), "handle": lambda: None},
+    ]
+    with pytest.raises(SchedulerError):
+        schedule.schedule_many(specs)
+    assert not schedule.jobs
+    store.close()
+    assert n_rows(path) == 0
+
+
+def test_aio_add_many_is_atomic(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.db"
+    store: SQLiteJobStore = SQLiteJobStore(path)
+
+    async def main() -> None:
+        schedule = AioScheduler(job_store=store)
+        specs = [
+            {"job_type": JobType.CYCLIC, "timing": dt.timedelta(seconds=10), "handle": aio_handle},
+            {
+                "job_type": JobType.CYCLIC,
+                "timing": dt.timedelta(seconds=10),
+                "handle": lambda: aio_handle(0),
+            },
+        ]
+        with pytest.raises(SchedulerError):
+            schedule.schedule_many(specs)
+        assert not schedule.jobs
+        await schedule.shutdown()
+
+    asyncio.run(main())
+    store.close()
+    assert n_rows(path) == 0
@@ -0,0 +1,72 @@
+import datetime as dt
+import random
+
+import pytest
+
+from scheduler import Scheduler, SchedulerError
+from scheduler.base.job_queue import JobQueue
+from scheduler.base.timing_wheel import TimingWheel
+
+T_0 = dt.datetime(2024, 1, 1)
+
+
+class Item:
+    __slots__ = ("datetime", "name")
+
+    def __init__(self, datetime: dt.datetime, name: int):
+        self.datetime = datetime
+        self.name = name
+
+
+def test_same_order_as_job_queue() -> None:
+    rng = random.Random(2)
+    wheel: TimingWheel[Item] = TimingWheel(dt.timedelta(milliseconds=10), slot_bits=4, levels=3)
+    queue: JobQueue[Item] = JobQueue()
+
+    def random_datetime(ref_dt: dt.datetime) -> dt.datetime:
+        # spans all levels and the overflow of the wheel
+        scale = rng.choice((10**3, 10**5, 10**7, 10**9))
+        return ref_dt + dt.timedelta(microseconds=scale * rng.random())
+
+    ref_dt = T_0
+    items = [Item(random_datetime(ref_dt), idx) for idx in range(300)]
+    wheel.extend(items)
+    queue.extend(items)
+    for _ in range(200):
+        ref_dt += dt.timedelta(microseconds=int(10**6 * rng.random()))
+        for item in rng.sample(sorted(queue.jobs, key=lambda item: item.name), 5):
+            item.datetime = random_datetime(ref_dt)
+            wheel.update(item)
+            queue.update(item)
+        removed = rng.choice(sorted(queue.jobs, key=lambda item: item.name))
+        wheel.remove(removed)
+        queue.remove(removed)
+
+        due = queue.due(ref_dt)
+        assert [item.datetime for item in wheel.due(ref_dt)] == [item.datetime for item in due]
+        for item in due:
+            item.datetime = random_datetime(ref_dt)
+        wheel.extend(due)
+        queue.extend(due)
+        assert len(wheel) == len(queue)
+        peek = wheel.peek()
+        assert peek is not None
+        assert peek.datetime == min(item.datetime for item in queue.jobs)
+
+
+def test_invalid_wheel() -> None:
+    with pytest.raises(SchedulerError):
+        TimingWheel(dt.timedelta())
+
+
+def test_scheduler_with_timing_wheel() -> None:
+    calls: list[int] = []
+    schedule = Scheduler(job_queue=TimingWheel())
+    now = dt.datetime.now()
+    for idx in (2, 0, 1):
+        schedule.once(now - dt.timedelta(seconds=3 - idx), calls.append, args=(idx,))
+    later = schedule.once(dt.timedelta(hours=1), calls.append, args=(3,))
+
+    assert schedule.exec_jobs() == 3
+    assert calls == [0, 1, 2]
+    assert schedule.jobs == {later}
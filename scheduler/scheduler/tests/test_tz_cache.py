@@ -0,0 +1,160 @@
+import datetime as dt
+import random
+import zoneinfo
+from typing import Optional
+
+import pytest
+
+from scheduler.base.tz_cache import EPOCH_ORDINAL, MICROS_PER_DAY, utc_micros, zone_cache
+from scheduler.util import next_zoned_occurrence
+
+UTC = dt.timezone.utc
+BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+NEW_YORK = zoneinfo.ZoneInfo("America/New_York")
+# transitions at midnight, the day of the gap starts at 01:00
+SANTIAGO = zoneinfo.ZoneInfo("America/Santiago")
+ZONES = [BERLIN, NEW_YORK, SANTIAGO]
+EPOCH = dt.datetime(1970, 1, 1)
+
+
+def wall_micros(datetime: dt.datetime) -> int:
+    return (datetime.replace(tzinfo=None) - EPOCH) // dt.timedelta(microseconds=1)
+
+
+def reference_utc(tzinfo: dt.tzinfo, ordinal: int, micros: int) -> Optional[int]:
+    """First instant of a wall time, ``None`` if it is skipped."""
+    wall = dt.datetime.fromordinal(ordinal) + dt.timedelta(microseconds=micros)
+    instant = wall.replace(tzinfo=tzinfo).astimezone(UTC)
+    if instant.astimezone(tzinfo).replace(tzinfo=None) != wall:
+        return None
+    return utc_micros(instant)
+
+
+def reference_occurrence(now: dt.datetime, target_time: dt.time) -> dt.datetime:
+    """Scan the days for the first existing occurrence after `now`."""
+    tzinfo = target_time.tzinfo
+    day = now.astimezone(tzinfo).date() - dt.timedelta(days=1)
+    while True:
+        target = dt.datetime.combine(day, target_time)
+        exists = target.astimezone(UTC).astimezone(tzinfo).replace(tzinfo=None) == (
+            target.replace(tzinfo=None)
+        )
+        if exists and target > now:
+            return target
+        day += dt.timedelta(days=1)
+
+
+def test_zone_cache_shared() -> None:
+    assert zone_cache(BERLIN) is zone_cache(BERLIN)
+    assert zone_cache(BERLIN).tzinfo is BERLIN
+    assert zone_cache(BERLIN) is not zone_cache(NEW_YORK)
+
+
+@pytest.mark.parametrize(
+    "tzinfo, transitions",
+    [
+        (BERLIN, [dt.date(2024, 3, 31), dt.date(2024, 10, 27)]),
+        (NEW_YORK, [dt.date(2024, 3, 10), dt.date(2024, 11, 3)]),
+        (SANTIAGO, [dt.date(2024, 4, 6), dt.date(2024, 9, 8)]),
+    ],
+)
+def test_regular(tzinfo: dt.tzinfo, transitions: list[dt.date]) -> None:
+    zone = zone_cache(tzinfo)
+    day = dt.date(2024, 1, 1)
+    while day.year == 2024:
+        assert zone.regular(day.toordinal()) == (day not in transitions)
+        day += dt.timedelta(days=1)
+
+
+@pytest.mark.parametrize("tzinfo", ZONES)
+def test_local_and_utc(tzinfo: dt.tzinfo) -> None:
+    rng = random.Random(3)
+    zone = zone_cache(tzinfo)
+    start = utc_micros(dt.datetime(2023, 1, 1, tzinfo=UTC))
+    for _ in range(3000):
+        # whole quarter hours hit the transitions, the others anything in between
+        utc = start + rng.randrange(2 * 365 * 96) * 900_000_000
+        if rng.random() < 0.5:
+            utc += rng.randrange(900_000_000)
+        instant = dt.datetime(1970, 1, 1, tzinfo=UTC) + dt.timedelta(microseconds=utc)
+        assert zone.local(utc) == wall_micros(instant.astimezone(tzinfo))
+
+        local = zone.local(utc)
+        ordinal, micros = divmod(local, MICROS_PER_DAY)
+        ordinal += EPOCH_ORDINAL
+        assert zone.utc(ordinal, micros) == reference_utc(tzinfo, ordinal, micros)
+
+
+@pytest.mark.parametrize(
+    "now, target_time, expected",
+    [
+        # the gap skips the occurrence of the day
+        (
+            dt.datetime(2024, 3, 30, 12, tzinfo=BERLIN),
+            dt.time(2, 30, tzinfo=BERLIN),
+            dt.datetime(2024, 4, 1, 0, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 3, 9, 12, tzinfo=NEW_YORK),
+            dt.time(2, 30, tzinfo=NEW_YORK),
+            dt.datetime(2024, 3, 11, 6, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 9, 7, 12, tzinfo=SANTIAGO),
+            dt.time(0, 30, tzinfo=SANTIAGO),
+            dt.datetime(2024, 9, 9, 3, 30, tzinfo=UTC),
+        ),
+        # the fold occurs once at the first instant
+        (
+            dt.datetime(2024, 10, 26, 12, tzinfo=BERLIN),
+            dt.time(2, 30, tzinfo=BERLIN),
+            dt.datetime(2024, 10, 27, 0, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 10, 27, 1, 10, tzinfo=UTC),
+            dt.time(2, 30, tzinfo=BERLIN),
+            dt.datetime(2024, 10, 28, 1, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 11, 2, 12, tzinfo=NEW_YORK),
+            dt.time(1, 30, tzinfo=NEW_YORK),
+            dt.datetime(2024, 11, 3, 5, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 11, 3, 6, 10, tzinfo=UTC),
+            dt.time(1, 30, tzinfo=NEW_YORK),
+            dt.datetime(2024, 11, 4, 6, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 4, 6, 12, tzinfo=SANTIAGO),
+            dt.time(23, 30, tzinfo=SANTIAGO),
+            dt.datetime(2024, 4, 7, 2, 30, tzinfo=UTC),
+        ),
+        (
+            dt.datetime(2024, 4, 7, 3, 10, tzinfo=UTC),
+            dt.time(23, 30, tzinfo=SANTIAGO),
+            dt.datetime(2024, 4, 8, 3, 30, tzinfo=UTC),
+        ),
+    ],
+)
+def test_next_zoned_occurrence(
+    now: dt.datetime, target_time: dt.time, expected: dt.datetime
+) -> None:
+    occurrence = next_zoned_occurrence(now, target_time)
+    # aware datetimes within a fold never equal those of other timezones
+    assert occurrence.astimezone(UTC) == expected
+    assert occurrence.tzinfo is target_time.tzinfo
+    assert occurrence.astimezone(UTC) == reference_occurrence(now, target_time).astimezone(UTC)
+
+
+@pytest.mark.parametrize("tzinfo", ZONES)
+def test_next_zoned_occurrence_random(tzinfo: dt.tzinfo) -> None:
+    rng = random.Random(11)
+    start = dt.datetime(2023, 1, 1, tzinfo=UTC)
+    for _ in range(2000):
+        now = start + dt.timedelta(minutes=rng.randrange(2 * 365 * 1440))
+        target_time = dt.time(rng.randrange(24), rng.choice((0, 15, 30, 45)), tzinfo=tzinfo)
+        occurrence = next_zoned_occurrence(now, target_time)
+        expected = reference_occurrence(now, target_time)
+        assert occurrence == expected
+        assert occurrence.utcoffset() == expected.utcoffset()
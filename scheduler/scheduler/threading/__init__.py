@@ -0,0 +1,25 @@
+"""
+Implementation of a `threading` compatible in-process scheduler.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from scheduler.base.definition import Backpressure, Priority
+from scheduler.base.openmetrics import MetricsServer, render_openmetrics
+from scheduler.base.sqlite_store import SQLiteJobStore
+from scheduler.base.stats import ExecutionStats
+from scheduler.base.timing_wheel import TimingWheel
+from scheduler.error import SchedulerError
+from scheduler.threading.scheduler import Scheduler
+
+__all__ = [
+    "Backpressure",
+    "ExecutionStats",
+    "MetricsServer",
+    "Priority",
+    "render_openmetrics",
+    "Scheduler",
+    "SchedulerError",
+    "SQLiteJobStore",
+    "TimingWheel",
+]
@@ -0,0 +1,184 @@
+"""
+Implementation of job for the `threading` scheduler.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+from logging import Logger
+from typing import Any, Callable, Optional
+
+from scheduler.base.definition import JobType, Misfire
+from scheduler.base.job import BaseJob, JobState
+from scheduler.base.timingtype import TimingJobUnion
+
+
+class Job(BaseJob[Callable[..., None]]):
+    r"""
+    |Job| class bundling time and callback function methods.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Indicator which defines which calculations has to be used.
+    timing : TimingJobUnion
+        Desired execution time(s).
+    handle : Callable[..., None]
+        Handle to a callback function.
+    args : tuple[Any]
+        Positional argument payload for the function handle within a |Job|.
+    kwargs : Optional[dict[str, Any]]
+        Keyword arguments payload for the function handle within a |Job|.
+    max_attempts : Optional[int]
+        Number of times the |Job| will be executed where ``0 <=> inf``.
+        A |Job| with no free attempt will be deleted.
+    tags : Optional[set[str]]
+        The tags of the |Job|.
+    delay : Optional[bool]
+        If ``True`` wait with the execution for the next scheduled time.
+    start : Optional[datetime.datetime]
+        Set the reference `datetime.datetime` stamp the
+        |Job| will be scheduled against. Default value is
+        `datetime.datetime.now()`.
+    stop : Optional[datetime.datetime]
+        Define a point in time after which a |Job| will be stopped
+        and deleted.
+    skip_missing : Optional[bool]
+        If ``True`` a |Job| will only schedule it's newest planned
+        execution and drop older ones.
+    alias : Optional[str]
+        Overwrites the function handle name in the string representation.
+        Identifies the |Job| within its |Scheduler|, has to be unique.
+    tzinfo : Optional[datetime.tzinfo]
+        Set the timezone of the |Scheduler| the |Job|
+        is scheduled in.
+    misfire : Optional[Misfire]
+        Catch up policy for executions missed beyond the grace window,
+        ``None`` uses the policy of the |Scheduler|.
+    misfire_grace : Optional[datetime.timedelta]
+        Delay after which an execution counts as missed,
+        ``None`` uses the grace window of the |Scheduler|.
+    weight : float
+        Weight of the |Job| in the priority of due executions, see `Priority`.
+    jitter : Optional[datetime.timedelta]
+        Shift all executions by the same offset within the window, the offset
+        is derived from the alias or else from the callback function and its
+        arguments. ``None`` disables the shift, the scheduling methods of a
+        |Scheduler| default to its `spread`.
+    validate : bool
+        If ``False`` the `timing` is trusted and not validated.
+    """
+
+    __slots__ = ("__lock",)
+
+    __lock: threading.RLock
+
+    def __init__(
+        self,
+        job_type: JobType,
+        timing: TimingJobUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[set[str]] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        alias: Optional[str] = None,
+        tzinfo: Optional[dt.tzinfo] = None,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+        validate: bool = True,
+    ):
+        super().__init__(
+            job_type,
+            timing,
+            handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            alias=alias,
+            tzinfo=tzinfo,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+            validate=validate,
+        )
+        self.__lock = threading.RLock()
+
+    def _exec(self, logger: Logger) -> bool:
+        """Execute the callback function, return ``False`` if it raised an exception."""
+        # the lock is not held while the callback runs, a reschedule of the
+        # running job must not wait for it
+        success = True
+        try:
+            self._BaseJob__handle(*self._BaseJob__args, **self._BaseJob__kwargs)  # type: ignore
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unhandled exception in `%r`!", self)
+            success = False
+        with self.__lock:
+            if not success:
+                self._BaseJob__failed_attempts += 1  # type: ignore
+            self._BaseJob__attempts += 1  # type: ignore
+            self._BaseJob__publish()  # type: ignore
+        return success
+
+    def _count_attempt(self, logger: Logger, err: Optional[BaseException] = None) -> None:
+        """Account for an execution of the callback function outside of `_exec`."""
+        with self.__lock:
+            if err is not None:
+                logger.error("Unhandled exception in `%r`!", self, exc_info=err)
+                self._BaseJob__failed_attempts += 1  # type: ignore
+            self._BaseJob__attempts += 1  # type: ignore
+            self._BaseJob__publish()  # type: ignore
+
+    def _calc_next_exec(
+        self, ref_dt: dt.datetime, skip_missing: Optional[bool] = None, executed: bool = True
+    ) -> int:
+        with self.__lock:
+            return super()._calc_next_exec(ref_dt, skip_missing, executed)
+
+    def _skip_to(self, ref_dt: dt.datetime) -> int:
+        with self.__lock:
+            return super()._skip_to(ref_dt)
+
+    def _reschedule(self, timing: TimingJobUnion, start: Optional[dt.datetime] = None) -> None:
+        with self.__lock:
+            super()._reschedule(timing, start)
+
+    def _state(self) -> JobState:
+        with self.__lock:
+            return super()._state()
+
+    @classmethod
+    def _restored(cls, definition: dict[str, Any], state: JobState) -> Job:
+        job = super()._restored(definition, state)
+        job.__lock = threading.RLock()
+        return job
+
+    def __repr__(self) -> str:
+        with self.__lock:
+            return "scheduler.Job({})".format(", ".join(self._repr()))
+
+    def __str__(self) -> str:
+        with self.__lock:
+            return super().__str__()
+
+    @property
+    def has_attempts_remaining(self) -> bool:
+        with self.__lock:
+            return super().has_attempts_remaining
@@ -0,0 +1,1346 @@
+"""
+Implementation of a `threading` compatible in-process scheduler.
+
+Author: Jendrik A. Potyka, Fabian A. Preiss
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+import os
+import pickle
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from logging import Logger
+from typing import Any, Callable, Optional, Union, cast
+
+from scheduler.base.definition import JOB_TYPE_MAPPING, Backpressure, JobType, Misfire, Priority
+from scheduler.base.job_queue import BaseJobQueue, JobQueue
+from scheduler.base.job_store import BaseJobStore
+from scheduler.base.job_util import sane_once_timing_type
+from scheduler.base.misfire import CatchUpLimiter, calc_next_exec, is_misfired, resolve_misfire
+from scheduler.base.priority import PriorityFunction, job_priority, priority_function, rank_jobs
+from scheduler.base.scheduler import BaseScheduler, create_job_instance
+from scheduler.base.snapshot import paused_gc, read_snapshot, write_snapshot
+from scheduler.base.stats import ExecutionHook, ExecutionStats, merged_stats, timedelta_ns
+from scheduler.base.tag_index import TagIndex
+from scheduler.base.timingtype import (
+    TimingBusinessDayUnion,
+    TimingCronUnion,
+    TimingCyclic,
+    TimingDailyUnion,
+    TimingJobUnion,
+    TimingMonthlyUnion,
+    TimingOnceUnion,
+    TimingUnion,
+    TimingWeeklyUnion,
+)
+from scheduler.error import SchedulerError
+from scheduler.message import (
+    ALIAS_DUPLICATE_ERROR_MSG,
+    ALIAS_UNKNOWN_ERROR_MSG,
+    DELETE_ERROR_MSG,
+    EXECUTOR_ERROR_MSG,
+    PICKLE_ERROR_MSG,
+    TZ_ERROR_MSG,
+)
+from scheduler.threading.job import Job
+
+
+class Scheduler(BaseScheduler[Job, Callable[..., None]]):
+    r"""
+    Implementation of a scheduler for callback functions.
+
+    The |Job|\ s are kept in a |JobQueue| ordered by their next execution, such
+    that a call of `exec_jobs` only touches the |Job|\ s which are due.
+
+    With `n_threads` greater than zero the due |Job|\ s are handed to a
+    `concurrent.futures.ThreadPoolExecutor` and `exec_jobs` returns without
+    waiting for their completion. A |Job| is never executed concurrently with
+    itself, it is rescheduled as soon as its execution finished.
+
+    With `n_processes` greater than zero the callback functions are executed in a
+    `concurrent.futures.ProcessPoolExecutor` instead, which lets CPU bound |Job|\ s
+    bypass the GIL. The callback function and its arguments have to be picklable.
+
+    Parameters
+    ----------
+    tzinfo : datetime.tzinfo
+        Set the timezone of the |Scheduler|.
+    jobs : Optional[Iterable[Job]]
+        Initial set of |Job|\ s.
+    n_threads : int
+        Number of worker threads, ``0`` executes the |Job|\ s in the thread
+        calling `exec_jobs`.
+    n_processes : int
+        Number of worker processes, can't be combined with `n_threads`.
+    max_in_flight : int
+        Maximum number of concurrently executing |Job|\ s, ``0`` defaults
+        to the number of workers.
+    backpressure : Backpressure
+        Handling of due |Job|\ s while `max_in_flight` |Job|\ s are executing.
+    priority : Optional[Union[Priority, PriorityFunction]]
+        Order of the due |Job|\ s by a function of their lateness in seconds and
+        their weight, highest first. ``None`` keeps the order by datetime.
+    max_exec : int
+        Maximum number of |Job|\ s executed by a call of `exec_jobs`, ``0`` <=> inf.
+        Further due |Job|\ s stay due.
+    drop_priority : float
+        Due |Job|\ s exceeding `max_exec` or `max_in_flight` with a lower priority
+        are skipped to their next execution, ``0`` drops nothing.
+    spread : Optional[datetime.timedelta]
+        Default `jitter` of the scheduled |Job|\ s with a time of day or |Weekday|
+        timing. Their executions on the same boundary are staggered deterministically
+        across the window while every |Job| keeps its period.
+    misfire : Misfire
+        Default catch up policy for executions missed beyond the grace window.
+    misfire_grace : Optional[datetime.timedelta]
+        Default delay after which an execution counts as missed, ``None``
+        disables the catch up handling.
+    catch_up_rate : float
+        Maximum number of missed executions run per second, ``0`` <=> inf.
+        Further missed executions stay due.
+    catch_up_burst : int
+        Maximum number of missed executions run at once, ``0`` defaults to
+        one second worth of `catch_up_rate`.
+    validate : bool
+        If ``False`` the timings of new |Job|\ s are trusted and not validated.
+    job_queue : Optional[BaseJobQueue]
+        Empty container for the pending |Job|\ s, defaults to a |JobQueue|.
+        A `TimingWheel` inserts and deletes in O(1) for many short timeouts.
+    job_store : Optional[BaseJobStore]
+        Persistent storage every change of a |Job| is written to, e.g. a
+        `SQLiteJobStore`. The stored |Job|\ s are restored after a restart.
+    store_horizon : datetime.timedelta
+        Stored |Job|\ s are only loaded once they are due within the horizon.
+    instrument : bool
+        If ``True`` the scheduling lag, duration and outcome of every execution
+        are recorded, see `stats` and `Job.stats`.
+    execution_hook : Optional[ExecutionHook]
+        Called as ``execution_hook(job, lag, duration, success)`` after every
+        execution with lag and duration in nanoseconds, implies `instrument`.
+    logger : Optional[logging.Logger]
+        A custom Logger instance.
+
+    Notes
+    -----
+    With a `job_store` the |Job|\ s not loaded yet are neither returned by
+    `get_jobs` nor deleted by `delete_jobs` with tags.
+
+    The lag of an execution in a worker is measured when it is handed to the
+    executor, its duration until its completion. The `execution_hook` is
+    called with the lock of the |Scheduler| held and should return quickly.
+    """
+
+    def __init__(
+        self,
+        *,
+        tzinfo: Optional[dt.tzinfo] = None,
+        jobs: Optional[Iterable[Job]] = None,
+        n_threads: int = 0,
+        n_processes: int = 0,
+        max_in_flight: int = 0,
+        backpressure: Backpressure = Backpressure.QUEUE,
+        priority: Optional[Union[Priority, PriorityFunction]] = None,
+        max_exec: int = 0,
+        drop_priority: float = 0,
+        spread: Optional[dt.timedelta] = None,
+        misfire: Misfire = Misfire.ALL,
+        misfire_grace: Optional[dt.timedelta] = None,
+        catch_up_rate: float = 0,
+        catch_up_burst: int = 0,
+        validate: bool = True,
+        job_queue: Optional[BaseJobQueue[Job]] = None,
+        job_store: Optional[BaseJobStore[Job]] = None,
+        store_horizon: dt.timedelta = dt.timedelta(minutes=1),
+        instrument: bool = False,
+        execution_hook: Optional[ExecutionHook] = None,
+        logger: Optional[Logger] = None,
+    ):
+        super().__init__(logger=logger)
+        self.__tzinfo = tzinfo
+        self.__instrumented = instrument or execution_hook is not None
+        self.__execution_hook = execution_hook
+        self.__retired = ExecutionStats()
+        self.__jobs_lock = threading.RLock()
+        self.__jobs: BaseJobQueue[Job] = JobQueue() if job_queue is None else job_queue
+        self.__tags: TagIndex[Job] = TagIndex()
+        self.__aliases: dict[str, Job] = {}
+        self.__executing: set[Job] = set()
+        self.__rescheduled: set[Job] = set()
+        self.__in_flight: dict[Job, Optional[Future[Any]]] = {}
+        self.__executor: Optional[Executor] = None
+        if n_threads > 0 and n_processes > 0:
+            raise SchedulerError(EXECUTOR_ERROR_MSG)
+        if n_threads > 0:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=n_threads, thread_name_prefix="scheduler"
+            )
+        elif n_processes > 0:
+            self.__executor = ProcessPoolExecutor(max_workers=n_processes)
+        self.__use_processes = n_processes > 0
+        self.__max_in_flight = max_in_flight or n_threads or n_processes
+        self.__backpressure = backpressure
+        self.__priority = None if priority is None else priority_function(priority)
+        self.__max_exec = max_exec
+        self.__drop_priority = drop_priority
+        self.__spread = spread
+        self.__misfire = misfire
+        self.__misfire_grace = misfire_grace
+        self.__catch_up = CatchUpLimiter(catch_up_rate, catch_up_burst)
+        self.__validate = validate
+        self.__store = job_store
+        self.__store_horizon = store_horizon
+        self.__next_load: Optional[dt.datetime] = None
+        self.__load_stored(dt.datetime.now(tz=self.__tzinfo))
+        if jobs:
+            self.add_jobs(jobs)
+
+    def __repr__(self) -> str:
+        with self.__jobs_lock:
+            return "scheduler.Scheduler({0}, jobs={{{1}}})".format(
+                f"tzinfo={self.__tzinfo!r}",
+                ", ".join([repr(job) for job in sorted(self.__jobs)]),
+            )
+
+    def exec_jobs(self, force_exec_all: bool = False) -> int:
+        r"""
+        Execute scheduled `Job`\ s.
+
+        By default executes the |Job|\ s that are overdue.
+
+        |Job|\ s are executed in order of their pending execution
+        datetime or of their priority, the next execution of every
+        executed |Job| is calculated afterwards.
+
+        Parameters
+        ----------
+        force_exec_all : bool
+            Ignore the both - the status of the |Job| timers
+            as well as the execution limit of the |Scheduler|
+
+        Returns
+        -------
+        int
+            Number of executed |Job|\ s.
+        """
+        ref_dt = dt.datetime.now(tz=self.__tzinfo)
+        ref_ns = time.perf_counter_ns()
+        misfired: set[Job] = set()
+        with self.__jobs_lock:
+            self.__load_stored(ref_dt)
+            # jobs still executing in a concurrent call stay queued without an executor
+            if force_exec_all:
+                jobs = sorted(job for job in self.__jobs if job not in self.__executing)
+            else:
+                due_jobs = rank_jobs(
+                    [job for job in self.__jobs.due(ref_dt) if job not in self.__executing],
+                    ref_dt,
+                    self.__priority,
+                )
+                jobs, surplus = self.__admit_jobs(due_jobs, ref_dt, misfired)
+                for job in surplus:
+                    if self.__is_expendable(job, ref_dt):
+                        self.__skip(job, ref_dt, "execution limit reached")
+            if self.__executor is not None:
+                n_submitted = self.__submit_jobs(jobs, ref_dt, ref_ns, force_exec_all, misfired)
+                self.__flush_store()
+                return n_submitted
+            self.__executing.update(jobs)
+
+        if self.__instrumented:
+            self.__exec_instrumented(jobs, ref_dt, ref_ns)
+        else:
+            for job in jobs:
+                job._exec(logger=self._logger)  # pylint: disable=protected-access
+
+        with self.__jobs_lock:
+            self.__executing.difference_update(jobs)
+            for job in jobs:
+                # the job might have been deleted or rescheduled during its execution
+                if job in self.__jobs:
+                    if not self.__consume_reschedule(job):
+                        self.__calc_next_exec(job, ref_dt, job in misfired)
+                    self.__requeue(job)
+                elif self.__instrumented and job.stats is not None:
+                    # the statistics of a job deleted while executing are retired now
+                    self.__retired.merge(job.stats)
+            self.__flush_store()
+        return len(jobs)
+
+    def __exec_instrumented(self, jobs: list[Job], ref_dt: dt.datetime, ref_ns: int) -> None:
+        r"""
+        Execute the |Job|\ s and record their lag and duration measured with the monotonic clock.
+
+        The |Job|\ s are executing, their statistics are recorded without the lock.
+        """
+        logger, hook = self._logger, self.__execution_hook
+        for job in jobs:
+            planned = job.datetime
+            begin = time.perf_counter_ns()
+            success = job._exec(logger=logger)  # pylint: disable=protected-access
+            duration = time.perf_counter_ns() - begin
+            lag = timedelta_ns(ref_dt - planned) + begin - ref_ns
+            job._record(lag, duration, success)  # pylint: disable=protected-access
+            if hook is not None:
+                self.__call_hook(job, lag, duration, success)
+
+    def __record(self, job: Job, lag: int, duration: int, success: bool) -> None:
+        """Count an execution of the |Job| and pass it to the execution hook."""
+        job._record(lag, duration, success)  # pylint: disable=protected-access
+        if job not in self.__jobs and job not in self.__in_flight:
+            # deleted during its execution, its statistics are already retired
+            self.__retired.record(lag, duration, success)
+        if self.__execution_hook is not None:
+            self.__call_hook(job, lag, duration, success)
+
+    def __call_hook(self, job: Job, lag: int, duration: int, success: bool) -> None:
+        """Pass an execution to the execution hook, log its exceptions."""
+        try:
+            cast(ExecutionHook, self.__execution_hook)(job, lag, duration, success)
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception("Unhandled exception in the execution hook of `%r`!", job)
+
+    def __admit_jobs(
+        self, jobs: list[Job], ref_dt: dt.datetime, misfired: set[Job]
+    ) -> tuple[list[Job], list[Job]]:
+        r"""
+        Filter missed executions exceeding the catch up rate, collect the admitted ones.
+
+        Returns
+        -------
+        tuple[list[Job], list[Job]]
+            The admitted |Job|\ s and the ones exceeding `max_exec`.
+        """
+        admitted: list[Job] = []
+        for idx, job in enumerate(jobs):
+            if self.__max_exec and len(admitted) == self.__max_exec:
+                return admitted, jobs[idx:]
+            _, misfire_grace = resolve_misfire(job, self.__misfire, self.__misfire_grace)
+            if is_misfired(job, ref_dt, misfire_grace):
+                if not self.__catch_up.acquire():
+                    continue
+                misfired.add(job)
+            admitted.append(job)
+        return admitted, []
+
+    def __is_expendable(self, job: Job, ref_dt: dt.datetime) -> bool:
+        """Check if the priority of a due |Job| is below the drop priority."""
+        if not self.__drop_priority:
+            return False
+        # without a priority policy the weight is the priority
+        function = priority_function(self.__priority)
+        return job_priority(job, ref_dt, function) < self.__drop_priority
+
+    def __skip(self, job: Job, ref_dt: dt.datetime, reason: str) -> None:
+        """Drop the due execution of a queued |Job| and schedule its next one in future."""
+        self._logger.debug("Skipped execution of `%r`, %s.", job, reason)
+        job._calc_next_exec(  # pylint: disable=protected-access
+            ref_dt, skip_missing=True, executed=False
+        )
+        self.__requeue(job)
+
+    def __calc_next_exec(self, job: Job, ref_dt: dt.datetime, misfired: bool) -> None:
+        misfire, _ = resolve_misfire(job, self.__misfire, self.__misfire_grace)
+        calc_next_exec(job, ref_dt, misfire, misfired)
+
+    def __requeue(self, job: Job) -> None:
+        """Reposition a queued |Job| or remove it if no attempts are left."""
+        if job.has_attempts_remaining:
+            self.__jobs.update(job)
+            if self.__store is not None:
+                self.__store.update(job)
+        else:
+            self.__jobs.remove(job)
+            self.__unregister(job)
+
+    def __consume_reschedule(self, job: Job) -> bool:
+        """Check if the |Job| was rescheduled during its execution and reset the mark."""
+        if job in self.__rescheduled:
+            self.__rescheduled.discard(job)
+            return True
+        return False
+
+    def __check_aliases(self, jobs: list[Job]) -> None:
+        r"""Raise if an alias of the |Job|\ s is already in use."""
+        seen: set[str] = set()
+        for job in jobs:
+            if job.alias is None:
+                continue
+            if job.alias in seen or self.__aliases.get(job.alias, job) is not job:
+                raise SchedulerError(ALIAS_DUPLICATE_ERROR_MSG.format(job.alias))
+            seen.add(job.alias)
+
+    def __register(self, job: Job) -> None:
+        """Add the |Job| to the tag and alias indices."""
+        self.__tags.add(job)
+        if job.alias is not None:
+            self.__aliases[job.alias] = job
+
+    def __unregister(self, job: Job) -> None:
+        """Remove the |Job| from the tag and alias indices."""
+        self.__tags.discard(job)
+        # an executing job is retired once its execution is recorded
+        if job.stats is not None and job not in self.__executing:
+            self.__retired.merge(job.stats)
+        if job.alias is not None and self.__aliases.get(job.alias) is job:
+            del self.__aliases[job.alias]
+        self.__rescheduled.discard(job)
+        if self.__store is not None:
+            self.__store.remove(job)
+
+    def __load_stored(self, ref_dt: dt.datetime) -> None:
+        r"""Move the stored |Job|\ s due within the horizon to the |JobQueue|."""
+        if self.__store is None or (self.__next_load is not None and ref_dt < self.__next_load):
+            return
+        self.__next_load = ref_dt + self.__store_horizon / 2
+        jobs = []
+        with self.__jobs_lock:
+            for job in self.__store.load(ref_dt + self.__store_horizon, Job):
+                if job._tzinfo != self.__tzinfo:
+                    raise SchedulerError(TZ_ERROR_MSG)
+                if job.alias is not None and job.alias in self.__aliases:
+                    self._logger.warning("Dropped stored `%r`, its alias is in use.", job)
+                    self.__store.remove(job)
+                elif not job.has_attempts_remaining:
+                    self.__store.remove(job)
+                else:
+                    jobs.append(job)
+            self.__jobs.extend(jobs)
+            for job in jobs:
+                self.__register(job)
+
+    def __flush_store(self) -> None:
+        """Persist the buffered writes of the job store if they are due."""
+        if self.__store is not None:
+            self.__store.flush(force=False)
+
+    def __submit_jobs(
+        self,
+        jobs: list[Job],
+        ref_dt: dt.datetime,
+        ref_ns: int,
+        force_exec_all: bool,
+        misfired: set[Job],
+    ) -> int:
+        r"""Hand the |Job|\ s to the executor, apply the backpressure policy if saturated."""
+        n_submitted = 0
+        for job in jobs:
+            if not force_exec_all and len(self.__in_flight) >= self.__max_in_flight:
+                if self.__backpressure is Backpressure.SKIP or self.__is_expendable(job, ref_dt):
+                    self.__skip(job, ref_dt, "no worker available")
+                continue
+            self.__jobs.remove(job)
+            self.__in_flight[job] = None
+            lag, begin = 0, None
+            if self.__instrumented:
+                begin = time.perf_counter_ns()
+                lag = timedelta_ns(ref_dt - job.datetime) + begin - ref_ns
+            executor = cast(Executor, self.__executor)
+            if self.__use_processes:
+                future = executor.submit(job.handle, *job.args, **job.kwargs)
+            else:
+                future = executor.submit(
+                    job._exec, logger=self._logger  # pylint: disable=protected-access
+                )
+            self.__in_flight[job] = future
+            future.add_done_callback(
+                partial(self.__finalize, job, ref_dt, job in misfired, lag, begin)
+            )
+            n_submitted += 1
+        return n_submitted
+
+    def __finalize(
+        self,
+        job: Job,
+        ref_dt: dt.datetime,
+        misfired: bool,
+        lag: int,
+        begin: Optional[int],
+        future: Future[Any],
+    ) -> None:
+        """Reschedule a |Job| after its execution in a worker finished."""
+        if self.__use_processes:
+            err = future.exception()
+            job._count_attempt(self._logger, err)  # pylint: disable=protected-access
+            success = err is None
+        else:
+            success = not future.cancelled() and bool(future.result())
+        with self.__jobs_lock:
+            if begin is not None:
+                self.__record(job, lag, time.perf_counter_ns() - begin, success)
+            # the job might have been deleted during its execution
+            if job not in self.__in_flight:
+                return
+            del self.__in_flight[job]
+            if self.__consume_reschedule(job):
+                pass
+            elif self.__backpressure is Backpressure.COALESCE:
+                job._calc_next_exec(  # pylint: disable=protected-access
+                    dt.datetime.now(tz=self.__tzinfo), skip_missing=True
+                )
+            else:
+                self.__calc_next_exec(job, ref_dt, misfired)
+            if job.has_attempts_remaining:
+                self.__jobs.push(job)
+                if self.__store is not None:
+                    self.__store.update(job)
+            else:
+                self.__unregister(job)
+
+    def __check_picklable(self, job: Job) -> None:
+        """Raise if the |Job| can't be sent to a worker process."""
+        if not self.__use_processes:
+            return
+        try:
+            pickle.dumps((job.handle, job.args, job.kwargs))
+        except Exception as err:  # pylint: disable=broad-except
+            raise SchedulerError(PICKLE_ERROR_MSG) from err
+
+    def shutdown(self, wait: bool = True) -> None:
+        r"""
+        Release the worker threads or processes of the |Scheduler|.
+
+        The buffered writes of the job store are persisted afterwards.
+
+        Parameters
+        ----------
+        wait : bool
+            Block until all executing |Job|\ s finished.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=wait)
+        if self.__store is not None:
+            self.__store.flush()
+
+    def get_jobs(
+        self,
+        tags: Optional[set[str]] = None,
+        any_tag: bool = False,
+    ) -> set[Job]:
+        r"""
+        Get a set of |Job|\ s from the |Scheduler| by tags.
+
+        If no tags or an empty set of tags are given defaults to returning
+        all |Job|\ s.
+
+        Parameters
+        ----------
+        tags : set[str]
+            Tags to filter scheduled |Job|\ s.
+            If no tags are given all |Job|\ s are returned.
+        any_tag : bool
+            False: To match a |Job| all tags have to match.
+            True: To match a |Job| at least one tag has to match.
+
+        Returns
+        -------
+        set[Job]
+            Currently scheduled |Job|\ s.
+        """
+        with self.__jobs_lock:
+            if not tags:
+                return self.jobs
+            return self.__tags.select(tags, any_tag)
+
+    def delete_job(self, job: Job) -> None:
+        """
+        Delete a |Job| from the |Scheduler|.
+
+        Parameters
+        ----------
+        job : Job
+            |Job| instance to delete.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if the |Job| of the argument is not scheduled.
+        """
+        with self.__jobs_lock:
+            if job in self.__in_flight:
+                del self.__in_flight[job]
+            else:
+                try:
+                    self.__jobs.remove(job)
+                except KeyError:
+                    raise SchedulerError(DELETE_ERROR_MSG) from None
+            self.__unregister(job)
+
+    def delete_jobs(
+        self,
+        tags: Optional[set[str]] = None,
+        any_tag: bool = False,
+    ) -> int:
+        r"""
+        Delete a set of |Job|\ s from the |Scheduler| by tags.
+
+        If no tags or an empty set of tags are given defaults to the deletion
+        of all |Job|\ s.
+
+        Parameters
+        ----------
+        tags : Optional[set[str]]
+            Set of tags to identify target |Job|\ s.
+        any_tag : bool
+            False: To delete a |Job| all tags have to match.
+            True: To delete a |Job| at least one tag has to match.
+
+        Returns
+        -------
+        int
+            Number of deleted |Job|\ s.
+        """
+        with self.__jobs_lock:
+            if not tags:
+                n_jobs = len(self.__jobs) + len(self.__in_flight)
+                for job in self.jobs:
+                    if job.stats is not None:
+                        self.__retired.merge(job.stats)
+                self.__jobs.clear()
+                self.__in_flight.clear()
+                self.__tags.clear()
+                self.__aliases.clear()
+                self.__rescheduled.clear()
+                if self.__store is not None:
+                    self.__store.clear()
+                return n_jobs
+
+            to_delete = self.__tags.select(tags, any_tag)
+            for job in to_delete:
+                self.delete_job(job)
+            return len(to_delete)
+
+    def stats(self, tags: Optional[set[str]] = None, any_tag: bool = False) -> ExecutionStats:
+        r"""
+        Get the statistics of the instrumented executions.
+
+        Without tags all executions since the creation of the |Scheduler| are
+        included, also the ones of deleted |Job|\ s. The statistics are merged
+        from the |Job|\ s on demand, which keeps the recording of an execution
+        cheap, a |Job| deleted and added again is counted twice.
+
+        Parameters
+        ----------
+        tags : Optional[set[str]]
+            Only include the scheduled |Job|\ s matching the tags.
+        any_tag : bool
+            False: To match a |Job| all tags have to match.
+            True: To match a |Job| at least one tag has to match.
+
+        Returns
+        -------
+        ExecutionStats
+            Independent copy of the scheduling lag, duration and outcome counts.
+        """
+        with self.__jobs_lock:
+            if not tags:
+                jobs = self.jobs
+                return merged_stats(itertools.chain([self.__retired], (job.stats for job in jobs)))
+            return merged_stats(job.stats for job in self.__tags.select(tags, any_tag))
+
+    def get_job(self, alias: str) -> Optional[Job]:
+        """
+        Get a |Job| by its alias.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |Job|.
+
+        Returns
+        -------
+        Optional[Job]
+            The scheduled |Job| with the alias or ``None``.
+        """
+        with self.__jobs_lock:
+            return self.__aliases.get(alias)
+
+    def delete_job_by_alias(self, alias: str) -> Job:
+        """
+        Delete a |Job| from the |Scheduler| by its alias.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |Job|.
+
+        Returns
+        -------
+        Job
+            The deleted |Job|.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if no |Job| with the alias is scheduled.
+        """
+        with self.__jobs_lock:
+            job = self.__aliases.get(alias)
+            if job is None:
+                raise SchedulerError(ALIAS_UNKNOWN_ERROR_MSG.format(alias))
+            self.delete_job(job)
+            return job
+
+    def reschedule(
+        self,
+        alias: str,
+        timing: TimingUnion,
+        *,
+        start: Optional[dt.datetime] = None,
+    ) -> Job:
+        """
+        Replace the timing of a scheduled |Job| in place.
+
+        The |Job| keeps its identity, attempts and settings, only its position
+        in the |JobQueue| is updated. A |Job| rescheduled during its execution
+        continues with the new timing afterwards.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of the |Job|.
+        timing : TimingUnion
+            New execution time(s) matching the |JobType| of the |Job|.
+        start : Optional[datetime.datetime]
+            Reference `datetime.datetime` of the new timing, defaults to now.
+
+        Returns
+        -------
+        Job
+            The rescheduled |Job|.
+
+        Raises
+        ------
+        SchedulerError
+            Raises if no |Job| with the alias is scheduled or the timing is invalid.
+        """
+        if not isinstance(timing, list):
+            timing = [timing]
+        with self.__jobs_lock:
+            job = self.__aliases.get(alias)
+            if job is None:
+                raise SchedulerError(ALIAS_UNKNOWN_ERROR_MSG.format(alias))
+            job._reschedule(cast(TimingJobUnion, timing), start)  # pylint: disable=protected-access
+            if self.__store is not None:
+                self.__store.add(job)
+            if job in self.__in_flight or job in self.__executing:
+                # keep the new pending execution once the running one finished
+                self.__rescheduled.add(job)
+            elif job.has_attempts_remaining:
+                self.__jobs.update(job)
+            else:
+                self.__jobs.remove(job)
+                self.__unregister(job)
+            return job
+
+    def cyclic(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingCyclic,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a cyclic |Job|.
+
+        Use a `datetime.timedelta` object as the `timing` argument
+        to define the cycle duration.
+        """
+        return self.__schedule(
+            job_type=JobType.CYCLIC,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def minutely(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a minutely |Job|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument, only the seconds are taken into account.
+        """
+        return self.__schedule(
+            job_type=JobType.MINUTELY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def hourly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule an hourly |Job|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument, only the minutes and seconds are taken
+        into account.
+        """
+        return self.__schedule(
+            job_type=JobType.HOURLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def daily(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingDailyUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a daily |Job|.
+
+        Use a `datetime.time` object or a `list` of `datetime.time` objects
+        as the `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.DAILY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def weekly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingWeeklyUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a weekly |Job|.
+
+        Use a |Weekday| object or a `list` of |Weekday| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.WEEKLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def cron(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingCronUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a |Job| by cron expressions.
+
+        Use a |Cron| object or a `list` of |Cron| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.CRON,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def monthly(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingMonthlyUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a monthly |Job|.
+
+        Use a |Monthly| object or a `list` of |Monthly| objects as the
+        `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.MONTHLY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def business_day(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingBusinessDayUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        max_attempts: int = 0,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        delay: bool = True,
+        start: Optional[dt.datetime] = None,
+        stop: Optional[dt.datetime] = None,
+        skip_missing: bool = False,
+        misfire: Optional[Misfire] = None,
+        misfire_grace: Optional[dt.timedelta] = None,
+        weight: float = 1.0,
+        jitter: Optional[dt.timedelta] = None,
+    ) -> Job:
+        r"""
+        Schedule a |Job| on business days.
+
+        Use a |BusinessDay| object or a `list` of |BusinessDay| objects
+        as the `timing` argument.
+        """
+        return self.__schedule(
+            job_type=JobType.BUSINESS_DAY,
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=max_attempts,
+            tags=tags,
+            alias=alias,
+            delay=delay,
+            start=start,
+            stop=stop,
+            skip_missing=skip_missing,
+            misfire=misfire,
+            misfire_grace=misfire_grace,
+            weight=weight,
+            jitter=jitter,
+        )
+
+    def once(  # pylint: disable=arguments-differ
+        self,
+        timing: TimingOnceUnion,
+        handle: Callable[..., None],
+        *,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+        tags: Optional[Iterable[str]] = None,
+        alias: Optional[str] = None,
+        weight: float = 1.0,
+    ) -> Job:
+        r"""
+        Schedule a oneshot |Job|.
+
+        Use a `datetime.datetime` object for an absolute point in time,
+        a `datetime.timedelta` object relative to now or a `datetime.time`,
+        |Weekday|, |Cron|, |Monthly| or |BusinessDay| object for the next
+        matching occurrence.
+        """
+        sane_once_timing_type(timing)
+
+        if isinstance(timing, dt.datetime):
+            return self.__schedule(
+                job_type=JobType.CYCLIC,
+                timing=dt.timedelta(),
+                handle=handle,
+                args=args,
+                kwargs=kwargs,
+                max_attempts=1,
+                tags=tags,
+                alias=alias,
+                delay=False,
+                start=timing,
+                weight=weight,
+                jitter=dt.timedelta(),
+            )
+        return self.__schedule(
+            job_type=JOB_TYPE_MAPPING[type(timing)],
+            timing=timing,
+            handle=handle,
+            args=args,
+            kwargs=kwargs,
+            max_attempts=1,
+            tags=tags,
+            alias=alias,
+            weight=weight,
+            jitter=dt.timedelta(),
+        )
+
+    def add_jobs(self, jobs: Iterable[Job]) -> None:
+        r"""
+        Add already created |Job|\ s to the |Scheduler|.
+
+        All |Job|\ s are checked before the first one is added, the |JobQueue|
+        is rebuilt once instead of inserting every |Job| separately.
+
+        Parameters
+        ----------
+        jobs : Iterable[Job]
+            |Job|\ s with the timezone of the |Scheduler|.
+
+        Raises
+        ------
+        SchedulerError
+            If the timezone of a |Job| differs from the |Scheduler|, its
+            alias is already in use or it can't be stored. No |Job| is added then.
+        """
+        jobs = list(jobs)
+        for job in jobs:
+            if job._tzinfo != self.__tzinfo:
+                raise SchedulerError(TZ_ERROR_MSG)
+            self.__check_picklable(job)
+        jobs = [job for job in jobs if job.has_attempts_remaining]
+        with self.__jobs_lock:
+            self.__check_aliases(jobs)
+            if self.__store is not None:
+                self.__store.add_many(jobs)
+            self.__jobs.extend(jobs)
+            for job in jobs:
+                self.__register(job)
+
+    def schedule_many(self, specs: Iterable[dict[str, Any]]) -> list[Job]:
+        r"""
+        Schedule many |Job|\ s at once.
+
+        Parameters
+        ----------
+        specs : Iterable[dict[str, Any]]
+            Keyword arguments of a |Job| for every |Job| to schedule, e.g.
+            ``{"job_type": JobType.DAILY, "timing": dt.time(hour=6), "handle": foo}``.
+            A single `timing` is wrapped in a list, the timezone of the
+            |Scheduler| is added. Without a `start` all timers are calculated
+            against the same reference time.
+
+        Returns
+        -------
+        list[Job]
+            The created |Job|\ s in the order of `specs`.
+        """
+        start = dt.datetime.now(self.__tzinfo)
+        jobs = [self.__create_job(**{"start": start, **spec}) for spec in specs]
+        self.add_jobs(jobs)
+        return jobs
+
+    def __create_job(self, *, tags: Optional[Iterable[str]] = None, **kwargs: Any) -> Job:
+        """Encapsulate the |Job| and add the |Scheduler|'s timezone and spread."""
+        if kwargs.get("jitter") is None and kwargs["job_type"] != JobType.CYCLIC:
+            kwargs["jitter"] = self.__spread
+        return create_job_instance(
+            Job,
+            tzinfo=self.__tzinfo,
+            tags=set(tags) if tags else None,
+            validate=self.__validate,
+            **kwargs,
+        )
+
+    def __schedule(self, **kwargs: Any) -> Job:
+        """Create a |Job| and add it to the |JobQueue|."""
+        job = self.__create_job(**kwargs)
+        self.__check_picklable(job)
+        if job.has_attempts_remaining:
+            with self.__jobs_lock:
+                self.__check_aliases([job])
+                if self.__store is not None:
+                    self.__store.add(job)
+                self.__jobs.push(job)
+                self.__register(job)
+        return job
+
+    def snapshot(self, path: Union[str, os.PathLike[str]]) -> int:
+        r"""
+        Write all |Job|\ s to a compact binary snapshot file.
+
+        Timing elements, tags and aliases are interned, handles are stored by
+        their import path. Use `restore` to create a |Scheduler| from the file.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of the snapshot file, an existing file is replaced.
+
+        Returns
+        -------
+        int
+            Number of written |Job|\ s.
+
+        Raises
+        ------
+        SchedulerError
+            If a handle is not importable by its qualified name, the args or
+            kwargs are not picklable or a timezone is not supported.
+        """
+        with self.__jobs_lock:
+            jobs = self.jobs
+        return write_snapshot(path, jobs)
+
+    @classmethod
+    def restore(cls, path: Union[str, os.PathLike[str]], **kwargs: Any) -> Scheduler:
+        r"""
+        Create a |Scheduler| with the |Job|\ s of a snapshot file.
+
+        The file is memory mapped, the |Job|\ s continue with their
+        persisted attempts and pending executions without being validated
+        and calculated again.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of a file written by `snapshot`.
+        **kwargs
+            Keyword arguments of the |Scheduler|, the timezone has to match
+            the snapshot.
+
+        Returns
+        -------
+        Scheduler
+            The restored |Scheduler|.
+
+        Raises
+        ------
+        SchedulerError
+            If the file is not a compatible snapshot, a handle can't be imported
+            or the timezones differ.
+        """
+        scheduler = cls(**kwargs)
+        with paused_gc():
+            scheduler.add_jobs(read_snapshot(path, Job))
+        return scheduler
+
+    @property
+    def jobs(self) -> set[Job]:
+        r"""
+        Get the set of all |Job|\ s.
+
+        Returns
+        -------
+        set[Job]
+            Currently scheduled |Job|\ s.
+        """
+        with self.__jobs_lock:
+            return self.__jobs.jobs | set(self.__in_flight)
+
+    @property
+    def next_job(self) -> Optional[Job]:
+        """
+        Get the |Job| with the earliest pending execution.
+
+        Returns
+        -------
+        Optional[Job]
+            Next due |Job|, ``None`` if no |Job| is scheduled.
+        """
+        with self.__jobs_lock:
+            return self.__jobs.peek()
+
+    @property
+    def due_jobs(self) -> list[Job]:
+        r"""
+        Get the |Job|\ s which are due but not executing yet.
+
+        Returns
+        -------
+        list[Job]
+            Overdue |Job|\ s ordered by their pending execution.
+        """
+        with self.__jobs_lock:
+            due_jobs = self.__jobs.due(dt.datetime.now(tz=self.__tzinfo))
+            return [job for job in due_jobs if job not in self.__executing]
+
+    @property
+    def executing_jobs(self) -> set[Job]:
+        r"""
+        Get the |Job|\ s which are currently executing.
+
+        Returns
+        -------
+        set[Job]
+            |Job|\ s executing in the calling thread of `exec_jobs` or in a worker.
+        """
+        with self.__jobs_lock:
+            return self.__executing | set(self.__in_flight)
+
+    @property
+    def max_in_flight(self) -> int:
+        r"""
+        Get the maximum number of |Job|\ s concurrently executing in workers.
+
+        Returns
+        -------
+        int
+            Limit of the executor, ``0`` without worker threads or processes.
+        """
+        return self.__max_in_flight if self.__executor is not None else 0
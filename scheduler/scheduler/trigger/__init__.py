@@ -12,6 +12,21 @@ from scheduler.trigger.core import (
     Wednesday,
     weekday,
 )
+from scheduler.trigger.calendar import BusinessDay, HolidayCalendar, Monthly
+from scheduler.trigger.cron import Cron
 
-__all__ = ["Friday", "Monday", "Saturday", "Sunday", "Thursday", "Tuesday", "Wednesday", "weekday"]
+__all__ = [
+    "BusinessDay",
+    "Cron",
+    "Friday",
+    "HolidayCalendar",
+    "Monday",
+    "Monthly",
+    "Saturday",
+    "Sunday",
+    "Thursday",
+    "Tuesday",
+    "Wednesday",
+    "weekday",
+]
 
@@ -0,0 +1,462 @@
+"""
+Monthly and business day triggers on a holiday calendar.
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime as dt
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from scheduler.error import SchedulerError
+from scheduler.message import (
+    CALENDAR_ERROR_MSG,
+    HOLIDAY_FILE_ERROR_MSG,
+    MONTHLY_DAY_ERROR_MSG,
+    WEEKEND_ERROR_MSG,
+)
+
+# number of matching days of the first table of a trigger, doubled on every refill
+_MIN_BATCH = 4
+_MAX_BATCH = 64
+# months scanned for a matching day before a trigger is considered to never match
+_MAX_MONTHS = 12 * 400
+
+
+def _month_bounds(year: int, month: int) -> tuple[int, int]:
+    """Get the ordinals of the first day of a month and of the following month."""
+    first = dt.date(year, month, 1).toordinal()
+    if month == 12:
+        return first, dt.date(year + 1, 1, 1).toordinal()
+    return first, dt.date(year, month + 1, 1).toordinal()
+
+
+class HolidayCalendar:
+    r"""
+    Business days of the week without holidays.
+
+    Parameters
+    ----------
+    holidays : Iterable[datetime.date]
+        Days without business.
+    weekend : Iterable[int]
+        Weekdays without business (0: Monday, ... 6: Sunday).
+
+    Raises
+    ------
+    SchedulerError
+        If the weekend contains an invalid or every weekday.
+    """
+
+    __slots__ = ("__holidays", "__weekend")
+
+    __holidays: frozenset[int]
+    __weekend: frozenset[int]
+
+    def __init__(self, holidays: Iterable[dt.date] = (), weekend: Iterable[int] = (5, 6)):
+        self.__holidays = frozenset(day.toordinal() for day in holidays)
+        self.__weekend = frozenset(weekend)
+        if not self.__weekend < frozenset(range(7)):
+            raise SchedulerError(WEEKEND_ERROR_MSG)
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, os.PathLike[str]], weekend: Iterable[int] = (5, 6)
+    ) -> HolidayCalendar:
+        """
+        Read the holidays of a local calendar file.
+
+        Every line holds a date in ISO format, optionally followed by the name
+        of the holiday. Empty lines and text after ``#`` are ignored::
+
+            # public holidays
+            2024-01-01 New Year's Day
+            2024-12-25 Christmas Day
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of the calendar file.
+        weekend : Iterable[int]
+            Weekdays without business (0: Monday, ... 6: Sunday).
+
+        Returns
+        -------
+        HolidayCalendar
+            The calendar of the file.
+
+        Raises
+        ------
+        SchedulerError
+            If a line does not start with a date.
+        """
+        holidays = []
+        with open(path, encoding="utf-8") as file:
+            for lineno, line in enumerate(file, start=1):
+                fields = line.split("#", 1)[0].split(maxsplit=1)
+                if not fields:
+                    continue
+                try:
+                    holidays.append(dt.date.fromisoformat(fields[0]))
+                except ValueError:
+                    raise SchedulerError(HOLIDAY_FILE_ERROR_MSG.format(path, lineno)) from None
+        return cls(holidays, weekend)
+
+    def __repr__(self) -> str:
+        return f"HolidayCalendar(holidays=<{len(self.__holidays)} days>, weekend={self.weekend})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HolidayCalendar):
+            return NotImplemented
+        return (self.__holidays, self.__weekend) == (other.__holidays, other.__weekend)
+
+    def __hash__(self) -> int:
+        return hash((self.__holidays, self.__weekend))
+
+    def __reduce__(self) -> tuple[type[HolidayCalendar], tuple[Any, ...]]:
+        return HolidayCalendar, (self.holidays, self.weekend)
+
+    @property
+    def holidays(self) -> tuple[dt.date, ...]:
+        """
+        Get the holidays.
+
+        Returns
+        -------
+        tuple[datetime.date, ...]
+            The ascending holidays.
+        """
+        return tuple(dt.date.fromordinal(ordinal) for ordinal in sorted(self.__holidays))
+
+    @property
+    def weekend(self) -> tuple[int, ...]:
+        """
+        Get the weekdays without business.
+
+        Returns
+        -------
+        tuple[int, ...]
+            The ascending weekdays (0: Monday, ... 6: Sunday).
+        """
+        return tuple(sorted(self.__weekend))
+
+    def is_business_day(self, day: dt.date) -> bool:
+        """
+        Check if `day` is neither a holiday nor on the weekend.
+
+        Parameters
+        ----------
+        day : datetime.date
+            The day to check.
+
+        Returns
+        -------
+        bool
+            ``True`` for a business day.
+        """
+        return day.weekday() not in self.__weekend and day.toordinal() not in self.__holidays
+
+    def _business_days(self, first: int, stop: int) -> list[int]:
+        """Get the ordinals of the business days within `[first, stop)`."""
+        weekend, holidays = self.__weekend, self.__holidays
+        # the ordinal 1 is a Monday
+        return [
+            ordinal
+            for ordinal in range(first, stop)
+            if (ordinal - 1) % 7 not in weekend and ordinal not in holidays
+        ]
+
+    def _max_business_days(self) -> int:
+        """Get the largest number of business days of a month ignoring the holidays."""
+        return max(
+            sum((first + day) % 7 not in self.__weekend for day in range(31)) for first in range(7)
+        )
+
+
+class CalendarTrigger(ABC):
+    r"""
+    Trigger at a time on the days matching calendar rules.
+
+    The matching days are kept in a sorted table that is refilled with a batch
+    of upcoming days once it is exhausted, the next matching day is looked up
+    by bisection. The calendar rules are thereby evaluated once per batch
+    instead of once per execution. The batches start small and grow with
+    every refill, such that short lived triggers stay cheap.
+
+    Parameters
+    ----------
+    time : datetime.time
+        Time on the clock at the matching days.
+    """
+
+    __slots__ = ("__time", "__table")
+
+    __time: dt.time
+    # first covered ordinal and the ascending ordinals of the matching days from it on,
+    # replaced as a whole to keep concurrent lookups consistent
+    __table: tuple[int, list[int]]
+
+    def __init__(self, time: dt.time) -> None:
+        self.__time = time
+        self.__table = (0, [])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CalendarTrigger):
+            return NotImplemented
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+    @abstractmethod
+    def _key(self) -> tuple[Any, ...]:
+        """Get the parameters identifying the trigger."""
+
+    @abstractmethod
+    def _batch(self, ordinal: int, size: int) -> list[int]:
+        """Get the ascending ordinals of at least `size` matching days from `ordinal` on."""
+
+    @property
+    def time(self) -> dt.time:
+        """
+        Get the time on the clock at the matching days.
+
+        Returns
+        -------
+        datetime.time
+            Time of the trigger.
+        """
+        return self.__time
+
+    @property
+    def tzinfo(self) -> Optional[dt.tzinfo]:
+        """
+        Get the timezone of the time.
+
+        Returns
+        -------
+        Optional[datetime.tzinfo]
+            Timezone of the trigger.
+        """
+        return self.__time.tzinfo
+
+    def __lookup(self, ordinal: int) -> tuple[list[int], int]:
+        """Get the table covering `ordinal` and the index of the next matching day."""
+        first, days = self.__table
+        idx = bisect.bisect_left(days, ordinal)
+        if ordinal < first or idx == len(days):
+            size = min(max(2 * len(days), _MIN_BATCH), _MAX_BATCH)
+            days, idx = self._batch(ordinal, size), 0
+            self.__table = (ordinal, days)
+        return days, idx
+
+    def next_day(self, day: dt.date) -> dt.date:
+        """
+        Get the first matching day not earlier than `day`.
+
+        Parameters
+        ----------
+        day : datetime.date
+            Inclusive lower bound.
+
+        Returns
+        -------
+        datetime.date
+            The matching day.
+        """
+        return dt.date.fromordinal(self.next_ordinal(day.toordinal()))
+
+    def next_ordinal(self, ordinal: int) -> int:
+        """
+        Get the first matching day not earlier than `ordinal` as ordinal.
+
+        Parameters
+        ----------
+        ordinal : int
+            Inclusive lower bound, see `datetime.date.toordinal`.
+
+        Returns
+        -------
+        int
+            Ordinal of the matching day.
+        """
+        days, idx = self.__lookup(ordinal)
+        return days[idx]
+
+    def count(self, start: dt.date, end: dt.date) -> int:
+        """
+        Count the matching days within `[start, end)`.
+
+        Parameters
+        ----------
+        start : datetime.date
+            Inclusive lower bound.
+        end : datetime.date
+            Exclusive upper bound.
+
+        Returns
+        -------
+        int
+            Number of matching days.
+        """
+        ordinal, stop = start.toordinal(), end.toordinal()
+        total = 0
+        while ordinal < stop:
+            days, idx = self.__lookup(ordinal)
+            end_idx = bisect.bisect_left(days, stop, idx)
+            total += end_idx - idx
+            if end_idx < len(days):
+                break
+            ordinal = days[-1] + 1
+        return total
+
+
+class Monthly(CalendarTrigger):
+    r"""
+    Trigger at a time on the nth day of every month.
+
+    Parameters
+    ----------
+    day : int
+        Position of the day within the month, ``1`` is the first and ``-1`` the
+        last day. Months without such a day are skipped.
+    time : datetime.time
+        Time on the clock at the day.
+    calendar : Optional[HolidayCalendar]
+        Count the business days of the calendar only, e.g. ``Monthly(-1,
+        calendar=HolidayCalendar())`` triggers on the last business day.
+
+    Raises
+    ------
+    SchedulerError
+        If no month has such a day.
+    """
+
+    __slots__ = ("__day", "__calendar")
+
+    __day: int
+    __calendar: Optional[HolidayCalendar]
+
+    def __init__(
+        self, day: int, time: dt.time = dt.time(), calendar: Optional[HolidayCalendar] = None
+    ):
+        # pylint: disable-next=protected-access
+        limit = 31 if calendar is None else calendar._max_business_days()
+        if not isinstance(day, int) or not 1 <= abs(day) <= limit:
+            raise SchedulerError(MONTHLY_DAY_ERROR_MSG.format(day))
+        super().__init__(time)
+        self.__day = day
+        self.__calendar = calendar
+
+    def __repr__(self) -> str:
+        return f"Monthly(day={self.__day}, time={self.time!r}, calendar={self.__calendar!r})"
+
+    def __reduce__(self) -> tuple[type[Monthly], tuple[Any, ...]]:
+        return Monthly, (self.__day, self.time, self.__calendar)
+
+    def _key(self) -> tuple[Any, ...]:
+        return (self.__day, self.time, self.tzinfo, self.__calendar)
+
+    @property
+    def day(self) -> int:
+        """
+        Get the position of the day within the month.
+
+        Returns
+        -------
+        int
+            Positive from the start, negative from the end of the month.
+        """
+        return self.__day
+
+    @property
+    def calendar(self) -> Optional[HolidayCalendar]:
+        """
+        Get the calendar of the business days.
+
+        Returns
+        -------
+        Optional[HolidayCalendar]
+            The calendar, ``None`` if every day of a month is counted.
+        """
+        return self.__calendar
+
+    def _batch(self, ordinal: int, size: int) -> list[int]:
+        start = dt.date.fromordinal(ordinal)
+        year, month = start.year, start.month
+        idx = self.__day - 1 if self.__day > 0 else self.__day
+        days: list[int] = []
+        n_months = 0
+        while len(days) < size:
+            first, stop = _month_bounds(year, month)
+            if self.__calendar is None:
+                candidates: Union[range, list[int]] = range(first, stop)
+            else:
+                candidates = self.__calendar._business_days(  # pylint: disable=protected-access
+                    first, stop
+                )
+            if -len(candidates) <= idx < len(candidates) and candidates[idx] >= ordinal:
+                days.append(candidates[idx])
+                n_months = 0
+            elif n_months > _MAX_MONTHS:
+                raise SchedulerError(CALENDAR_ERROR_MSG.format(self))
+            n_months += 1
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return days
+
+
+class BusinessDay(CalendarTrigger):
+    r"""
+    Trigger at a time on every business day of a |HolidayCalendar|.
+
+    Parameters
+    ----------
+    time : datetime.time
+        Time on the clock at the business days.
+    calendar : Optional[HolidayCalendar]
+        Calendar of the business days, defaults to Monday to Friday.
+    """
+
+    __slots__ = ("__calendar",)
+
+    __calendar: HolidayCalendar
+
+    def __init__(self, time: dt.time = dt.time(), calendar: Optional[HolidayCalendar] = None):
+        super().__init__(time)
+        self.__calendar = calendar if calendar is not None else HolidayCalendar()
+
+    def __repr__(self) -> str:
+        return f"BusinessDay(time={self.time!r}, calendar={self.__calendar!r})"
+
+    def __reduce__(self) -> tuple[type[BusinessDay], tuple[Any, ...]]:
+        return BusinessDay, (self.time, self.__calendar)
+
+    def _key(self) -> tuple[Any, ...]:
+        return (self.time, self.tzinfo, self.__calendar)
+
+    @property
+    def calendar(self) -> HolidayCalendar:
+        """
+        Get the calendar of the business days.
+
+        Returns
+        -------
+        HolidayCalendar
+            The calendar.
+        """
+        return self.__calendar
+
+    def _batch(self, ordinal: int, size: int) -> list[int]:
+        days: list[int] = []
+        while len(days) < size:
+            days.extend(
+                self.__calendar._business_days(  # pylint: disable=protected-access
+                    ordinal, ordinal + size
+                )
+            )
+            ordinal += size
+        return days
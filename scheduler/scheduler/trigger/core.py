@@ -18,6 +18,8 @@ class Weekday(ABC):
         Time on the clock at the specific |Weekday|.
     """
 
+    __slots__ = ("__value", "__time")
+
     __value: int
     __time: dt.time
 
@@ -60,6 +62,7 @@ class Weekday(ABC):
 
 class Monday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 0)
@@ -67,6 +70,7 @@ class Monday(Weekday):
 
 class Tuesday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 1)
@@ -74,6 +78,7 @@ class Tuesday(Weekday):
 
 class Wednesday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 2)
@@ -81,6 +86,7 @@ class Wednesday(Weekday):
 
 class Thursday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 3)
@@ -88,6 +94,7 @@ class Thursday(Weekday):
 
 class Friday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 4)
@@ -95,6 +102,7 @@ class Friday(Weekday):
 
 class Saturday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 5)
@@ -102,6 +110,7 @@ class Saturday(Weekday):
 
 class Sunday(Weekday):
     __doc__ = Weekday.__doc__
+    __slots__ = ()
 
     def __init__(self, time: dt.time = dt.time()) -> None:
         super().__init__(time, 6)
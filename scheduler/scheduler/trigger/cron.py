@@ -0,0 +1,377 @@
+"""
+Cron expressions compiled to bitmasks.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+from typing import Optional
+
+from scheduler.error import SchedulerError
+from scheduler.message import CRON_ERROR_MSG
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTH_NAMES = {
+    name: idx
+    for idx, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"),
+        start=1,
+    )
+}
+_WEEKDAY_NAMES = {
+    name: idx for idx, name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"))
+}
+# longest length of every month, February in a leap year
+_MAX_MONTH_LENGTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MINUTE = dt.timedelta(minutes=1)
+# the weekdays of the calendar repeat after 28 years
+_MAX_YEARS = 28
+
+
+def _next_bit(mask: int, pos: int) -> int:
+    """Get the position of the lowest set bit not lower than `pos`, ``-1`` if none."""
+    mask >>= pos
+    if not mask:
+        return -1
+    return pos + (mask & -mask).bit_length() - 1
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _month_length(year: int, month: int) -> int:
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    return _MAX_MONTH_LENGTH[month]
+
+
+def _parse_field(
+    field: str, low: int, high: int, names: Optional[dict[str, int]] = None
+) -> int:
+    """Compile a comma separated list of values, ranges and steps to a bitmask."""
+    mask = 0
+    for part in field.split(","):
+        value_range, _, step_str = part.partition("/")
+        step = int(step_str) if step_str else 1
+        if value_range == "*":
+            first, last = low, high
+        else:
+            first_str, dash, last_str = value_range.partition("-")
+            first = _parse_value(first_str, names)
+            # a single value with a step runs up to the highest value
+            last = _parse_value(last_str, names) if dash else (high if step_str else first)
+        if step < 1 or not low <= first <= last <= high:
+            raise ValueError(part)
+        for value in range(first, last + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+def _parse_value(value: str, names: Optional[dict[str, int]]) -> int:
+    if names is not None and value.upper() in names:
+        return names[value.upper()]
+    return int(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str) -> tuple[int, int, int, int, int, bool, bool]:
+    """Compile an expression to the masks of minutes, hours, days, months and weekdays."""
+    fields = _MACROS.get(expression.strip().lower(), expression).split()
+    if len(fields) != 5:
+        raise SchedulerError(CRON_ERROR_MSG.format(expression))
+    minute, hour, day, month, weekday = fields
+    try:
+        minutes = _parse_field(minute, 0, 59)
+        hours = _parse_field(hour, 0, 23)
+        days = _parse_field(day.replace("?", "*"), 1, 31)
+        months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        cron_weekdays = _parse_field(weekday.replace("?", "*"), 0, 7, _WEEKDAY_NAMES)
+    except ValueError:
+        raise SchedulerError(CRON_ERROR_MSG.format(expression)) from None
+    # cron counts from Sunday (0 or 7), `datetime` from Monday (0)
+    weekdays = 0
+    for value in range(8):
+        if cron_weekdays >> value & 1:
+            weekdays |= 1 << (value - 1) % 7
+    day_star, weekday_star = day.startswith(("*", "?")), weekday.startswith(("*", "?"))
+    if weekday_star and not any(
+        days & ((2 << _MAX_MONTH_LENGTH[month]) - 1)
+        for month in range(1, 13)
+        if months >> month & 1
+    ):
+        raise SchedulerError(CRON_ERROR_MSG.format(expression))
+    return minutes, hours, days, months, weekdays, day_star, weekday_star
+
+
+class Cron:
+    r"""
+    Trigger at the minutes matching a cron expression.
+
+    The expression consists of the five fields ``minute hour day month weekday``
+    with ``*``, lists, ranges, steps and the names of months and weekdays, or one
+    of the macros ``@yearly``, ``@monthly``, ``@weekly``, ``@daily`` and
+    ``@hourly``. If both the day and the weekday are restricted, a day matching
+    either of them matches, like in Vixie cron.
+
+    The expression is compiled once into bitmasks of the allowed minutes, hours,
+    days, months and weekdays. The next occurrence is found by scanning for the
+    next set bit month by month, day by day and hour by hour instead of
+    iterating every minute.
+
+    Parameters
+    ----------
+    expression : str
+        The cron expression, e.g. ``"*/5 9-17 * * MON-FRI"``.
+    tzinfo : Optional[datetime.tzinfo]
+        Timezone of the wall clock the expression refers to.
+
+    Raises
+    ------
+    SchedulerError
+        If the expression is invalid or never matches.
+    """
+
+    __slots__ = (
+        "__expression",
+        "__tzinfo",
+        "__minutes",
+        "__hours",
+        "__days",
+        "__months",
+        "__weekdays",
+        "__day_star",
+        "__weekday_star",
+        "__weekday_days",
+    )
+
+    __expression: str
+    __tzinfo: Optional[dt.tzinfo]
+    __minutes: int
+    __hours: int
+    __days: int
+    __months: int
+    __weekdays: int
+    __day_star: bool
+    __weekday_star: bool
+    __weekday_days: tuple[int, ...]
+
+    def __init__(self, expression: str, tzinfo: Optional[dt.tzinfo] = None) -> None:
+        self.__expression = " ".join(expression.split())
+        self.__tzinfo = tzinfo
+        (
+            self.__minutes,
+            self.__hours,
+            self.__days,
+            self.__months,
+            self.__weekdays,
+            self.__day_star,
+            self.__weekday_star,
+        ) = _compile(self.__expression)
+        # days of a month matching the weekdays for every weekday of the first day
+        self.__weekday_days = tuple(
+            sum(1 << day for day in range(1, 32) if self.__weekdays >> (first + day - 1) % 7 & 1)
+            for first in range(7)
+        )
+
+    def __repr__(self) -> str:
+        return f"Cron({self.__expression!r}, tzinfo={self.__tzinfo!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cron):
+            return NotImplemented
+        return self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return hash(self.__key())
+
+    def __key(self) -> tuple[object, ...]:
+        return (
+            self.__minutes,
+            self.__hours,
+            self.__days,
+            self.__months,
+            self.__weekdays,
+            self.__day_star,
+            self.__weekday_star,
+            self.__tzinfo,
+        )
+
+    def __reduce__(self) -> tuple[type[Cron], tuple[str, Optional[dt.tzinfo]]]:
+        return Cron, (self.__expression, self.__tzinfo)
+
+    @property
+    def expression(self) -> str:
+        """
+        Get the cron expression.
+
+        Returns
+        -------
+        str
+            The expression with normalized whitespace.
+        """
+        return self.__expression
+
+    @property
+    def tzinfo(self) -> Optional[dt.tzinfo]:
+        """
+        Get the timezone of the wall clock.
+
+        Returns
+        -------
+        Optional[datetime.tzinfo]
+            Timezone of the |Cron|.
+        """
+        return self.__tzinfo
+
+    @property
+    def interval(self) -> dt.timedelta:
+        """
+        Get a lower bound of the distance between two occurrences.
+
+        Returns
+        -------
+        datetime.timedelta
+            Shortest distance of two allowed minutes or hours, at most one day.
+        """
+        for mask, unit, size in ((self.__minutes, 1, 60), (self.__hours, 60, 24)):
+            values = [idx for idx in range(size) if mask >> idx & 1]
+            if len(values) > 1:
+                gaps = [high - low for low, high in zip(values, values[1:])]
+                gaps.append(size - values[-1] + values[0])
+                return min(gaps) * unit * _MINUTE
+        return dt.timedelta(days=1)
+
+    def __month_days(self, year: int, month: int) -> int:
+        """Get the mask of the matching days of a month."""
+        if self.__day_star:
+            days = self.__weekday_days[dt.date(year, month, 1).weekday()]
+        elif self.__weekday_star:
+            days = self.__days
+        else:
+            days = self.__days | self.__weekday_days[dt.date(year, month, 1).weekday()]
+        return days & ((2 << _month_length(year, month)) - 2)
+
+    def __localize(self, datetime: dt.datetime) -> tuple[dt.datetime, Optional[dt.tzinfo]]:
+        """Get the naive wall clock time of the |Cron| and its timezone."""
+        if datetime.tzinfo is None:
+            return datetime, None
+        tzinfo = self.__tzinfo if self.__tzinfo is not None else datetime.tzinfo
+        return datetime.astimezone(tzinfo).replace(tzinfo=None), tzinfo
+
+    def next_after(self, ref: dt.datetime) -> dt.datetime:
+        """
+        Get the first occurrence after `ref`.
+
+        Parameters
+        ----------
+        ref : datetime.datetime
+            Exclusive lower bound, an aware `datetime.datetime` is converted
+            to the timezone of the |Cron|.
+
+        Returns
+        -------
+        datetime.datetime
+            The occurrence, aware if `ref` is aware.
+
+        Raises
+        ------
+        SchedulerError
+            If there is no occurrence within the next 28 years.
+        """
+        local, tzinfo = self.__localize(ref)
+        year, month, day = local.year, local.month, local.day
+        hour, minute = local.hour, local.minute + 1
+        while year <= local.year + _MAX_YEARS:
+            found = _next_bit(self.__months, month)
+            if found < 0:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute = found, 1, 0, 0
+            found = _next_bit(self.__month_days(year, month), day)
+            if found < 0:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                continue
+            if found != day:
+                day, hour, minute = found, 0, 0
+            found = _next_bit(self.__hours, hour)
+            if found < 0:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if found != hour:
+                hour, minute = found, 0
+            found = _next_bit(self.__minutes, minute)
+            if found < 0:
+                hour, minute = hour + 1, 0
+                continue
+            return dt.datetime(year, month, day, hour, found, tzinfo=tzinfo)
+        raise SchedulerError(CRON_ERROR_MSG.format(self.__expression))
+
+    def count(self, start: dt.datetime, end: dt.datetime) -> int:
+        """
+        Count the occurrences within `[start, end)`.
+
+        Whole days are counted by the number of set bits of the masks, only the
+        first and the last day are counted hour by hour.
+
+        Parameters
+        ----------
+        start : datetime.datetime
+            Inclusive lower bound.
+        end : datetime.datetime
+            Exclusive upper bound.
+
+        Returns
+        -------
+        int
+            Number of occurrences.
+        """
+        start, _ = self.__localize(start)
+        end, _ = self.__localize(end)
+        # first minutes not earlier than the bounds
+        begin_minute = -((dt.datetime.min - start) // _MINUTE)
+        end_minute = -((dt.datetime.min - end) // _MINUTE)
+        if end_minute <= begin_minute:
+            return 0
+        start = dt.datetime.min + begin_minute * _MINUTE
+        end = dt.datetime.min + end_minute * _MINUTE
+        per_day = _popcount(self.__hours) * _popcount(self.__minutes)
+        total = 0
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            if self.__months >> month & 1:
+                days = self.__month_days(year, month)
+                if (year, month) == (start.year, start.month):
+                    days &= -(1 << start.day)
+                if (year, month) == (end.year, end.month):
+                    days &= (2 << end.day) - 1
+                for bound in (start, end):
+                    if (bound.year, bound.month) == (year, month) and days >> bound.day & 1:
+                        days &= ~(1 << bound.day)
+                        total += self.__count_day(bound.date(), start, end)
+                total += _popcount(days) * per_day
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return total
+
+    def __count_day(self, day: dt.date, start: dt.datetime, end: dt.datetime) -> int:
+        """Count the occurrences of a matching day within `[start, end)`."""
+        first = start.hour * 60 + start.minute if day == start.date() else 0
+        last = end.hour * 60 + end.minute if day == end.date() else 1440
+        total = 0
+        for hour in range(24):
+            if self.__hours >> hour & 1:
+                low, high = max(first - hour * 60, 0), min(last - hour * 60, 60)
+                if low < high:
+                    total += _popcount(self.__minutes & ((1 << high) - (1 << low)))
+        return total
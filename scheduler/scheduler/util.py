@@ -6,11 +6,16 @@ Collection of datetime and trigger related utility functions.
 from __future__ import annotations
 
 import datetime as dt
-from typing import Optional
+from collections.abc import Iterator
+from functools import partial
+from typing import Callable, Optional, Union, cast
 
 from scheduler.base.definition import JobType
+from scheduler.base.tz_cache import EPOCH_ORDINAL, MICROS_PER_DAY, utc_micros, zone_cache
 from scheduler.error import SchedulerError
+from scheduler.trigger.calendar import CalendarTrigger
 from scheduler.trigger.core import Weekday
+from scheduler.trigger.cron import Cron
 
 
 def days_to_weekday(wkdy_src: int, wkdy_dest: int) -> int:
@@ -77,12 +82,321 @@ def next_weekday_time_occurrence(
     return target + delta
 
 
+def next_calendar_occurrence(now: dt.datetime, trigger: CalendarTrigger) -> dt.datetime:
+    """
+    Get the first occurrence of a |CalendarTrigger| after `now`.
+
+    The matching days are looked up in the table of the `trigger`, `now` has to
+    be in the timezone of the `trigger` if aware.
+
+    Parameters
+    ----------
+    now : datetime.datetime
+        Exclusive lower bound.
+    trigger : CalendarTrigger
+        Trigger of the matching days and the time on the clock.
+
+    Returns
+    -------
+    datetime.datetime
+        The occurrence.
+    """
+    target_time = trigger.time
+    today = now.date()
+    day = trigger.next_day(today)
+    if day == today:
+        candidate = next_daily_occurrence(now, target_time)
+        if candidate.date() == today:
+            return candidate
+        day = trigger.next_day(today + dt.timedelta(days=1))
+
+    target = now.replace(
+        hour=target_time.hour,
+        minute=target_time.minute,
+        second=target_time.second,
+        microsecond=target_time.microsecond,
+    )
+    return target + (day - today)
+
+
+def count_calendar_occurrences(
+    trigger: CalendarTrigger, start: dt.datetime, end: dt.datetime
+) -> int:
+    """
+    Count the occurrences of a |CalendarTrigger| within `[start, end)`.
+
+    Parameters
+    ----------
+    trigger : CalendarTrigger
+        Trigger of the matching days and the time on the clock.
+    start : datetime.datetime
+        Inclusive lower bound.
+    end : datetime.datetime
+        Exclusive upper bound.
+
+    Returns
+    -------
+    int
+        Number of occurrences.
+    """
+    target_time = trigger.time
+
+    def first_day(bound: dt.datetime) -> dt.date:
+        """Get the first day whose occurrence is not earlier than `bound`."""
+        if bound.tzinfo and target_time.tzinfo:
+            bound = bound.astimezone(target_time.tzinfo)
+        target = bound.replace(
+            hour=target_time.hour,
+            minute=target_time.minute,
+            second=target_time.second,
+            microsecond=target_time.microsecond,
+        )
+        if target < bound:
+            return bound.date() + dt.timedelta(days=1)
+        return bound.date()
+
+    return trigger.count(first_day(start), first_day(end))
+
+
+def next_weekday_ordinal(weekday: int, ordinal: int) -> int:
+    """Get the first day of a weekday not earlier than `ordinal` as ordinal."""
+    # the ordinal 1 is a Monday
+    return ordinal + (weekday - ordinal + 1) % 7
+
+
+def next_zoned_occurrence(
+    now: dt.datetime,
+    target_time: dt.time,
+    next_day: Optional[Callable[[int], int]] = None,
+) -> dt.datetime:
+    """
+    Get the first occurrence of an aware `target_time` after `now`.
+
+    The |ZoneCache| of the timezone of `target_time` memoizes which days have
+    a transition. On the other days the wall clock times compare like the
+    instants, only on a day with a transition the occurrence is compared in
+    microseconds since the UTC epoch. A wall time repeated by a backward
+    transition occurs once at its first instant, a wall time skipped by a
+    forward transition does not occur on that day.
+
+    Parameters
+    ----------
+    now : datetime.datetime
+        Aware exclusive lower bound.
+    target_time : datetime.time
+        Aware time on the clock.
+    next_day : Optional[Callable[[int], int]]
+        Get the first allowed day not earlier than the given one, both as
+        ordinals, every day is allowed by default.
+
+    Returns
+    -------
+    datetime.datetime
+        The occurrence in the timezone of `target_time`.
+    """
+    tzinfo = cast(dt.tzinfo, target_time.tzinfo)
+    zone = zone_cache(tzinfo)
+    local = now if now.tzinfo is tzinfo else now.astimezone(tzinfo)
+    day = local.toordinal()
+    while True:
+        if next_day is not None:
+            day = next_day(day)
+        target = dt.datetime.combine(dt.date.fromordinal(day), target_time)
+        if zone.regular(day):
+            if target > local:
+                return target
+        else:
+            micros = (
+                (target_time.hour * 60 + target_time.minute) * 60 + target_time.second
+            ) * 1_000_000 + target_time.microsecond
+            instant = zone.utc(day, micros)
+            if instant is not None and instant > utc_micros(local):
+                return target
+        day += 1
+
+
+def next_timing_occurrence(
+    job_type: JobType,
+    timing: Union[dt.timedelta, dt.time, Weekday, Cron, CalendarTrigger],
+    ref: dt.datetime,
+) -> dt.datetime:
+    """
+    Get the first occurrence of a day-like, weekly, cron or calendar timing after `ref`.
+
+    Aware daily, weekly and calendar timings are calculated by `next_zoned_occurrence`.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Type of the timing.
+    timing : datetime.time | Weekday | Cron | CalendarTrigger
+        The timing, cyclic timings are not supported.
+    ref : datetime.datetime
+        Exclusive lower bound.
+
+    Returns
+    -------
+    datetime.datetime
+        The occurrence.
+    """
+    if job_type is JobType.CRON:
+        return cast(Cron, timing).next_after(ref)
+    if job_type is JobType.WEEKLY:
+        weekday = cast(Weekday, timing)
+        if weekday.time.tzinfo:
+            return next_zoned_occurrence(
+                ref, weekday.time, partial(next_weekday_ordinal, weekday.value)
+            )
+        return next_weekday_time_occurrence(ref, weekday, weekday.time)
+    if job_type in CALENDAR_JOB_TYPES:
+        trigger = cast(CalendarTrigger, timing)
+        if trigger.tzinfo:
+            return next_zoned_occurrence(ref, trigger.time, trigger.next_ordinal)
+        return next_calendar_occurrence(ref, trigger)
+
+    time = cast(dt.time, timing)
+    if job_type is JobType.DAILY and time.tzinfo:
+        return next_zoned_occurrence(ref, time)
+    if ref.tzinfo:
+        ref = ref.astimezone(time.tzinfo)
+    return JOB_NEXT_DAYLIKE_MAPPING[job_type](ref, time)
+
+
 JOB_NEXT_DAYLIKE_MAPPING = {
     JobType.MINUTELY: next_minutely_occurrence,
     JobType.HOURLY: next_hourly_occurrence,
     JobType.DAILY: next_daily_occurrence,
 }
 
+# job types triggered by a |CalendarTrigger|
+CALENDAR_JOB_TYPES = (JobType.MONTHLY, JobType.BUSINESS_DAY)
+
+JOB_PERIOD_MAPPING = {
+    JobType.MINUTELY: dt.timedelta(minutes=1),
+    JobType.HOURLY: dt.timedelta(hours=1),
+    JobType.DAILY: dt.timedelta(days=1),
+    JobType.WEEKLY: dt.timedelta(days=7),
+}
+
+
+def skipped_occurrences(last: dt.datetime, ref: dt.datetime, period: dt.timedelta) -> int:
+    """
+    Count the occurrences of a period after `last` up to and including `ref`.
+
+    Parameters
+    ----------
+    last : datetime.datetime
+        Last handled occurrence.
+    ref : datetime.datetime
+        Reference up to which the occurrences are skipped.
+    period : datetime.timedelta
+        Distance between two occurrences.
+
+    Returns
+    -------
+    int
+        Number of skipped occurrences.
+    """
+    if not period or ref <= last:
+        return 0
+    return (ref - last) // period
+
+
+def first_occurrence(
+    job_type: JobType,
+    timing: Union[dt.timedelta, dt.time, Weekday, Cron, CalendarTrigger],
+    next_exec: dt.datetime,
+    start: dt.datetime,
+) -> Optional[dt.datetime]:
+    """
+    Get the first execution of a timer not earlier than `start`.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Type of the timer.
+    timing : datetime.timedelta | datetime.time | Weekday | Cron | CalendarTrigger
+        Timing of the timer.
+    next_exec : datetime.datetime
+        Pending execution of the timer.
+    start : datetime.datetime
+        Inclusive lower bound.
+
+    Returns
+    -------
+    Optional[datetime.datetime]
+        First execution, ``None`` if a cyclic timer without period can't reach `start`.
+    """
+    if start <= next_exec:
+        return next_exec
+    if job_type is JobType.CYCLIC:
+        period = cast(dt.timedelta, timing)
+        if not period:
+            return None
+        # smallest multiple of the period reaching `start`
+        return next_exec - ((next_exec - start) // period) * period
+    return next_timing_occurrence(job_type, timing, start - dt.timedelta(microseconds=1))
+
+
+def timer_occurrences(
+    job_type: JobType,
+    timing: Union[dt.timedelta, dt.time, Weekday, Cron, CalendarTrigger],
+    next_exec: dt.datetime,
+    start: dt.datetime,
+    end: dt.datetime,
+) -> Iterator[dt.datetime]:
+    """
+    Lazily generate the executions of a timer within `[start, end)`.
+
+    The first execution not earlier than `start` is calculated directly from the
+    pending execution `next_exec`, the following ones by adding the period of
+    the `job_type` or by `next_timing_occurrence` for triggers and aware daily
+    and weekly timings.
+
+    Parameters
+    ----------
+    job_type : JobType
+        Type of the timer.
+    timing : datetime.timedelta | datetime.time | Weekday | Cron | CalendarTrigger
+        Timing of the timer.
+    next_exec : datetime.datetime
+        Pending execution of the timer, earlier executions are not generated.
+    start : datetime.datetime
+        Inclusive lower bound.
+    end : datetime.datetime
+        Exclusive upper bound.
+
+    Returns
+    -------
+    Iterator[datetime.datetime]
+        Ascending executions.
+    """
+    current = first_occurrence(job_type, timing, next_exec, start)
+    if current is None:
+        return
+    if (
+        job_type is JobType.CRON
+        or job_type in CALENDAR_JOB_TYPES
+        # the wall clock of a timezone is not periodic across its transitions
+        or (job_type in (JobType.DAILY, JobType.WEEKLY) and current.tzinfo)
+    ):
+        while current < end:
+            yield current
+            current = next_timing_occurrence(job_type, timing, current)
+        return
+    if job_type is JobType.CYCLIC:
+        period = cast(dt.timedelta, timing)
+    else:
+        period = JOB_PERIOD_MAPPING[job_type]
+    if not period:
+        if current < end:
+            yield current
+        return
+
+    while current < end:
+        yield current
+        current += period
+
 
 def are_times_unique(
     timelist: list[dt.time],